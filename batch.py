@@ -0,0 +1,79 @@
+# ========================== Imports & Config ==========================
+import os
+import json
+import argparse
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from cache import ParsedCache
+from engine import Experiment, Workspace
+
+# ========================== Batch Processing ==========================
+def process_experiment(folder_path, output_dir, use_cache=True):
+    cache = ParsedCache(os.path.dirname(folder_path)) if use_cache else None
+    experiment = Experiment(folder_path, cache=cache)
+    experiment.load()
+    experiment.analyze()
+
+    experiment_output = os.path.join(output_dir, experiment.name)
+    os.makedirs(experiment_output, exist_ok=True)
+
+    summary = experiment.summary()
+    with open(os.path.join(experiment_output, 'summary.json'), 'w') as summary_file:
+        json.dump(summary, summary_file, indent=2)
+
+    if experiment.has_heat_map():
+        y_positions_mm, temperature_profile = experiment.midline_profile()
+        np.savetxt(os.path.join(experiment_output, 'midline_profile.csv'),
+                   np.column_stack([y_positions_mm, temperature_profile]),
+                   delimiter=',', header='Fin_Height_mm,Temperature_C', comments='')
+
+    if experiment.has_alignment_data():
+        experiment.aligned_data().to_csv(os.path.join(experiment_output, 'tc_flir_alignment.csv'), index=False, float_format='%.6g')  # float32 columns, written without binary noise
+
+    if experiment.has_heat_map_sequence():
+        experiment.thermocouple_frame_series().to_csv(os.path.join(experiment_output, 'thermocouple_frame_series.csv'), index=False)
+
+    return summary
+
+def run_batch(root, output_dir, workers=None, use_cache=True):
+    workspace = Workspace(root, use_cache=use_cache)
+    folders = [os.path.join(root, folder) for folder in workspace.available_experiments()]
+    os.makedirs(output_dir, exist_ok=True)
+
+    summaries = []
+    failures = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(process_experiment, folder, output_dir, use_cache): folder for folder in folders}
+        for future in as_completed(futures):
+            folder = futures[future]
+            try:
+                summaries.append(future.result())
+                print(f"Processed {os.path.basename(folder)}")
+            except Exception as error:
+                failures[os.path.basename(folder)] = str(error)
+                print(f"Failed {os.path.basename(folder)}: {error}")
+
+    summaries.sort(key=lambda summary: summary['experiment'].lower())
+    with open(os.path.join(output_dir, 'batch_summary.json'), 'w') as summary_file:
+        json.dump({'root': root, 'experiments': summaries, 'failures': failures}, summary_file, indent=2)
+
+    return summaries, failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Process every experiment folder under a root directory without the GUI.')
+    parser.add_argument('root', help='Directory containing experiment folders')
+    parser.add_argument('-o', '--output', default='iris_results', help='Directory to write per-experiment results to')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='Parse every file from scratch without reading or writing the parsed-data cache')
+    parser.add_argument('--clear-cache', action='store_true', help="Empty the root's parsed-data cache before processing")
+    args = parser.parse_args(argv)
+
+    if args.clear_cache:
+        ParsedCache(args.root).clear()
+
+    summaries, failures = run_batch(args.root, args.output, args.workers, use_cache=not args.no_cache)
+    print(f"{len(summaries)} experiments processed, {len(failures)} failed. Results in {os.path.abspath(args.output)}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,317 @@
+# ========================== Imports & Config ==========================
+import os
+import sys
+import copy
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+import tracemalloc
+import statistics
+import matplotlib
+import numpy as np
+import pandas as pd
+import config
+import engine
+import plots
+import synthetic
+from cache import ParsedCache
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+RESULTS_VERSION = 1
+# Every Experiment.import_* method except the generic one, so new sources are timed automatically
+IMPORTS = sorted(name for name in dir(engine.Experiment) if name.startswith('import_') and name != 'import_source')
+SUITES = ('startup', 'imports', 'memory', 'analysis', 'render', 'edges')
+# Modules the GUI defers; any of them on the startup path means the window waits for it again
+HEAVY_MODULES = ('numpy', 'pandas', 'matplotlib')
+
+# ========================== Reference Implementations ==========================
+def plate_edge_detection_loop(heat_map):
+    # Original per-row / per-column implementation, kept to check and time the vectorized one
+    rows, cols = heat_map.shape
+    left_edge_locations = []
+    right_edge_locations = []
+    top_edge_locations = []
+    bottom_edge_locations = []
+
+    for y in range(rows):
+        gradients = np.gradient(heat_map.iloc[y, :].values)
+        left_edge_locations.append(np.argmax(gradients))
+        right_edge_locations.append(np.argmin(gradients))
+
+    left_edge = statistics.mode(left_edge_locations)
+    right_edge = statistics.mode(right_edge_locations)
+
+    for x in range(left_edge, right_edge):
+        column = heat_map.iloc[:, x].values
+        top_gradients = np.gradient(column[:config.EDGE_SENSITIVITY])
+        bottom_gradients = np.gradient(column[-config.EDGE_SENSITIVITY:])
+        top_edge_locations.append(np.argmax(top_gradients))
+        bottom_edge_locations.append(len(column) - config.EDGE_SENSITIVITY + np.argmin(bottom_gradients))
+
+    return left_edge, right_edge, statistics.mode(top_edge_locations), statistics.mode(bottom_edge_locations)
+
+# ========================== Timing Helpers ==========================
+def best_time(function, *args, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+def measure(function, repeat=3, setup=None):
+    # setup runs untimed before every repetition and its result is passed to function
+    timings = []
+    for _ in range(repeat):
+        args = (setup(),) if setup is not None else ()
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+    return {'best_s': min(timings), 'median_s': statistics.median(timings), 'runs': timings}
+
+def report(results, name, timing):
+    results[name] = timing
+    print(f"{name:<44} {timing['best_s'] * 1e3:10.2f} ms  (median {timing['median_s'] * 1e3:.2f})")
+
+# ========================== Workload ==========================
+def write_workload(folder, workload):
+    synthetic.write_experiment(folder, *workload['heat_map'], frames=workload['frames'],
+                               sensor_seconds=workload['sensor_seconds'], flir_rows=workload['flir_rows'],
+                               simulation_points=workload['simulation_points'])
+
+def loaded_experiment(folder):
+    experiment = engine.Experiment(folder)
+    experiment.load()
+    experiment.analyze()
+    return experiment
+
+# ========================== Benchmarks ==========================
+def bench_imports(folder, repeat, results):
+    # Straight from the text files, then from a warm parsed-data cache as the app normally runs
+    for name in IMPORTS:
+        report(results, f"import.{name[len('import_'):]}",
+               measure(lambda experiment: getattr(experiment, name)(), repeat, setup=lambda: engine.Experiment(folder)))
+
+    with tempfile.TemporaryDirectory() as cache_root:
+        cache = ParsedCache(cache_root, max_bytes=float('inf'))
+        engine.Experiment(folder, cache=cache).load()
+        for name in IMPORTS:
+            report(results, f"import_cached.{name[len('import_'):]}",
+                   measure(lambda experiment: getattr(experiment, name)(), repeat, setup=lambda: engine.Experiment(folder, cache=cache)))
+
+def bench_memory(folder, memory):
+    # Peak bytes allocated while parsing each log (tracemalloc sees numpy and pandas buffers
+    # and every Python string) and bytes still held by the parsed table afterwards
+    for name, source in (('sensors', engine.SENSORS), ('flir_chamfered', engine.CHAMFERED_FLIR), ('flir_filleted', engine.FILLETED_FLIR)):
+        file_path = engine.Experiment(folder).source_path(source)
+        tracemalloc.start()
+        data = engine.READERS[source](file_path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        memory[f"memory.{name}"] = {'rows': len(data), 'peak_bytes': peak, 'resident_bytes': engine.resident_nbytes(data),
+                                    'file_bytes': os.path.getsize(file_path)}
+        print(f"{f'memory.{name}':<44} peak {peak / 1e6:8.1f} MB  resident {engine.resident_nbytes(data) / 1e6:7.1f} MB"
+              f"  ({len(data)} rows, {os.path.getsize(file_path) / 1e6:.1f} MB file)")
+
+def bench_analysis(experiment, repeat, results):
+    frame = experiment.reference_frame()
+    edges = engine.plate_edge_detection(frame)
+    report(results, 'analysis.plate_edge_detection', measure(lambda: engine.plate_edge_detection(frame), repeat))
+    report(results, 'analysis.find_thermocouples', measure(lambda: engine.find_thermocouples(*edges), repeat))
+
+    def fresh_profile():
+        experiment.profile = None
+    report(results, 'analysis.midline_profile', measure(lambda _: experiment.midline_profile(), repeat, setup=fresh_profile))
+    report(results, 'analysis.align_sensors_flir',
+           measure(lambda: engine.align_sensors_flir(experiment.sensors_data, experiment.flir_chamfered_data, experiment.flir_filleted_data), repeat))
+    report(results, 'analysis.compare_to_simulation',
+           measure(lambda: engine.compare_to_simulation(*experiment.midline_profile(), experiment.simulation_data), repeat))
+
+def render(draw, *args, **kwargs):
+    # A bare Figure on an Agg canvas, the same way the batch and export paths render
+    fig = Figure(figsize=(10, 6), dpi=100)
+    canvas = FigureCanvasAgg(fig)
+    draw(fig, *args, **kwargs)
+    canvas.draw()
+    return canvas
+
+def bench_render(experiment, repeat, results, combined=50):
+    # Combined profiles are shallow copies under different names; they share the same arrays
+    copies = []
+    for index in range(combined):
+        duplicate = copy.copy(experiment)
+        duplicate.name = f"{experiment.name}_{index:03d}"
+        copies.append(duplicate)
+
+    report(results, 'render.heat_map', measure(lambda: render(plots.draw_heat_map, experiment), repeat))
+    report(results, 'render.linear_profile', measure(lambda: render(plots.draw_linear_profile, experiment), repeat))
+    report(results, f"render.combined_profiles[{combined}]", measure(lambda: render(plots.draw_combined_profiles, copies), repeat))
+    report(results, 'render.temporal', measure(lambda: render(plots.draw_temporal, experiment), repeat))
+
+def bench_edge_detection(sizes, repeat, results=None):
+    print(f"{'frame':>12} {'loop (ms)':>12} {'vectorized (ms)':>16} {'speedup':>9}  edges")
+    for rows, cols in sizes:
+        frame = synthetic.heat_map_frame(rows, cols)
+        loop_time, loop_edges = best_time(plate_edge_detection_loop, pd.DataFrame(frame), repeat=repeat)
+        vector_time, vector_edges = best_time(engine.plate_edge_detection, frame, repeat=repeat)
+        if tuple(loop_edges) != tuple(vector_edges):
+            raise AssertionError(f"Edge mismatch on {rows}x{cols}: {loop_edges} != {vector_edges}")
+        print(f"{f'{rows}x{cols}':>12} {loop_time * 1e3:12.1f} {vector_time * 1e3:16.1f} {loop_time / vector_time:8.1f}x  {vector_edges}")
+        if results is not None:
+            results[f"edges.loop[{rows}x{cols}]"] = {'best_s': loop_time}
+            results[f"edges.vectorized[{rows}x{cols}]"] = {'best_s': vector_time}
+
+def import_times(code):
+    # A fresh interpreter under -X importtime: (depth, module, cumulative seconds) in import order
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stderr
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.append(((len(name) - len(name.lstrip()) - 1) // 2, name.strip(), int(cumulative) / 1e6))
+    return modules
+
+def bench_startup(repeat, results, top=8):
+    # Importing gui is what stands between launch and the window; the deferred modules are
+    # imported on a loader thread afterwards, so they are timed separately
+    gui_times, deferred_times, runs = [], [], []
+    for _ in range(repeat):
+        modules = import_times('import gui; gui.import_deferred_modules()')
+        gui_index = next(index for index, (depth, name, _) in enumerate(modules) if depth == 0 and name == 'gui')
+        gui_times.append(modules[gui_index][2])
+        deferred_times.append(sum(seconds for depth, _, seconds in modules[gui_index + 1:] if depth == 0))
+        runs.append(modules[:gui_index + 1])
+    report(results, 'startup.import_gui', {'best_s': min(gui_times), 'median_s': statistics.median(gui_times), 'runs': gui_times})
+    report(results, 'startup.deferred_modules',
+           {'best_s': min(deferred_times), 'median_s': statistics.median(deferred_times), 'runs': deferred_times})
+
+    # Breakdown of the fastest run: what gui itself imports, slowest first
+    fastest = runs[gui_times.index(min(gui_times))]
+    children = sorted(((name, seconds) for depth, name, seconds in fastest if depth == 1), key=lambda child: -child[1])
+    for name, seconds in children[:top]:
+        print(f"{'  ' + name:<44} {seconds * 1e3:10.2f} ms")
+    loaded = {name.split('.')[0] for _, name, _ in fastest}
+    for module in HEAVY_MODULES:
+        if module in loaded:
+            print(f"Warning: {module} is imported before the window can appear")
+
+# ========================== Baselines ==========================
+def environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'matplotlib': matplotlib.__version__,
+    }
+
+def compare(results, baseline, tolerance):
+    # Best times against the baseline's; anything more than tolerance slower is a regression
+    rows = []
+    for name in sorted(set(results) | set(baseline)):
+        if name not in baseline:
+            rows.append((name, None, results[name]['best_s'], None, 'new'))
+        elif name not in results:
+            rows.append((name, baseline[name]['best_s'], None, None, 'missing'))
+        else:
+            before, after = baseline[name]['best_s'], results[name]['best_s']
+            ratio = after / before if before > 0 else float('inf')
+            status = 'slower' if ratio > 1 + tolerance else 'faster' if ratio < 1 / (1 + tolerance) else 'same'
+            rows.append((name, before, after, ratio, status))
+    return rows
+
+def print_comparison(rows):
+    print(f"\n{'benchmark':<44} {'baseline (ms)':>14} {'current (ms)':>13} {'ratio':>7}")
+    for name, before, after, ratio, status in rows:
+        before_text = f"{before * 1e3:14.2f}" if before is not None else f"{'-':>14}"
+        after_text = f"{after * 1e3:13.2f}" if after is not None else f"{'-':>13}"
+        ratio_text = f"{ratio:6.2f}x" if ratio is not None else f"{'-':>7}"
+        print(f"{name:<44} {before_text} {after_text} {ratio_text}  {status}")
+
+# ========================== Command Line ==========================
+def parse_size(text):
+    rows, cols = text.lower().split('x')
+    return int(rows), int(cols)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time IRIS import, analysis and rendering on synthetic data.')
+    parser.add_argument('--suites', nargs='+', choices=SUITES, default=list(SUITES), help='Benchmark groups to run')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions per measurement (best is compared)')
+    parser.add_argument('--heat-map', type=parse_size, default=(480, 640), help='Heat map size as ROWSxCOLS')
+    parser.add_argument('--frames', type=int, default=10, help='Frames in the heat map sequence')
+    parser.add_argument('--sensor-seconds', type=int, default=3600, help='Seconds of 1 Hz Arduino data')
+    parser.add_argument('--flir-rows', type=int, default=108000, help='Rows in each FLIR log (30 Hz)')
+    parser.add_argument('--simulation-points', type=int, default=2000, help='Rows in the IRIS-ANSYS export')
+    parser.add_argument('--combined', type=int, default=50, help='Profiles drawn in the combined plot')
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=[(480, 640), (1024, 1280), (2048, 2560)],
+                        help='Frame sizes as ROWSxCOLS for the loop vs vectorized edge detection comparison')
+    parser.add_argument('--data', help='Write the synthetic experiment here (and reuse it if present) instead of a temp folder')
+    parser.add_argument('-o', '--output', help='Write results as JSON to this file')
+    parser.add_argument('--baseline', help='JSON results from an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.10, help='Slowdown ratio above 1 that counts as a regression')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit with status 1 if anything regressed')
+    args = parser.parse_args(argv)
+
+    workload = {
+        'heat_map': list(args.heat_map),
+        'frames': args.frames,
+        'sensor_seconds': args.sensor_seconds,
+        'flir_rows': args.flir_rows,
+        'simulation_points': args.simulation_points,
+        'combined': args.combined,
+        'repeat': args.repeat,
+    }
+    results = {}
+    memory = {}
+    if 'startup' in args.suites:
+        bench_startup(args.repeat, results)
+        print()
+    with tempfile.TemporaryDirectory() as scratch:
+        folder = args.data or os.path.join(scratch, 'synthetic_experiment')
+        needs_data = {'imports', 'memory', 'analysis', 'render'} & set(args.suites)
+        if needs_data and (not os.path.isdir(folder) or not os.listdir(folder)):
+            start = time.perf_counter()
+            write_workload(folder, workload)
+            print(f"Wrote synthetic experiment to {folder} in {time.perf_counter() - start:.1f} s\n")
+
+        if 'imports' in args.suites:
+            bench_imports(folder, args.repeat, results)
+        if 'memory' in args.suites:
+            bench_memory(folder, memory)
+        if 'analysis' in args.suites or 'render' in args.suites:
+            experiment = loaded_experiment(folder)
+            if 'analysis' in args.suites:
+                bench_analysis(experiment, args.repeat, results)
+            if 'render' in args.suites:
+                bench_render(experiment, args.repeat, results, args.combined)
+    if 'edges' in args.suites:
+        print()
+        bench_edge_detection(args.sizes, args.repeat, results)
+
+    document = {'version': RESULTS_VERSION, 'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'environment': environment(), 'workload': workload, 'results': results, 'memory': memory}
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(document, output_file, indent=2)
+        print(f"\nWrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get('workload') != workload:
+            print('\nWarning: the baseline was recorded with a different workload; ratios may not be comparable')
+        rows = compare(results, baseline['results'], args.tolerance)
+        print_comparison(rows)
+        regressions = [row for row in rows if row[4] == 'slower']
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
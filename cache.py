@@ -0,0 +1,216 @@
+# ========================== Imports & Config ==========================
+import os
+import json
+import uuid
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+import config
+
+TEMP_SUFFIX = '.tmp'
+
+# ========================== Parsed Data Cache ==========================
+class ParsedCache:
+    # Parsed frames stored per root as uncompressed .npz (one array per column) and arrays as
+    # memory-mappable .npy, keyed by the source file's path, size and mtime. Hits bump the
+    # entry's mtime for LRU eviction. Entries are written to a *.tmp file and renamed into place;
+    # those temp files belong to a writer in some thread or process and are never evicted.
+    def __init__(self, root, max_bytes=None, hash_contents=None):
+        self.directory = os.path.join(root, config.CACHE_DIRNAME)
+        self.max_bytes = config.CACHE_MAX_MB * 1024 * 1024 if max_bytes is None else max_bytes
+        self.hash_contents = config.CACHE_HASH_CONTENTS if hash_contents is None else hash_contents
+        self.lock = threading.Lock()
+
+    def fingerprint(self, file_path, tag):
+        stat = os.stat(file_path)
+        key = hashlib.sha1(f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}|{tag}".encode())
+        if self.hash_contents and os.path.isfile(file_path):
+            with open(file_path, 'rb') as source_file:
+                for block in iter(lambda: source_file.read(1 << 20), b''):
+                    key.update(block)
+        return key.hexdigest()
+
+    def entry_path(self, file_path, tag, extension='.npz'):
+        return os.path.join(self.directory, self.fingerprint(file_path, tag) + extension)
+
+    def temp_path(self, entry):
+        # Unique across threads and across the batch / export worker processes sharing the cache
+        return f"{entry}.{os.getpid()}.{uuid.uuid4().hex}{TEMP_SUFFIX}"
+
+    def load(self, file_path, tag):
+        try:
+            entry = self.entry_path(file_path, tag)
+            with np.load(entry, allow_pickle=False) as arrays:
+                frame = _unpack(arrays)
+            os.utime(entry)
+            return frame
+        except Exception:
+            return None
+
+    def store(self, file_path, tag, frame):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            entry = self.entry_path(file_path, tag)
+            temp_entry = self.temp_path(entry)
+        except Exception:
+            return
+        try:
+            with open(temp_entry, 'wb') as entry_file:
+                np.savez(entry_file, **_pack(frame))
+            os.replace(temp_entry, entry)
+        except Exception:
+            _remove(temp_entry)
+            return
+        self.evict()
+
+    def load_array(self, file_path, tag, touch=True):
+        # touch=False reads an entry without marking it recently used
+        try:
+            entry = self.entry_path(file_path, tag, '.npy')
+            array = np.load(entry, mmap_mode='r', allow_pickle=False)
+            if touch:
+                os.utime(entry)
+            return array
+        except Exception:
+            return None
+
+    def store_array(self, file_path, tag, array):
+        # Returns a read-only memory map of the stored copy, or the array itself if it can't be written
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            entry = self.entry_path(file_path, tag, '.npy')
+            temp_entry = self.temp_path(entry)
+        except Exception:
+            return array
+        try:
+            with open(temp_entry, 'wb') as entry_file:
+                np.save(entry_file, np.ascontiguousarray(array), allow_pickle=False)
+            os.replace(temp_entry, entry)
+            array = np.load(entry, mmap_mode='r', allow_pickle=False)
+        except Exception:
+            _remove(temp_entry)
+            return array
+        self.evict()
+        return array
+
+    def build_array(self, file_path, tag, build):
+        # For arrays too large to hold in memory: build(allocate) fills the array returned by
+        # allocate(shape, dtype), which here is a writable memory map of the entry being written
+        entry = self.entry_path(file_path, tag, '.npy')
+        temp_entry = self.temp_path(entry)
+        def allocate(shape, dtype):
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                return np.lib.format.open_memmap(temp_entry, mode='w+', dtype=dtype, shape=shape)
+            except OSError:
+                return np.empty(shape, dtype)
+
+        try:
+            array = build(allocate)
+        except Exception:
+            _remove(temp_entry)
+            raise
+        if not isinstance(array, np.memmap):
+            return array
+
+        # The writable map is kept until the rename succeeds, so a failed rename still hands back
+        # the frames that were just read. Windows won't rename a mapped file, so there the map is
+        # released and the rename retried once.
+        array.flush()
+        if not _replace(temp_entry, entry):
+            if os.name != 'nt':
+                array.flags.writeable = False
+                return array
+            del array
+            source = entry if _replace(temp_entry, entry) else temp_entry
+            try:
+                return np.load(source, mmap_mode='r', allow_pickle=False)
+            except OSError as error:
+                raise OSError(f"Cached stack for {file_path} was removed before it could be reopened") from error
+        try:
+            stored = np.load(entry, mmap_mode='r', allow_pickle=False)
+        except Exception:
+            array.flags.writeable = False
+            return array  # Evicted or replaced by another process in the meantime
+        del array
+        self.evict()
+        return stored
+
+    def entries(self):
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(TEMP_SUFFIX):
+                continue  # Still being written by another thread or process
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        with self.lock:
+            entries = sorted(self.entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    continue  # In use (e.g. memory-mapped on Windows) or already gone
+
+    def clear(self):
+        with self.lock:
+            for _, _, path in self.entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+
+def _replace(source, destination):
+    try:
+        os.replace(source, destination)
+        return True
+    except OSError:
+        return False
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+# ========================== Frame Packing ==========================
+def _pack(frame):
+    meta = {'columns': [str(column) for column in frame.columns],
+            'numeric_labels': all(isinstance(column, (int, np.integer)) for column in frame.columns)}
+    dtypes = frame.dtypes.unique()
+    if len(dtypes) == 1 and pd.api.types.is_numeric_dtype(dtypes[0]):
+        # Uniform numeric tables (heat maps, simulation) are stored as one 2D block
+        meta['layout'] = 'block'
+        arrays = {'block': frame.to_numpy()}
+    else:
+        meta['layout'] = 'columns'
+        arrays = {}
+        for index, column in enumerate(frame.columns):
+            values = frame[column].to_numpy()
+            if values.dtype == object:
+                values = np.asarray(frame[column].astype(str), dtype=str)
+            arrays[f"column_{index}"] = values
+    arrays['meta'] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+    return arrays
+
+def _unpack(arrays):
+    meta = json.loads(arrays['meta'].tobytes().decode())
+    columns = [int(column) for column in meta['columns']] if meta['numeric_labels'] else meta['columns']
+    if meta['layout'] == 'block':
+        return pd.DataFrame(arrays['block'], columns=columns)
+    return pd.DataFrame({column: arrays[f"column_{index}"] for index, column in enumerate(columns)})
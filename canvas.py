@@ -0,0 +1,19 @@
+# ========================== Imports & Config ==========================
+from timing import span
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# Kept out of gui.py so the TkAgg backend is only imported once the first plot needs it
+
+# ========================== Timed Canvas ==========================
+class TimedCanvas(FigureCanvasTkAgg):
+    # Times every full render (draw_idle only schedules one). The first render is credited to
+    # the load that created the view, so it shows up in that load's breakdown.
+    timing_group = None
+    on_first_draw = None
+
+    def draw(self):
+        group, self.timing_group = self.timing_group, None
+        with span('canvas.draw', 'plot', group=group):
+            super().draw()
+        if group is not None and self.on_first_draw is not None:
+            self.on_first_draw()
@@ -0,0 +1,216 @@
+# ========================== Imports & Config ==========================
+import os
+import time
+import sqlite3
+import argparse
+import numpy as np
+import config
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from engine import Experiment, HEAT_MAP, HEAT_MAP_SEQUENCE, SOURCE_ATTRIBUTES, heat_map_cache_tag
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    name TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,        -- name|size|mtime of every source file; a change triggers a rescan
+    sources_present INTEGER NOT NULL,
+    complete INTEGER NOT NULL,
+    missing TEXT NOT NULL,
+    recorded_ns INTEGER,            -- Earliest source file mtime, standing in for the test date
+    total_bytes INTEGER NOT NULL,
+    rows INTEGER,
+    cols INTEGER,
+    peak_temp_c REAL,
+    mean_temp_c REAL,
+    scanned_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    experiment TEXT NOT NULL,
+    source TEXT NOT NULL,
+    file TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    PRIMARY KEY (experiment, source)
+);
+CREATE INDEX IF NOT EXISTS experiments_peak ON experiments (peak_temp_c);
+CREATE INDEX IF NOT EXISTS experiments_recorded ON experiments (recorded_ns);
+"""
+
+# A frame sequence is an optional extra, so its absence doesn't make a folder incomplete
+COMPLETENESS_SOURCES = [source for source in SOURCE_ATTRIBUTES if source != HEAT_MAP_SEQUENCE]
+
+SORT_COLUMNS = ('name', 'sources_present', 'recorded_ns', 'peak_temp_c', 'mean_temp_c', 'total_bytes')
+
+# ========================== Folder Scanning ==========================
+def scan_folder(folder_path):
+    # One os.scandir per folder: which REQUIRED_FILES exist, with their sizes and mtimes
+    entries = {}
+    with os.scandir(folder_path) as folder:
+        for entry in folder:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries[entry.name] = (stat.st_size, stat.st_mtime_ns)
+
+    files = {}
+    for source, candidates in config.REQUIRED_FILES.items():
+        for file in candidates:
+            if file in entries:
+                files[source] = (file, *entries[file])
+                break
+    signature = ';'.join(f"{source}={file}|{size}|{mtime_ns}" for source, (file, size, mtime_ns) in sorted(files.items()))
+    return files, signature
+
+def heat_map_stats(folder_path, cache=None):
+    # Only the stats are kept: a heat map already in the cache is read from there, but one that
+    # isn't is parsed without storing it, so a first crawl of a root doesn't evict entries in use
+    experiment = Experiment(folder_path)
+    heat_map = None
+    if cache is not None:
+        file_path = experiment.source_path(HEAT_MAP)
+        if file_path is not None:
+            heat_map = cache.load_array(file_path, heat_map_cache_tag(), touch=False)
+    if heat_map is None:
+        heat_map, _ = experiment.read_source(HEAT_MAP)
+    if heat_map is None:
+        return {}
+    return {
+        'rows': int(heat_map.shape[0]),
+        'cols': int(heat_map.shape[1]),
+        'peak_temp_c': float(np.nanmax(heat_map)),
+        'mean_temp_c': float(np.nanmean(heat_map, dtype=np.float64)),
+    }
+
+def build_record(folder_path, files, signature, cache=None):
+    missing = [source for source in COMPLETENESS_SOURCES if source not in files]
+    record = {
+        'name': os.path.basename(folder_path),
+        'signature': signature,
+        'sources_present': len(files),
+        'complete': int(not missing),
+        'missing': ', '.join(missing),
+        'recorded_ns': min((mtime_ns for _, _, mtime_ns in files.values()), default=None),
+        'total_bytes': sum(size for _, size, _ in files.values()),
+        'rows': None, 'cols': None, 'peak_temp_c': None, 'mean_temp_c': None,
+        'scanned_at': time.time(),
+    }
+    if HEAT_MAP in files:
+        try:
+            record.update(heat_map_stats(folder_path, cache))
+        except Exception:
+            pass  # Unreadable heat map; the folder is still listed, just without temperatures
+    return record
+
+# ========================== Catalog ==========================
+class Catalog:
+    # SQLite index of every experiment folder under a root. refresh() lists and stats every
+    # folder in parallel, but only reads the heat maps of folders whose files changed.
+    def __init__(self, root, cache=None, path=None):
+        self.root = root
+        self.cache = cache
+        self.path = path or os.path.join(root, config.CATALOG_FILENAME)
+        with self.connect() as connection:
+            connection.executescript(SCHEMA)
+
+    @contextmanager
+    def connect(self):
+        # A connection per call so refreshes can run on a worker thread
+        connection = sqlite3.connect(self.path)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def experiment_folders(self):
+        with os.scandir(self.root) as root:
+            return [entry.path for entry in root
+                    if entry.is_dir() and entry.name != config.CACHE_DIRNAME]
+
+    def refresh(self, workers=None):
+        workers = workers or config.CATALOG_WORKERS
+        with self.connect() as connection:
+            known = dict(connection.execute('SELECT name, signature FROM experiments'))
+
+        folders = self.experiment_folders()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            scans = list(pool.map(scan_folder, folders))
+            changed = [(folder, files, signature) for folder, (files, signature) in zip(folders, scans)
+                       if known.get(os.path.basename(folder)) != signature]
+            records = list(pool.map(lambda scan: build_record(*scan, cache=self.cache), changed))
+
+        present = {os.path.basename(folder) for folder in folders}
+        removed = [name for name in known if name not in present]
+        with self.connect() as connection:
+            for name in removed:
+                connection.execute('DELETE FROM experiments WHERE name = ?', (name,))
+                connection.execute('DELETE FROM files WHERE experiment = ?', (name,))
+            for (_, files, _), record in zip(changed, records):
+                connection.execute(f"INSERT OR REPLACE INTO experiments ({', '.join(record)}) VALUES ({', '.join('?' * len(record))})",
+                                   tuple(record.values()))
+                connection.execute('DELETE FROM files WHERE experiment = ?', (record['name'],))
+                connection.executemany('INSERT INTO files VALUES (?, ?, ?, ?, ?)',
+                                       [(record['name'], source, *details) for source, details in files.items()])
+        return {'scanned': len(folders), 'updated': len(changed), 'removed': len(removed)}
+
+    def query(self, name_contains=None, complete=None, min_sources=None, min_peak=None, max_peak=None,
+              recorded_after=None, recorded_before=None, order_by='name', descending=False, limit=None):
+        if order_by not in SORT_COLUMNS:
+            raise ValueError(f"Can't sort by {order_by!r}; choose one of {', '.join(SORT_COLUMNS)}")
+
+        conditions, parameters = [], []
+        for clause, value in (('name LIKE ?', f"%{name_contains}%" if name_contains else None),
+                              ('complete = ?', None if complete is None else int(complete)),
+                              ('sources_present >= ?', min_sources),
+                              ('peak_temp_c >= ?', min_peak),
+                              ('peak_temp_c <= ?', max_peak),
+                              ('recorded_ns >= ?', recorded_after),
+                              ('recorded_ns < ?', recorded_before)):
+            if value is not None:
+                conditions.append(clause)
+                parameters.append(value)
+
+        sql = 'SELECT * FROM experiments'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        # Unknown values sort last either way; names break ties so the order is stable
+        sql += f" ORDER BY {order_by} IS NULL, {order_by} {'DESC' if descending else 'ASC'}, name COLLATE NOCASE"
+        if limit is not None:
+            sql += ' LIMIT ?'
+            parameters.append(limit)
+
+        with self.connect() as connection:
+            return [dict(row) for row in connection.execute(sql, parameters)]
+
+    def files(self, name):
+        with self.connect() as connection:
+            return {row['source']: dict(row) for row in connection.execute('SELECT * FROM files WHERE experiment = ?', (name,))}
+
+# ========================== Command Line ==========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Index the experiment folders under a root and list them.')
+    parser.add_argument('root', help='Directory containing experiment folders')
+    parser.add_argument('--complete', action='store_true', help='Only list folders that have every source file')
+    parser.add_argument('--min-peak', type=float, help='Only list heat maps peaking at or above this temperature (°C)')
+    parser.add_argument('--name', help='Only list folders whose name contains this text')
+    parser.add_argument('--sort', default='name', choices=SORT_COLUMNS, help='Column to sort by')
+    parser.add_argument('--desc', action='store_true', help='Sort in descending order')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='Threads used to scan folders')
+    args = parser.parse_args(argv)
+
+    catalog = Catalog(args.root)
+    start = time.perf_counter()
+    counts = catalog.refresh(args.workers)
+    print(f"Scanned {counts['scanned']} folders in {time.perf_counter() - start:.2f} s "
+          f"({counts['updated']} updated, {counts['removed']} removed)")
+
+    for row in catalog.query(name_contains=args.name, complete=True if args.complete else None, min_peak=args.min_peak,
+                             order_by=args.sort, descending=args.desc):
+        recorded = time.strftime('%Y-%m-%d %H:%M', time.localtime(row['recorded_ns'] / 1e9)) if row['recorded_ns'] else '-'
+        peak = f"{row['peak_temp_c']:.1f}" if row['peak_temp_c'] is not None else '-'
+        print(f"{row['name']:<40} {row['sources_present']}/{len(config.REQUIRED_FILES)} {recorded:>16} {peak:>8} °C")
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@
 
 REQUIRED_FILES = {
     'Heat Map': ['Heat_Map_Final_Frame.csv', 'Ti_Fin_Flir.csv'],
+    'Heat Map Sequence': ['Heat_Map_Frames'],     # Folder of per-frame CSVs, numbered in capture order
     'Chamfered Side, Flir': ['Chamfered_Side_TC_Flir.txt'],
     'Filleted Side, Flir': ['Filleted_Side_TC_Flir.txt'],
     'External Sensors, Arduino': ['sensors.txt'],
@@ -26,4 +27,80 @@ FIN_HEIGHT = 90.28              # Height of the fin in mm
 #-----------------------------------------
 
 EDGE_SENSITIVITY = 80  # Pixel window near top/bottom edges
-FIGURE_SIZE = (8, 6)
\ No newline at end of file
+FIGURE_SIZE = (8, 6)
+HEAT_MAP_DTYPE = 'float32'  # Storage dtype for heat map grids (float64 for full precision)
+REFERENCE_FRAME = -1        # Sequence frame used for edge detection when there is no final frame file
+
+#-----------------------------------------
+# Experiment Selection
+#-----------------------------------------
+
+MAX_SELECTED_EXPERIMENTS = 200       # Experiments that can be open at once
+COMBINED_COLLECTION_THRESHOLD = 20   # Above this many profiles the combined plot draws one LineCollection
+PROFILE_GRID_POINTS = 500            # Positions along the fin every profile is resampled onto for statistics
+PROFILE_BANDS = ((5, 95), (25, 75))  # Percentile bands shaded in the combined plot, outermost first
+PROFILE_OUTLIER_Z = 3.5              # Robust z-score of an experiment's distance from the median profile that flags it
+PROFILE_OUTLIER_MIN_C = 1.0          # ...provided it is also this many °C further away than is typical
+
+#-----------------------------------------
+# Clock Offsets
+#-----------------------------------------
+
+FLIR_TIME_OFFSET_HOURS = -5      # Added to FLIR log timestamps to match the Arduino clock (UTC -> local)
+SENSORS_TIME_OFFSET_HOURS = 0    # Added to Arduino sensor timestamps
+ALIGN_DIRECTION = 'nearest'      # merge_asof direction when matching FLIR readings to sensor samples
+ALIGN_TOLERANCE_MS = 500         # Sensor samples with no FLIR reading this close are left unmatched
+
+#-----------------------------------------
+# Loading
+#-----------------------------------------
+
+LOAD_WORKERS = 5        # Threads reading experiment files concurrently
+LOAD_POLL_MS = 50       # How often the GUI checks for finished file reads
+FLIR_CHUNK_BYTES = 1024 * 1024  # Bytes of log parsed per chunk when reading FLIR logs
+REDECIMATE_DELAY_MS = 150 # Quiet time after a zoom/pan before the temporal plot is re-decimated
+
+#-----------------------------------------
+# Parsed Data Cache
+#-----------------------------------------
+
+CACHE_ENABLED = True
+CACHE_DIRNAME = '.iris_cache'   # Created inside the selected experiments root
+CACHE_MAX_MB = 2048             # Least recently used entries are evicted above this size
+CACHE_HASH_CONTENTS = False     # Also hash file contents, not just path + size + mtime
+
+#-----------------------------------------
+# Experiment Catalog
+#-----------------------------------------
+
+CATALOG_FILENAME = '.iris_catalog.sqlite'   # Created inside the selected experiments root
+CATALOG_WORKERS = 8                         # Threads scanning experiment folders
+
+#-----------------------------------------
+# Live Follow
+#-----------------------------------------
+
+LIVE_UPDATE_MS = 250        # How often followed logs are checked for new lines
+LIVE_SENSOR_ROWS = 36000    # Most recent Arduino rows kept while following (~10 h at 1 Hz)
+LIVE_FLIR_ROWS = 500000     # Most recent rows kept per FLIR log while following
+
+#-----------------------------------------
+# Timing
+#-----------------------------------------
+
+TIMING_ENABLED = True       # Record import / analysis / plot spans for the dashboard and trace export
+TIMING_MAX_SPANS = 50000    # Oldest spans are dropped beyond this
+
+#-----------------------------------------
+# Memory Budget
+#-----------------------------------------
+
+MEMORY_BUDGET_MB = 4096     # Parsed data + figures kept in RAM; above this, hidden experiments' raw data is dropped (0 = no limit)
+
+#-----------------------------------------
+# Report Export
+#-----------------------------------------
+
+EXPORT_FORMATS = ('png', 'pdf')  # Files written per figure
+EXPORT_DPI = 150                 # Resolution of raster figures
+EXPORT_STATUS_MS = 4000          # How long the GUI shows the export result before resetting the button
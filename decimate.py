@@ -0,0 +1,25 @@
+# ========================== Imports & Config ==========================
+import numpy as np
+
+# ========================== Plot Decimation ==========================
+def minmax_envelope(x, y, n_bins):
+    # Keeps the smallest and largest sample of each of n_bins equal-count bins, in time order,
+    # so peaks and dropouts survive while the line has at most 2 * n_bins vertices
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n_bins < 1 or n <= 2 * n_bins:
+        return x, y
+
+    per_bin = n // n_bins
+    binned = y[:per_bin * n_bins].reshape(n_bins, per_bin)
+    offsets = np.arange(n_bins) * per_bin
+    min_index = offsets + np.argmin(binned, axis=1)
+    max_index = offsets + np.argmax(binned, axis=1)
+
+    indices = np.sort(np.concatenate([min_index, max_index]))
+    remainder = np.arange(per_bin * n_bins, n)
+    if len(remainder):
+        tail = remainder[[np.argmin(y[remainder]), np.argmax(y[remainder])]]
+        indices = np.concatenate([indices, np.unique(tail)])
+    return x[indices], y[indices]
@@ -0,0 +1,828 @@
+# ========================== Imports & Config ==========================
+import io
+import os
+import re
+import mmap
+import math
+import hashlib
+import warnings
+import itertools
+import config
+import statistics
+import numpy as np
+import pandas as pd
+from cache import ParsedCache
+from timing import span
+from sources import HEAT_MAP, HEAT_MAP_SEQUENCE, CHAMFERED_FLIR, FILLETED_FLIR, SENSORS, SIMULATION
+
+# Sensor and FLIR timestamps keep only their time of day, placed on this date so the
+# int64 view of a time column is nanoseconds since midnight
+TIME_OF_DAY_EPOCH = np.datetime64('1970-01-01', 'ns')
+
+# Bump whenever a reader's output changes so stale cache entries are ignored
+PARSER_VERSION = 3
+
+# ========================== File Readers ==========================
+def normalize_time_of_day(times, time_format, offset_hours=0):
+    parsed = pd.to_datetime(times, format=time_format)
+    if offset_hours:
+        parsed = parsed + pd.Timedelta(hours=offset_hours)
+    return TIME_OF_DAY_EPOCH + (parsed - parsed.dt.normalize())
+
+def read_heatmap(file_path, dtype=None):
+    dtype = np.dtype(dtype or config.HEAT_MAP_DTYPE)
+    with span('parse heat map CSV', 'import'):
+        return np.ascontiguousarray(pd.read_csv(file_path, header=None, dtype=dtype).to_numpy())
+
+def heat_map_cache_tag():
+    # Shared with the catalog, which reads a cached heat map without parsing or storing one
+    return f"{HEAT_MAP}:v{PARSER_VERSION}:{np.dtype(config.HEAT_MAP_DTYPE).str}"
+
+def sequence_frame_files(folder_path):
+    # Frame CSVs in capture order, comparing the numbers in their names numerically
+    names = [name for name in os.listdir(folder_path) if name.lower().endswith('.csv')]
+    natural_key = lambda name: [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', name)]
+    return [os.path.join(folder_path, name) for name in sorted(names, key=natural_key)]
+
+def read_heatmap_sequence(folder_path, dtype=None, allocate=np.empty):
+    # Frames are parsed one at a time into a (frames, rows, cols) stack from allocate(shape, dtype),
+    # which can hand back a writable memory map so the stack is never held in RAM
+    frame_files = sequence_frame_files(folder_path)
+    if not frame_files:
+        raise ValueError(f"No frame files in {folder_path}")
+    dtype = np.dtype(dtype or config.HEAT_MAP_DTYPE)
+    first_frame = read_heatmap(frame_files[0], dtype)
+    stack = allocate((len(frame_files),) + first_frame.shape, dtype)
+    stack[0] = first_frame
+    for index, frame_file in enumerate(frame_files[1:], start=1):
+        frame = read_heatmap(frame_file, dtype)
+        if frame.shape != first_frame.shape:
+            raise ValueError(f"{os.path.basename(frame_file)} is {frame.shape}, expected {first_frame.shape}")
+        stack[index] = frame
+    return stack
+
+SENSOR_HEADER_LINES = 3    # Two Arduino banner lines, then the column header
+FLIR_HEADER_LINES = 1
+
+# Column dtypes of the parsed logs: datetime64[ns] timestamps (int64 underneath) and float32
+# measurements, which is more precision than the loggers write
+TIMESTAMP_DTYPE = np.dtype('datetime64[ns]')
+MEASUREMENT_DTYPE = np.dtype(np.float32)
+SENSOR_SCHEMA = {
+    'Absolute_Time': TIMESTAMP_DTYPE,
+    'ChamferTemp_C': MEASUREMENT_DTYPE,
+    'FilletTemp_C': MEASUREMENT_DTYPE,
+    'FluidTemp_C': MEASUREMENT_DTYPE,
+    'FlowRate_L_per_min': MEASUREMENT_DTYPE,
+}
+
+def flir_schema(column):
+    return {'time': TIMESTAMP_DTYPE, column: MEASUREMENT_DTYPE}
+
+def empty_frame(schema):
+    return pd.DataFrame({column: np.empty(0, dtype) for column, dtype in schema.items()})
+
+DAY_NS = 86400 * 10**9
+CLOCK_FIELDS = ['hour', 'minute', 'second', 'millisecond']
+
+def time_of_day(hours, minutes, seconds, fraction_ns, offset_hours=0):
+    # Same result as normalize_time_of_day, from numeric clock fields
+    nanoseconds = (hours * 3600 + minutes * 60 + seconds) * 10**9 + fraction_ns + int(offset_hours * 3600 * 10**9)
+    return (nanoseconds % DAY_NS).astype(np.int64).view(TIMESTAMP_DTYPE)
+
+def parse_sensor_bytes(column_header, data):
+    # "HH:MM:SS:mmm -> elapsed_ms,value,..." lines. With the separators turned into commas the C
+    # parser reads the clock as integers, so no timestamp strings are created. Only the
+    # SENSOR_SCHEMA columns are kept; the elapsed counter is skipped.
+    names = [name.strip() for name in column_header.decode().strip().split(',')]
+    measurements = [name for name in names[1:] if name in SENSOR_SCHEMA]
+    if not data.strip():
+        return empty_frame({'Absolute_Time': TIMESTAMP_DTYPE, **dict.fromkeys(measurements, MEASUREMENT_DTYPE)})
+
+    data = data.replace(b' ', b'').replace(b'->', b',').replace(b':', b',')
+    table = pd.read_csv(io.BytesIO(data), header=None, names=CLOCK_FIELDS + ['elapsed_ms'] + names[1:],
+                        usecols=CLOCK_FIELDS + measurements,
+                        dtype={**dict.fromkeys(CLOCK_FIELDS, np.int64), **dict.fromkeys(measurements, MEASUREMENT_DTYPE)})
+    # The Arduino always writes three millisecond digits
+    frame = pd.DataFrame({'Absolute_Time': time_of_day(*(table[field].to_numpy() for field in CLOCK_FIELDS[:3]),
+                                                       table['millisecond'].to_numpy() * 10**6, config.SENSORS_TIME_OFFSET_HOURS)})
+    for name in measurements:
+        frame[name] = table[name].to_numpy()
+    return frame
+
+def read_sensors(file_path):
+    with span('parse sensors CSV', 'import'):
+        with open(file_path, 'rb') as sensors_file:
+            lines = sensors_file.read().split(b'\n', SENSOR_HEADER_LINES)
+        body = lines[SENSOR_HEADER_LINES] if len(lines) > SENSOR_HEADER_LINES else b''
+        body = body.rstrip(b'\r\n').rpartition(b'\n')[0]  # The last line may be partially written
+        return parse_sensor_bytes(lines[SENSOR_HEADER_LINES - 1], body)
+
+def normalize_flir_frame(df):
+    df['time'] = normalize_time_of_day(df['time'], '%Y-%m-%d %H:%M:%S.%f', config.FLIR_TIME_OFFSET_HOURS)
+    return df
+
+FLIR_FIELDS = ['date', 'hour', 'minute', 'second']
+FLIR_SEPARATORS = bytes.maketrans(b' :', b'\t\t')
+
+def parse_flir_bytes(header, data):
+    # "YYYY-MM-DD HH:MM:SS.ffffff<TAB>value" lines. As with the sensor log, the clock separators
+    # become tabs so the C parser reads hours, minutes and seconds as numbers and skips the
+    # date; no timestamp strings are created. Other layouts go through pandas' date parsing.
+    names = header.decode().strip().split('\t')
+    if not data.strip():
+        return empty_frame({'time': TIMESTAMP_DTYPE, **dict.fromkeys(names[1:], MEASUREMENT_DTYPE)})
+
+    if names[0] == 'time' and len(names) == 2:
+        try:
+            with span('parse FLIR chunk', 'import'):
+                table = pd.read_csv(io.BytesIO(data.translate(FLIR_SEPARATORS)), sep='\t', header=None,
+                                    names=FLIR_FIELDS + names[1:], usecols=FLIR_FIELDS[1:] + names[1:],
+                                    dtype={'hour': np.int64, 'minute': np.int64, 'second': np.float64, names[1]: MEASUREMENT_DTYPE})
+        except (ValueError, pd.errors.ParserError):
+            table = None
+        if table is not None:
+            with span('convert FLIR timestamps', 'import'):
+                nanoseconds = np.rint(table['second'].to_numpy() * 1e9).astype(np.int64)  # Exact to well under 1 ns
+                times = time_of_day(table['hour'].to_numpy(), table['minute'].to_numpy(), 0, nanoseconds, config.FLIR_TIME_OFFSET_HOURS)
+            return pd.DataFrame({'time': times, names[1]: table[names[1]].to_numpy()})
+
+    with span('parse FLIR chunk (string timestamps)', 'import'):
+        df = pd.read_csv(io.BytesIO(header + data), sep='\t', dtype=dict.fromkeys(names[1:], MEASUREMENT_DTYPE))
+        return normalize_flir_frame(df)
+
+def iter_flir_chunks(file_path, chunk_bytes=None):
+    # Parses the log a block of whole lines at a time, so the raw bytes in memory stay bounded
+    chunk_bytes = chunk_bytes or config.FLIR_CHUNK_BYTES
+    with open(file_path, 'rb') as flir_file:
+        header = flir_file.readline()
+        partial = b''
+        chunks = 0
+        while True:
+            block = flir_file.read(chunk_bytes)
+            data = partial + block
+            if not block:
+                if data.strip() or not chunks:
+                    yield parse_flir_bytes(header, data)  # An empty log still yields an empty table
+                return
+            complete = data.rfind(b'\n') + 1
+            data, partial = data[:complete], data[complete:]
+            if data:
+                chunks += 1
+                yield parse_flir_bytes(header, data)
+
+def read_flir(file_path, chunk_bytes=None):
+    # Columns are sized from a newline count up front and each chunk is copied straight in,
+    # so the table is never held twice the way concatenating the chunks would
+    chunk_bytes = chunk_bytes or config.FLIR_CHUNK_BYTES
+    with open(file_path, 'rb') as flir_file:
+        capacity = sum(block.count(b'\n') for block in iter(lambda: flir_file.read(chunk_bytes), b'')) + 1
+
+    columns, filled = None, 0
+    for chunk in iter_flir_chunks(file_path, chunk_bytes):
+        if columns is None:
+            columns = {name: np.empty(capacity, chunk[name].dtype) for name in chunk.columns}
+        for name, column in columns.items():
+            column[filled:filled + len(chunk)] = chunk[name].to_numpy()
+        filled += len(chunk)
+    # Trimming is a view unless blank lines left a noticeable gap
+    trim = (lambda column: column[:filled].copy()) if capacity - filled > 1024 else (lambda column: column[:filled])
+    return pd.DataFrame({name: trim(column) for name, column in columns.items()}, copy=False)
+
+def read_simulation(file_path):
+    with open(file_path, 'rb') as simulation_file:
+        data = simulation_file.read().strip()
+
+    # Drop the header and the trailing line as before, then parse the body in one C pass.
+    # A third column only exists to spot rows that don't have exactly two values.
+    body = data.split(b'\n', 1)[1].rsplit(b'\n', 1)[0] if data.count(b'\n') >= 2 else b''
+    read_body = lambda dtype: pd.read_csv(io.BytesIO(body), sep='\t', header=None, names=['Location', 'Temperature', 'Extra'],
+                                          dtype=dtype, on_bad_lines='skip', skipinitialspace=True)
+    try:
+        values = read_body(np.float64)
+    except ValueError:
+        # A stray text line (a header or footer variant) is dropped, not the whole file, at the
+        # cost of parsing the columns as text first
+        values = read_body(str)
+        values = pd.DataFrame({'Location': pd.to_numeric(values['Location'], errors='coerce'),
+                               'Temperature': pd.to_numeric(values['Temperature'], errors='coerce'),
+                               'Extra': values['Extra']})
+    two_values = (values['Extra'].isna() & values['Location'].notna() & values['Temperature'].notna()).to_numpy()
+    df = pd.DataFrame({'Location': values['Location'].to_numpy()[two_values],
+                       'Temperature': values['Temperature'].to_numpy()[two_values]})
+
+    min_pos = df['Location'].min()
+    max_pos = df['Location'].max()
+    df['Location'] = ((df['Location'] - min_pos) / (max_pos - min_pos)) * config.FIN_HEIGHT
+
+    df['Temperature'] = df['Temperature']-273.15
+    return df
+
+READERS = {
+    HEAT_MAP: read_heatmap,
+    HEAT_MAP_SEQUENCE: read_heatmap_sequence,
+    CHAMFERED_FLIR: read_flir,
+    FILLETED_FLIR: read_flir,
+    SENSORS: read_sensors,
+    SIMULATION: read_simulation,
+}
+
+SOURCE_ATTRIBUTES = {
+    HEAT_MAP: 'heat_map_data',
+    HEAT_MAP_SEQUENCE: 'heat_map_frames',
+    SENSORS: 'sensors_data',
+    CHAMFERED_FLIR: 'flir_chamfered_data',
+    FILLETED_FLIR: 'flir_filleted_data',
+    SIMULATION: 'simulation_data',
+}
+
+# ========================== Memory Accounting ==========================
+def resident_nbytes(value):
+    # Bytes held in RAM. Memory-mapped arrays count as nothing since their pages belong to
+    # the OS file cache and are dropped under pressure.
+    if value is None:
+        return 0
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, np.ndarray):
+        base = value
+        while base is not None:
+            if isinstance(base, (np.memmap, mmap.mmap)):
+                return 0
+            base = getattr(base, 'base', None)
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(resident_nbytes(item) for item in value)
+    return 0
+
+# ========================== Analysis Functions ==========================
+def _mode(values):
+    # Same tie-break as statistics.mode: the first value in order that reaches the top count
+    values = np.asarray(values)
+    if values.size == 0:
+        raise statistics.StatisticsError('no mode for empty data')
+    offset = values.min()
+    counts = np.bincount(values - offset)
+    is_mode = counts == counts.max()
+    return int(values[np.argmax(is_mode[values - offset])])
+
+def plate_edge_detection(heat_map):
+    rows, cols = heat_map.shape
+
+    row_gradients = np.gradient(heat_map, axis=1)
+    left_edge = _mode(np.argmax(row_gradients, axis=1))
+    right_edge = _mode(np.argmin(row_gradients, axis=1))
+
+    fin_columns = heat_map[:, left_edge:right_edge]
+    top_gradients = np.gradient(fin_columns[:config.EDGE_SENSITIVITY], axis=0)
+    bottom_gradients = np.gradient(fin_columns[-config.EDGE_SENSITIVITY:], axis=0)
+
+    top_edge = _mode(np.argmax(top_gradients, axis=0))
+    bottom_edge = _mode(rows - config.EDGE_SENSITIVITY + np.argmin(bottom_gradients, axis=0))
+
+    return left_edge, right_edge, top_edge, bottom_edge
+
+def find_thermocouples(left_edge, right_edge, top_edge, bottom_edge):
+    chamfered_x_pixels = math.trunc(((config.FIN_WIDTH-config.TC_C_HLOC)/config.FIN_WIDTH)*(right_edge-left_edge+1))+left_edge
+    chamfered_y_pixels = math.trunc((config.TC_C_VLOC/config.FIN_HEIGHT)*(bottom_edge-top_edge+1))+top_edge
+
+    filleted_x_pixels = math.trunc(((config.FIN_WIDTH-config.TC_F_HLOC)/config.FIN_WIDTH)*(right_edge-left_edge+1))+left_edge
+    filleted_y_pixels = math.trunc(((config.FIN_HEIGHT-config.TC_F_VLOC)/config.FIN_HEIGHT)*(bottom_edge-top_edge+1))+top_edge
+
+    return (int(chamfered_x_pixels), int(chamfered_y_pixels)), (int(filleted_x_pixels), int(filleted_y_pixels))
+
+# ========================== Sensor / FLIR Alignment ==========================
+SENSOR_COLUMNS = [column for column in SENSOR_SCHEMA if column != 'Absolute_Time']
+ALIGNED_SIDES = {
+    # side: (Arduino thermocouple column, FLIR column, error column)
+    'chamfered': ('ChamferTemp_C', 'Chamfered_Side_TC', 'Chamfered_Error_C'),
+    'filleted': ('FilletTemp_C', 'Filleted_Side_TC', 'Filleted_Error_C'),
+}
+
+def _sorted_by(frame, column):
+    return frame if frame[column].is_monotonic_increasing else frame.sort_values(column, kind='stable')
+
+def align_sensors_flir(sensors, flir_chamfered=None, flir_filleted=None, direction=None, tolerance_ms=None):
+    # One row per Arduino sample with the as-of matched FLIR reading from each log. The FLIR
+    # logs are much denser, so the ~1 Hz sensor clock is the common one; samples with no FLIR
+    # reading within the tolerance get NaN.
+    direction = direction or config.ALIGN_DIRECTION
+    tolerance = pd.Timedelta(milliseconds=config.ALIGN_TOLERANCE_MS if tolerance_ms is None else tolerance_ms)
+
+    # Older loggers lack some columns (FlowRate, say); a side without its thermocouple column
+    # gets a NaN error and drops out of alignment_error_stats
+    columns = [column for column in SENSOR_COLUMNS if column in sensors.columns]
+    aligned = _sorted_by(sensors[['Absolute_Time'] + columns], 'Absolute_Time').reset_index(drop=True)
+    for flir, (_, flir_column, _) in ((flir_chamfered, ALIGNED_SIDES['chamfered']), (flir_filleted, ALIGNED_SIDES['filleted'])):
+        if flir is None:
+            aligned[flir_column] = np.nan
+            continue
+        right = _sorted_by(flir[['time', flir_column]], 'time')
+        aligned = pd.merge_asof(aligned, right, left_on='Absolute_Time', right_on='time',
+                                direction=direction, tolerance=tolerance).drop(columns='time')
+
+    for sensor_column, flir_column, error_column in ALIGNED_SIDES.values():
+        aligned[error_column] = aligned[sensor_column] - aligned[flir_column] if sensor_column in aligned else np.nan
+    return aligned
+
+def alignment_error_stats(aligned):
+    # Thermocouple minus FLIR, over the samples that found a FLIR match
+    stats = {}
+    for side, (_, _, error_column) in ALIGNED_SIDES.items():
+        errors = aligned[error_column].to_numpy(dtype=np.float64)
+        errors = errors[np.isfinite(errors)]
+        if errors.size == 0:
+            continue
+        stats[side] = {
+            'matched_samples': int(errors.size),
+            'coverage': float(errors.size / len(aligned)),
+            'mean_error_c': float(errors.mean()),
+            'mean_abs_error_c': float(np.abs(errors).mean()),
+            'rmse_c': float(np.sqrt(np.mean(errors ** 2))),
+            'std_error_c': float(errors.std()),
+            'max_abs_error_c': float(np.abs(errors).max()),
+        }
+    return stats
+
+# ========================== Simulation Comparison ==========================
+def compare_to_simulation(y_positions_mm, temperature_profile, simulation):
+    # Simulated temperatures interpolated onto the measured midline positions
+    location = simulation['Location'].to_numpy(dtype=np.float64)
+    temperature = simulation['Temperature'].to_numpy(dtype=np.float64)
+    if np.any(np.diff(location) < 0):
+        order = np.argsort(location, kind='stable')
+        location, temperature = location[order], temperature[order]
+
+    simulated = np.interp(y_positions_mm, location, temperature)
+    deviation = np.asarray(temperature_profile, dtype=np.float64) - simulated
+    deviation = deviation[np.isfinite(deviation)]
+    if deviation.size == 0:
+        return None
+    return {
+        'points': int(deviation.size),
+        'rmse_c': float(np.sqrt(np.mean(deviation ** 2))),
+        'max_abs_deviation_c': float(np.abs(deviation).max()),
+        'mean_deviation_c': float(deviation.mean()),
+    }
+
+# ========================== Cross-Experiment Statistics ==========================
+def profile_grid(points=None):
+    return np.linspace(0, config.FIN_HEIGHT, points or config.PROFILE_GRID_POINTS)
+
+def resample_profiles(profiles, grid):
+    # (positions_mm, temperatures) pairs of any length onto one grid, as an experiments x
+    # positions array. The profiles are laid end to end, each shifted past the one before, so a
+    # single np.interp resamples them all; each row's queries are clamped to its own span.
+    stacked = np.full((len(profiles), len(grid)), np.nan)
+    rows = [index for index, (positions, _) in enumerate(profiles) if len(positions)]
+    if not rows:
+        return stacked
+    starts = np.array([profiles[index][0][0] for index in rows], dtype=np.float64)
+    ends = np.array([profiles[index][0][-1] for index in rows], dtype=np.float64)
+    offsets = np.arange(len(rows)) * ((ends - starts).max() + 1.0) - starts
+
+    positions = np.concatenate([np.asarray(profiles[index][0], dtype=np.float64) + offset for index, offset in zip(rows, offsets)])
+    temperatures = np.concatenate([np.asarray(profiles[index][1], dtype=np.float64) for index in rows])
+    queries = np.clip(np.asarray(grid, dtype=np.float64), starts[:, None], ends[:, None]) + offsets[:, None]
+    stacked[rows] = np.interp(queries.ravel(), positions, temperatures).reshape(queries.shape)
+    return stacked
+
+def profile_statistics(stacked, percentiles=None, outlier_z=None):
+    # Column-wise statistics over experiments, plus each experiment's mean absolute distance
+    # from the median profile (a stray edge pixel barely moves it, a shifted profile does).
+    # Outliers sit more than outlier_z robust (median / MAD) z-scores and at least
+    # PROFILE_OUTLIER_MIN_C above the typical distance, so measurement noise alone never flags
+    # one; with fewer than three experiments nothing is flagged.
+    percentiles = sorted({p for band in (percentiles or config.PROFILE_BANDS) for p in band} | {50})
+    outlier_z = config.PROFILE_OUTLIER_Z if outlier_z is None else outlier_z
+    count = np.sum(np.isfinite(stacked), axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # All-NaN columns stay NaN
+        values = np.nanpercentile(stacked, percentiles, axis=0)
+        median = values[percentiles.index(50)]
+        distance = np.nanmean(np.abs(stacked - median), axis=1)
+        stats = {
+            'count': count,
+            'mean': np.nanmean(stacked, axis=0),
+            'std': np.nanstd(stacked, axis=0),
+            'median': median,
+            'percentiles': dict(zip(percentiles, values)),
+            'distance': distance,
+            'outliers': np.zeros(len(stacked), dtype=bool),
+        }
+        scored = np.isfinite(distance)
+        if scored.sum() >= 3:
+            typical = np.median(distance[scored])
+            spread = 1.4826 * np.median(np.abs(distance[scored] - typical))
+            z = (distance - typical) / spread if spread > 0 else np.where(distance > typical, np.inf, 0.0)
+            stats['outliers'] = scored & (z > outlier_z) & (distance - typical > config.PROFILE_OUTLIER_MIN_C)
+    return stats
+
+# ========================== Experiment ==========================
+class Experiment:
+    def __init__(self, folder_path, cache=None):
+        self.path = os.path.normpath(folder_path)
+        self.name = os.path.basename(self.path)
+        self.cache = cache
+
+        self.heat_map_data = None
+        self.heat_map_frames = None
+        self.sensors_data = None
+        self.flir_chamfered_data = None
+        self.flir_filleted_data = None
+        self.simulation_data = None
+        self.filenames = {}
+        self.found_files = {}  # source -> file present in the folder, from scan_sources
+        self.loaded = set()    # Sources that have been read (successfully or not)
+
+        self.left_edge = None
+        self.right_edge = None
+        self.top_edge = None
+        self.bottom_edge = None
+        self.midline = None
+        self.c_tc_location = None
+        self.f_tc_location = None
+        self.profile = None  # (y positions in mm, temperatures) along the midline, filled on first use
+        self.alignment = None  # Sensors with as-of matched FLIR readings, filled on first use
+        self.alignment_stats = None  # TC - FLIR error per side from the alignment, filled on first use
+        self.simulation_metrics = None  # Midline vs simulation deviation, filled on first use
+
+    # read_source has no side effects so it can run on a worker; set_source stores the result
+    def read_source(self, source):
+        for file in config.REQUIRED_FILES[source]:
+            file_path = os.path.join(self.path, file)
+            if os.path.exists(file_path):
+                try:
+                    return self.read_file(source, file_path), file
+                except Exception:
+                    continue
+        return None, None
+
+    def read_file(self, source, file_path):
+        if self.cache is None:
+            return READERS[source](file_path)
+
+        tag = f"{source}:v{PARSER_VERSION}"
+        if source == HEAT_MAP:
+            # Heat maps are parsed once into a .npy sidecar and memory-mapped from then on
+            tag = heat_map_cache_tag()
+            with span('cache lookup', 'cache'):
+                data = self.cache.load_array(file_path, tag)
+            if data is None:
+                data = READERS[source](file_path)
+                with span('cache store', 'cache'):
+                    data = self.cache.store_array(file_path, tag, data)
+            return data
+        if source == HEAT_MAP_SEQUENCE:
+            # The folder's own mtime misses frames rewritten in place, so every frame's stat is in the key
+            frames_key = hashlib.sha1()
+            for frame_file in sequence_frame_files(file_path):
+                stat = os.stat(frame_file)
+                frames_key.update(f"{os.path.basename(frame_file)}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+            tag = f"{tag}:{np.dtype(config.HEAT_MAP_DTYPE).str}:{frames_key.hexdigest()}"
+            with span('cache lookup', 'cache'):
+                data = self.cache.load_array(file_path, tag)
+            if data is None:
+                data = self.cache.build_array(file_path, tag, lambda allocate: READERS[source](file_path, allocate=allocate))
+            return data
+
+        with span('cache lookup', 'cache'):
+            data = self.cache.load(file_path, tag)
+        if data is None:
+            data = READERS[source](file_path)
+            with span('cache store', 'cache'):
+                self.cache.store(file_path, tag, data)
+        return data
+
+    def source_path(self, source):
+        files = [self.filenames[source]] if self.filenames.get(source) else config.REQUIRED_FILES[source]
+        for file in files:
+            file_path = os.path.join(self.path, file)
+            if os.path.exists(file_path):
+                return file_path
+        return None
+
+    def scan_sources(self):
+        # Only checks which files exist, so it is cheap enough to run before anything is read
+        for source in SOURCE_ATTRIBUTES:
+            file_path = self.source_path(source)
+            self.found_files[source] = os.path.basename(file_path) if file_path else None
+        return self.found_files
+
+    def needs_source(self, source):
+        # Unread and present on disk; sources without a file are never queued
+        return source not in self.loaded and self.found_files.get(source) is not None
+
+    def set_source(self, source, data, file):
+        setattr(self, SOURCE_ATTRIBUTES[source], data)
+        self.filenames[source] = file
+        self.loaded.add(source)
+        if source in (SENSORS, CHAMFERED_FLIR, FILLETED_FLIR):
+            self.alignment = None
+            self.alignment_stats = None
+        if source == SIMULATION:
+            self.simulation_metrics = None
+
+    def import_source(self, source):
+        self.set_source(source, *self.read_source(source))
+
+    def import_heatmap(self):
+        self.import_source(HEAT_MAP)
+
+    def import_heatmap_sequence(self):
+        self.import_source(HEAT_MAP_SEQUENCE)
+
+    def import_sensors(self):
+        self.import_source(SENSORS)
+
+    def import_flir_chamfered(self):
+        self.import_source(CHAMFERED_FLIR)
+
+    def import_flir_filleted(self):
+        self.import_source(FILLETED_FLIR)
+
+    def import_simulation_data(self):
+        self.import_source(SIMULATION)
+
+    def load(self, sources=None):
+        for source in sources or SOURCE_ATTRIBUTES:
+            self.import_source(source)
+
+    def reference_frame(self):
+        # The final frame file when there is one, otherwise a frame of the sequence. Edges found
+        # on it are reused for every frame of the sequence.
+        if self.heat_map_data is not None:
+            return self.heat_map_data
+        if self.heat_map_frames is not None:
+            return self.heat_map_frames[config.REFERENCE_FRAME]
+        return None
+
+    def plate_edge_detection(self):
+        reference = self.reference_frame()
+        if reference is None:
+            return
+        with span('plate_edge_detection', 'analysis'):
+            self.left_edge, self.right_edge, self.top_edge, self.bottom_edge = plate_edge_detection(reference)
+        self.midline = (self.right_edge + self.left_edge) / 2
+
+    def find_thermocouples(self):
+        if self.reference_frame() is None:
+            return
+        with span('find_thermocouples', 'analysis'):
+            self.c_tc_location, self.f_tc_location = find_thermocouples(self.left_edge, self.right_edge, self.top_edge, self.bottom_edge)
+
+    def analyze(self):
+        self.profile = None
+        self.simulation_metrics = None
+        self.plate_edge_detection()
+        self.find_thermocouples()
+
+    def has_heat_map(self):
+        return self.reference_frame() is not None
+
+    def has_profile(self):
+        # Still true after evict_raw_data, which keeps the midline profile
+        return self.profile is not None or self.has_heat_map()
+
+    def has_heat_map_sequence(self):
+        return self.heat_map_frames is not None
+
+    def frame_count(self):
+        return len(self.heat_map_frames) if self.has_heat_map_sequence() else 1
+
+    def simulation_comparison(self):
+        # Scored from the cached profile too, so an evicted experiment stays in the ranking
+        if self.simulation_metrics is None and self.has_profile() and self.has_simulation():
+            profile = self.midline_profile()
+            with span('compare_to_simulation', 'analysis'):
+                self.simulation_metrics = compare_to_simulation(*profile, self.simulation_data)
+        return self.simulation_metrics
+
+    def has_alignment_data(self):
+        return self.sensors_data is not None and (self.flir_chamfered_data is not None or self.flir_filleted_data is not None)
+
+    def aligned_data(self):
+        if self.alignment is not None or not self.has_alignment_data():
+            return self.alignment
+
+        sensors_path = os.path.join(self.path, self.filenames[SENSORS])
+        tag = None
+        if self.cache is not None:
+            # Keyed on the sensor file; the FLIR logs and alignment settings go into the tag
+            flir_keys = [self.cache.fingerprint(os.path.join(self.path, self.filenames[source]), source) if self.filenames.get(source) else '-'
+                         for source in (CHAMFERED_FLIR, FILLETED_FLIR)]
+            tag = f"alignment:v{PARSER_VERSION}:{config.ALIGN_DIRECTION}:{config.ALIGN_TOLERANCE_MS}:{':'.join(flir_keys)}"
+            with span('cache lookup', 'cache'):
+                self.alignment = self.cache.load(sensors_path, tag)
+        if self.alignment is None:
+            with span('align_sensors_flir', 'analysis'):
+                self.alignment = align_sensors_flir(self.sensors_data, self.flir_chamfered_data, self.flir_filleted_data)
+            if tag is not None:
+                with span('cache store', 'cache'):
+                    self.cache.store(sensors_path, tag, self.alignment)
+        return self.alignment
+
+    def alignment_error_stats(self):
+        if self.alignment_stats is None:
+            aligned = self.aligned_data()
+            self.alignment_stats = alignment_error_stats(aligned) if aligned is not None else {}
+        return self.alignment_stats
+
+    def sequence_edges(self):
+        # The edges found on the final frame, unless the sequence was exported at a different
+        # resolution; then they are found again on the sequence's reference frame
+        frame_shape = self.heat_map_frames.shape[1:]
+        if self.heat_map_data is None or self.heat_map_data.shape == frame_shape:
+            return self.left_edge, self.right_edge, self.top_edge, self.bottom_edge
+        with span('plate_edge_detection (sequence)', 'analysis'):
+            return plate_edge_detection(self.heat_map_frames[config.REFERENCE_FRAME])
+
+    def sequence_thermocouples(self, edges=None):
+        edges = edges or self.sequence_edges()
+        if edges == (self.left_edge, self.right_edge, self.top_edge, self.bottom_edge):
+            return self.c_tc_location, self.f_tc_location
+        return find_thermocouples(*edges)
+
+    def thermocouple_frame_series(self):
+        # Temperature under both thermocouples in every frame, read with one fancy index so a
+        # memory-mapped stack only pages in those pixels
+        (cx, cy), (fx, fy) = self.sequence_thermocouples()
+        pixels = np.asarray(self.heat_map_frames[:, [cy, fy], [cx, fx]], dtype=np.float64)
+        return pd.DataFrame({
+            'Frame': np.arange(len(pixels)),
+            'Chamfered_TC': pixels[:, 0],
+            'Filleted_TC': pixels[:, 1],
+        })
+
+    def has_simulation(self):
+        return self.simulation_data is not None and not self.simulation_data.empty
+
+    def pixel_to_mm(self, x, y, edges=None):
+        # Same scale as midline_profile: fin rows top..bottom-1 span 0..FIN_HEIGHT. edges are
+        # the sequence's when it was exported at a different resolution.
+        left, right, top, bottom = edges or (self.left_edge, self.right_edge, self.top_edge, self.bottom_edge)
+        x_mm = (x - left) / max(right - left, 1) * config.FIN_WIDTH
+        y_mm = (y - top) / max(bottom - top - 1, 1) * config.FIN_HEIGHT
+        return x_mm, y_mm
+
+    def midline_profile(self):
+        if self.profile is None:
+            with span('midline_profile', 'analysis'):
+                mid_x = int((self.right_edge + self.left_edge) / 2)
+                # Copied out so the cached profile doesn't keep a memory-mapped column alive
+                temperature_profile = np.array(self.reference_frame()[self.top_edge:self.bottom_edge, mid_x])
+                y_positions_mm = np.linspace(0, config.FIN_HEIGHT, len(temperature_profile))
+                self.profile = (y_positions_mm, temperature_profile)
+        return self.profile
+
+    def memory_usage(self):
+        return {
+            'data': sum(resident_nbytes(getattr(self, attribute)) for attribute in SOURCE_ATTRIBUTES.values()),
+            'derived': resident_nbytes(self.profile) + resident_nbytes(self.alignment),
+        }
+
+    def evict_raw_data(self):
+        # Drops every parsed source and the alignment, which is as large as the sensor log.
+        # Edges, TC pixels, the midline profile and the simulation and TC - FLIR metrics are
+        # kept. Dropped sources count as unread again, so the next view that needs them
+        # re-reads them (from the parsed-data cache when it is enabled).
+        if self.left_edge is not None and self.has_heat_map():
+            self.midline_profile()  # Computed now, while the frame it comes from is still here
+        evicted = [source for source, attribute in SOURCE_ATTRIBUTES.items() if getattr(self, attribute) is not None]
+        for source in evicted:
+            setattr(self, SOURCE_ATTRIBUTES[source], None)
+            self.loaded.discard(source)
+        self.alignment = None
+        return evicted
+
+    def summary(self):
+        summary = {
+            'experiment': self.name,
+            'path': self.path,
+            'files': dict(self.filenames),
+        }
+        if not self.has_heat_map():
+            return summary
+
+        heat_map = self.reference_frame()
+        _, profile = self.midline_profile()
+        summary['edges'] = {
+            'left': int(self.left_edge),
+            'right': int(self.right_edge),
+            'top': int(self.top_edge),
+            'bottom': int(self.bottom_edge),
+            'midline': float(self.midline),
+        }
+        summary['thermocouple_pixels'] = {
+            'chamfered': list(self.c_tc_location),
+            'filleted': list(self.f_tc_location),
+        }
+        summary['heat_map'] = {
+            'rows': int(heat_map.shape[0]),
+            'cols': int(heat_map.shape[1]),
+            'min_temp_c': float(np.nanmin(heat_map)),
+            'max_temp_c': float(np.nanmax(heat_map)),
+            'mean_temp_c': float(np.nanmean(heat_map, dtype=np.float64)),
+            'chamfered_tc_temp_c': float(heat_map[self.c_tc_location[1], self.c_tc_location[0]]),
+            'filleted_tc_temp_c': float(heat_map[self.f_tc_location[1], self.f_tc_location[0]]),
+        }
+        if len(profile):
+            summary['midline_profile'] = {
+                'points': int(len(profile)),
+                'min_temp_c': float(np.nanmin(profile)),
+                'max_temp_c': float(np.nanmax(profile)),
+                'mean_temp_c': float(np.nanmean(profile, dtype=np.float64)),
+            }
+        if self.has_heat_map_sequence():
+            frame_series = self.thermocouple_frame_series()
+            summary['heat_map_sequence'] = {
+                'frames': int(len(frame_series)),
+                'chamfered_tc_range_c': [float(frame_series['Chamfered_TC'].min()), float(frame_series['Chamfered_TC'].max())],
+                'filleted_tc_range_c': [float(frame_series['Filleted_TC'].min()), float(frame_series['Filleted_TC'].max())],
+            }
+        if self.sensors_data is not None:
+            summary['sensors'] = {
+                column: float(self.sensors_data[column].mean())
+                for column in ('ChamferTemp_C', 'FilletTemp_C', 'FluidTemp_C', 'FlowRate_L_per_min')
+                if column in self.sensors_data
+            }
+        if self.has_simulation():
+            summary['simulation_comparison'] = self.simulation_comparison()
+        if self.has_alignment_data():
+            summary['tc_minus_flir'] = self.alignment_error_stats()
+        return summary
+
+# ========================== Workspace ==========================
+class Workspace:
+    def __init__(self, root=None, use_cache=None):
+        self.use_cache = config.CACHE_ENABLED if use_cache is None else use_cache
+        self.experiments = {}
+        self.last_viewed = {}  # folder -> view_clock tick when its tab was last shown
+        self.view_clock = itertools.count(1)
+        self.set_root(root)
+
+    def set_root(self, root):
+        self.root = root
+        self.cache = ParsedCache(root) if root and self.use_cache else None
+
+    def available_experiments(self):
+        if not self.root or not os.path.isdir(self.root):
+            return []
+        return [folder for folder in sorted(os.listdir(self.root))
+                if folder != config.CACHE_DIRNAME and os.path.isdir(os.path.join(self.root, folder))]
+
+    def add(self, folder_name):
+        if folder_name not in self.experiments:
+            self.experiments[folder_name] = Experiment(os.path.join(self.root, folder_name), cache=self.cache)
+        return self.experiments[folder_name]
+
+    def clear_cache(self):
+        if self.cache is not None:
+            self.cache.clear()
+
+    def get(self, folder_name):
+        return self.experiments.get(folder_name)
+
+    def remove(self, folder_name):
+        self.last_viewed.pop(folder_name, None)
+        return self.experiments.pop(folder_name, None)
+
+    def clear(self):
+        self.experiments.clear()
+        self.last_viewed.clear()
+
+    # ========== Memory Budget ==========
+    def touch(self, folder_name):
+        # Marks an experiment as just viewed, for least-recently-viewed eviction
+        self.last_viewed[folder_name] = next(self.view_clock)
+
+    def memory_usage(self):
+        return {name: experiment.memory_usage() for name, experiment in self.experiments.items()}
+
+    def enforce_budget(self, budget_bytes, keep=(), extra_bytes=None):
+        # Evicts raw data from the least recently viewed experiments outside keep until the
+        # total fits. extra_bytes (name -> bytes) covers memory the caller frees alongside,
+        # such as an experiment's figures. Returns the names evicted.
+        extra_bytes = extra_bytes or {}
+        usage = self.memory_usage()
+        total = sum(used['data'] + used['derived'] for used in usage.values()) + sum(extra_bytes.values())
+        evicted = []
+        for name in sorted(self.experiments, key=lambda name: self.last_viewed.get(name, 0)):
+            if total <= budget_bytes:
+                break
+            freed = usage[name]['data'] + usage[name]['derived'] + extra_bytes.get(name, 0)  # The profile it keeps is tiny
+            if name in keep or not freed:
+                continue
+            self.experiments[name].evict_raw_data()
+            total -= freed
+            evicted.append(name)
+        return evicted
+
+    def __contains__(self, folder_name):
+        return folder_name in self.experiments
+
+    def __iter__(self):
+        return iter(self.experiments.values())
+
+    def __len__(self):
+        return len(self.experiments)
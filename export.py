@@ -0,0 +1,192 @@
+# ========================== Imports & Config ==========================
+import os
+import html
+import time
+import argparse
+import multiprocessing
+import config
+import plots
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from cache import ParsedCache
+from catalog import Catalog
+from engine import Experiment
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Each plot: (file stem, draw function, whether the experiment has what it needs)
+EXPERIMENT_PLOTS = [
+    ('heat_map', plots.draw_heat_map, lambda experiment: experiment.has_heat_map()),
+    ('linear_profile', plots.draw_linear_profile, lambda experiment: experiment.has_heat_map()),
+    ('temporal', plots.draw_temporal, lambda experiment: experiment.sensors_data is not None
+                                                         or experiment.flir_chamfered_data is not None
+                                                         or experiment.flir_filleted_data is not None),
+]
+
+# ========================== Rendering ==========================
+def save_figure(draw, output_stem, formats, dpi, *args):
+    # A bare Figure on an Agg canvas: nothing here creates a Tk widget or touches pyplot
+    fig = Figure(figsize=config.FIGURE_SIZE)
+    FigureCanvasAgg(fig)
+    draw(fig, *args)
+    paths = []
+    for file_format in formats:
+        path = f"{output_stem}.{file_format}"
+        fig.savefig(path, dpi=dpi)
+        paths.append(path)
+    fig.clear()
+    return paths
+
+class RenderedProfile:
+    # What draw_combined_profiles needs from an experiment rendered in another process
+    def __init__(self, name, profile):
+        self.name = name
+        self.profile = profile
+
+    def midline_profile(self):
+        return self.profile
+
+def render_experiment(folder_path, output_dir, formats=config.EXPORT_FORMATS, dpi=config.EXPORT_DPI, use_cache=True):
+    # Runs in a worker process; returns the summary, the files written and the midline profile
+    cache = ParsedCache(os.path.dirname(folder_path)) if use_cache else None
+    experiment = Experiment(folder_path, cache=cache)
+    experiment.load()
+    experiment.analyze()
+
+    experiment_output = os.path.join(output_dir, experiment.name)
+    os.makedirs(experiment_output, exist_ok=True)
+    figures = {}
+    for stem, draw, available in EXPERIMENT_PLOTS:
+        if available(experiment):
+            paths = save_figure(draw, os.path.join(experiment_output, stem), formats, dpi, experiment)
+            figures[stem] = [os.path.relpath(path, output_dir) for path in paths]
+
+    return {
+        'summary': experiment.summary(),
+        'figures': figures,
+        'profile': experiment.midline_profile() if experiment.has_heat_map() else None,
+    }
+
+# ========================== Summary Document ==========================
+def _cell(value, template='{:.2f}'):
+    return '-' if value is None else template.format(value)
+
+def _figure_links(figures, stem):
+    links = []
+    for path in figures.get(stem, []):
+        link = html.escape(path.replace(os.sep, '/'))
+        if path.endswith('.png'):
+            links.append(f'<a href="{link}"><img src="{link}" width="240"></a>')
+        else:
+            links.append(f'<a href="{link}">{html.escape(os.path.splitext(path)[1][1:].upper())}</a>')
+    return ' '.join(links) or '-'
+
+def write_report(output_dir, results, failures, combined_figures, outliers, elapsed_s):
+    rows = []
+    for result in results:
+        summary, figures = result['summary'], result['figures']
+        pixels = summary.get('thermocouple_pixels', {})
+        comparison = summary.get('simulation_comparison') or {}
+        errors = summary.get('tc_minus_flir', {})
+        rows.append('<tr>' + ''.join(f'<td>{cell}</td>' for cell in (
+            html.escape(summary['experiment']),
+            html.escape(str(tuple(pixels['chamfered']))) if 'chamfered' in pixels else '-',
+            html.escape(str(tuple(pixels['filleted']))) if 'filleted' in pixels else '-',
+            _cell(summary.get('heat_map', {}).get('max_temp_c')),
+            _cell(comparison.get('rmse_c')),
+            _cell(errors.get('chamfered', {}).get('mean_error_c'), '{:+.2f}'),
+            _cell(errors.get('filleted', {}).get('mean_error_c'), '{:+.2f}'),
+            *(_figure_links(figures, stem) for stem, _, _ in EXPERIMENT_PLOTS),
+        )) + '</tr>')
+
+    failure_items = ''.join(f'<li>{html.escape(name)}: {html.escape(error)}</li>' for name, error in sorted(failures.items()))
+    headers = ['Experiment', 'Chamfered TC (px)', 'Filleted TC (px)', 'Peak (°C)', 'Sim RMSE (°C)',
+               'TC − FLIR Chamfered (°C)', 'TC − FLIR Filleted (°C)', 'Heat Map', 'Linear Profile', 'Temporal']
+    document = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>IRIS Report</title>
+<style>body {{ font-family: sans-serif; }} table {{ border-collapse: collapse; }} td, th {{ border: 1px solid #999; padding: 4px; vertical-align: top; }}</style>
+</head><body>
+<h1>IRIS Report</h1>
+<p>{len(results)} experiments rendered in {elapsed_s:.1f} s{f', {len(failures)} failed' if failures else ''}. Generated {time.strftime('%Y-%m-%d %H:%M')}.</p>
+<h2>Combined Linear Profiles</h2>
+<p>{_figure_links({'combined': combined_figures}, 'combined')}</p>
+<p>Outliers against the median profile: {html.escape(', '.join(outliers)) if outliers else 'none'}</p>
+<h2>Experiments</h2>
+<table><tr>{''.join(f'<th>{header}</th>' for header in headers)}</tr>
+{chr(10).join(rows)}
+</table>
+{f'<h2>Failures</h2><ul>{failure_items}</ul>' if failures else ''}
+</body></html>
+"""
+    report_path = os.path.join(output_dir, 'report.html')
+    with open(report_path, 'w', encoding='utf-8') as report_file:
+        report_file.write(document)
+    return report_path
+
+# ========================== Export ==========================
+def export_reports(root, folder_names, output_dir, formats=config.EXPORT_FORMATS, dpi=config.EXPORT_DPI, workers=None, use_cache=True, progress=None):
+    # Workers are spawned, not forked, so this is safe to call from a thread of the running GUI
+    start = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+    results, failures = [], {}
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(render_experiment, os.path.join(root, name), output_dir, formats, dpi, use_cache): name
+                   for name in folder_names}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as error:
+                failures[name] = str(error)
+            if progress is not None:
+                progress(len(results) + len(failures), len(futures))
+    results.sort(key=lambda result: result['summary']['experiment'].lower())
+
+    # The combined plot needs every profile, so it is drawn here once the workers are done
+    profiles = [RenderedProfile(result['summary']['experiment'], result['profile']) for result in results if result['profile'] is not None]
+    scores = {result['summary']['experiment']: result['summary']['simulation_comparison']['rmse_c']
+              for result in results if result['summary'].get('simulation_comparison')}
+    outliers = []
+    def draw_combined(fig, show_bands):
+        artists = plots.draw_combined_profiles(fig, profiles, show_bands)
+        if scores:
+            plots.set_combined_scores(artists, scores)
+        if artists['statistics'] is not None:
+            statistics = artists['statistics']
+            outliers[:] = [name for name, outlier in zip(statistics['names'], statistics['outliers']) if outlier]
+    combined_figures = []
+    if profiles:
+        for stem, show_bands in (('combined_linear_profiles', False), ('combined_profile_bands', True)):
+            paths = save_figure(draw_combined, os.path.join(output_dir, stem), formats, dpi, show_bands)
+            combined_figures += [os.path.relpath(path, output_dir) for path in paths]
+
+    report_path = write_report(output_dir, results, failures, combined_figures, outliers, time.perf_counter() - start)
+    return report_path, results, failures
+
+# ========================== Command Line ==========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render every plot for a set of experiments off-screen and write an HTML report.')
+    parser.add_argument('root', help='Directory containing experiment folders')
+    parser.add_argument('-o', '--output', default='iris_report', help='Directory to write figures and report.html to')
+    parser.add_argument('-e', '--experiments', nargs='+', help='Folder names to export (default: every catalogued experiment)')
+    parser.add_argument('--complete', action='store_true', help='Only export folders that have every source file')
+    parser.add_argument('-f', '--formats', nargs='+', choices=('png', 'pdf', 'svg'), default=list(config.EXPORT_FORMATS), help='Figure file formats')
+    parser.add_argument('--dpi', type=int, default=config.EXPORT_DPI, help='Resolution of raster figures')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='Parse every file from scratch without the parsed-data cache')
+    args = parser.parse_args(argv)
+
+    folder_names = args.experiments
+    if folder_names is None:
+        catalog = Catalog(args.root)
+        catalog.refresh()
+        folder_names = [row['name'] for row in catalog.query(complete=True if args.complete else None)]
+
+    report_path, results, failures = export_reports(
+        args.root, folder_names, args.output, args.formats, args.dpi, args.workers, not args.no_cache,
+        progress=lambda done, total: print(f"\r{done}/{total} experiments rendered", end='', flush=True))
+    print(f"\n{len(results)} experiments exported, {len(failures)} failed. Report: {os.path.abspath(report_path)}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
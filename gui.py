@@ -1,24 +1,46 @@
 # ========================== Imports & Config ==========================
-import os
-import math
+import queue
+import sqlite3
+import importlib
 import config
-import statistics
-import numpy as np
-import pandas as pd
-import tkinter as tk
 import customtkinter as ctk
 from tkinter import filedialog
-from collections import Counter
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.lines import Line2D
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from sources import HEAT_MAP, HEAT_MAP_SEQUENCE, SENSORS, CHAMFERED_FLIR, FILLETED_FLIR, SIMULATION
+from widgets import VirtualList
+from timing import TIMELINE, span
+
+# numpy, pandas and matplotlib take most of a second to import, so everything built on them is
+# imported inside the methods that use it. A loader thread imports these while the window is
+# being built; a method that gets there first simply waits for that import to finish.
+DEFERRED_MODULES = ('engine', 'plots', 'canvas', 'live', 'catalog', 'export', 'matplotlib.dates')
+
+# Sources each view reads; anything else stays on disk until a view asks for it
+VIEW_SOURCES = {
+    'heat_map': (HEAT_MAP, HEAT_MAP_SEQUENCE),
+    'linear_profile': (SIMULATION,),
+    'temporal': (SENSORS, CHAMFERED_FLIR, FILLETED_FLIR),
+}
+
+# Available-experiment orderings: label -> (catalog column, descending)
+CATALOG_SORTS = {
+    'Name': ('name', False),
+    'Newest': ('recorded_ns', True),
+    'Peak Temperature': ('peak_temp_c', True),
+    'Completeness': ('sources_present', True),
+}
 
 # Global App Config
 ctk.set_appearance_mode('dark')
 ctk.set_default_color_theme('dark-blue')  # Infrared-friendly color theme
 
+# ========================== Deferred Imports ==========================
+def import_deferred_modules():
+    with span('import deferred modules', 'startup'):
+        for name in DEFERRED_MODULES:
+            importlib.import_module(name)
+
 # ========================== Main Application Class ==========================
 class IRISApp(ctk.CTk):
     def __init__(self):
@@ -27,36 +49,53 @@ class IRISApp(ctk.CTk):
         self.geometry('1400x800')
 
         self.current_tabs = set()  # Track created tabs
-        self.heat_map_data = {}
-        self.heat_map_data_filenames = {}
-        self.sensors_data = {}
-        self.sensors_data_filenames = {}
-        self.flir_chamfered_data = {}
-        self.flir_chamfered_data_filenames = {}
-        self.flir_filleted_data = {}
-        self.flir_filleted_data_filenames = {}
-        self.simulation_data = {}
-        self.simulation_data_filesnames = {}
-        self.left_edges = {}
-        self.right_edges = {}
-        self.top_edges = {}
-        self.bottom_edges = {}
-        self.midline = {}
-        self.c_tc_location = {}
-        self.f_tc_location = {}
-
-        self.current_plot_canvas = {}
+        self._workspace = None     # Created on first use, once engine has been imported
+        self.catalog = None
+        self.catalog_results = queue.Queue()
+        self.export_results = queue.Queue()  # ('progress', (done, total)) / ('done', future) from a report export
+        self.available_order = {}  # folder -> position in the current catalog ordering
+
+        self.plot_views = {}    # tab -> view name -> persistent figure, canvas, toolbar and artists
+        self.active_views = {}  # tab -> name of the view currently packed
+        self.hover_heights = {} # tab -> fin height (mm) last hovered on the heat map
+        self.redecimate_after_id = None
+        self.live_followers = {}  # tab -> LiveFollower tailing that experiment's logs
+        self.live_after_id = None
+
+        # Background loading: one request at a time, its files read concurrently
+        self.load_pool = ThreadPoolExecutor(max_workers=config.LOAD_WORKERS)
+        self.load_pool.submit(import_deferred_modules)
+        self.load_queue = deque()   # (folder name, sources) waiting to be read
+        self.load_results = queue.Queue()
+        self.load_states = {}       # tab -> source -> 'Queued' / 'Loading' until it has been read
+        self.alignment_results = queue.Queue()
+        self.aligning = set()       # Experiments whose sensor / FLIR alignment is running on load_pool
+        self.active_load = None
+        self.requested_views = {}   # tab -> view to show once its sources have been read
+        self.last_load_group = None # Timing group of the most recent load, shown in the dashboard
 
         self.create_workspace()
 
         self.protocol('WM_DELETE_WINDOW', self.on_closing)
+        self.load_poll_id = self.after(config.LOAD_POLL_MS, self.poll_load_results)
 
     def on_closing(self):
         try:
+            self.after_cancel(self.load_poll_id)
+            if self.live_after_id is not None:
+                self.after_cancel(self.live_after_id)
+            self.load_pool.shutdown(wait=False, cancel_futures=True)
             self.quit()
         except:
             pass
 
+    @property
+    def workspace(self):
+        if self._workspace is None:
+            from engine import Workspace
+            self._workspace = Workspace()
+        return self._workspace
+
 # ========================== Building the Workspace ==========================
     def create_workspace(self):
 
@@ -102,17 +141,39 @@ class IRISApp(ctk.CTk):
         reset_button = ctk.CTkButton(parent, text='Reset', command=self.reset_workspace)
         reset_button.pack(side='left')
 
+        clear_cache_button = ctk.CTkButton(parent, text='Clear Cache', command=self.clear_cache)
+        clear_cache_button.pack(side='left', padx=5)
+
+        self.export_report_button = ctk.CTkButton(parent, text='Export Report', command=self.export_report)
+        self.export_report_button.pack(side='left')
+
     def build_available_experiments_box(self, parent):
         self.available_experiments = ctk.CTkLabel(parent, text='Available Experiments', width=225, font=(None, 20))
         self.available_experiments.pack(anchor='n')
-        self.available_experiments_listbox = ctk.CTkScrollableFrame(parent, height=150)
-        self.available_experiments_listbox.pack(fill='x', expand='false', pady=(0, 10))
+
+        catalog_frame = ctk.CTkFrame(parent, fg_color='transparent')
+        catalog_frame.pack(fill='x')
+        self.catalog_sort_menu = ctk.CTkOptionMenu(catalog_frame, values=list(CATALOG_SORTS), width=140,
+                                                   command=lambda _: self.populate_available_list())
+        self.catalog_sort_menu.pack(side='left', padx=(0, 5))
+        self.complete_only_checkbox = ctk.CTkCheckBox(catalog_frame, text='Complete only', command=self.populate_available_list)
+        self.complete_only_checkbox.pack(side='left')
+
+        self.available_experiments_listbox = VirtualList(parent, key=self.available_sort_key,
+                                                         on_activate=self.add_to_selected_experiments)
+        self.available_experiments_listbox.pack(fill='x', expand='false')
+        add_button = ctk.CTkButton(parent, text='Add Selected',
+                                   command=lambda: self.add_to_selected_experiments(self.available_experiments_listbox.get_selected()))
+        add_button.pack(fill='x', padx=5, pady=(2, 10))
 
     def build_selected_experiments_box(self, parent):
         self.selected_experiments_label = ctk.CTkLabel(parent, text='Selected Experiments', width=225, font=(None, 20))
         self.selected_experiments_label.pack(anchor='n')
-        self.selected_experiments_listbox = ctk.CTkScrollableFrame(parent, height=150)
-        self.selected_experiments_listbox.pack(fill='x', expand='false', pady=(0, 10))
+        self.selected_experiments_listbox = VirtualList(parent, action_text='X', on_action=lambda name: self.remove_selected_experiments([name]))
+        self.selected_experiments_listbox.pack(fill='x', expand='false')
+        remove_button = ctk.CTkButton(parent, text='Remove Selected',
+                                      command=lambda: self.remove_selected_experiments(self.selected_experiments_listbox.get_selected()))
+        remove_button.pack(fill='x', padx=5, pady=(2, 10))
 
     def build_center_box(self, parent):
         self.experiments_tabs = ctk.CTkTabview(parent, command=self.on_tab_change)
@@ -134,6 +195,14 @@ class IRISApp(ctk.CTk):
         self.heatmap_file_label.insert(0, 'No file loaded')
         self.heatmap_file_label.configure(state='disabled')
 
+        self.sequence_label = ctk.CTkLabel(self.status_frame, text='Heatmap Frame Sequence:')
+        self.sequence_label.pack(anchor='w')
+
+        self.sequence_file_label = ctk.CTkEntry(self.status_frame, height=25, justify='right')
+        self.sequence_file_label.pack(fill='x', pady=(0, 5), padx=5)
+        self.sequence_file_label.insert(0, 'No file loaded')
+        self.sequence_file_label.configure(state='disabled')
+
         self.sensors_label = ctk.CTkLabel(self.status_frame, text='Sensors File:')
         self.sensors_label.pack(anchor='w')
 
@@ -195,6 +264,12 @@ class IRISApp(ctk.CTk):
         self.simulation_checkbox.pack(anchor='w', padx=5, pady=5)
         self.simulation_checkbox.select()
 
+        self.rank_by_simulation_checkbox = ctk.CTkCheckBox(self.linear_plot_frame, text='Rank Combined Plot by Simulation Fit', command=self.update_combined_ranking)
+        self.rank_by_simulation_checkbox.pack(anchor='w', padx=5, pady=5)
+
+        self.combined_bands_checkbox = ctk.CTkCheckBox(self.linear_plot_frame, text='Show Combined Plot as Percentile Bands', command=self.update_combined_bands)
+        self.combined_bands_checkbox.pack(anchor='w', padx=5, pady=5)
+
         self.plot_temporal_data_frame = ctk.CTkFrame(parent)
         self.plot_temporal_data_frame.pack(anchor='w', fill='x', expand=True, padx=5, pady=5)
 
@@ -217,6 +292,12 @@ class IRISApp(ctk.CTk):
         self.plot_flow_rate.pack(anchor='w', padx=5, pady=5)
         self.plot_flow_rate.select()
 
+        self.full_resolution_checkbox = ctk.CTkCheckBox(self.plot_temporal_data_frame, text='Full Resolution', command=self.plot_temporal_data)
+        self.full_resolution_checkbox.pack(anchor='w', padx=5, pady=5)
+
+        self.follow_live_checkbox = ctk.CTkCheckBox(self.plot_temporal_data_frame, text='Follow Live', command=self.toggle_live_follow)
+        self.follow_live_checkbox.pack(anchor='w', padx=5, pady=5)
+
     def build_information_frame(self, parent):
         self.information_frame = ctk.CTkFrame(parent)
         self.information_frame.pack(side='top', fill='x', anchor='n', padx=5, pady=5)
@@ -240,6 +321,46 @@ class IRISApp(ctk.CTk):
         self.filleted_tc_location.insert(0, 'Select Heatmap')
         self.filleted_tc_location.configure(state='disabled')
 
+        self.alignment_label = ctk.CTkLabel(self.information_frame, text='TC − FLIR Error, mean / RMSE (°C)', width=225, font=(None, 18))
+        self.alignment_label.pack(anchor='w')
+
+        self.chamfered_error_label = ctk.CTkLabel(self.information_frame, text='Chamfered Edge')
+        self.chamfered_error_label.pack(anchor='w')
+
+        self.chamfered_error = ctk.CTkEntry(self.information_frame, height=25, justify='right')
+        self.chamfered_error.pack(fill='x', pady=(0, 5), padx=5)
+        self.chamfered_error.insert(0, 'Plot Temporal Data')
+        self.chamfered_error.configure(state='disabled')
+
+        self.filleted_error_label = ctk.CTkLabel(self.information_frame, text='Filleted Edge')
+        self.filleted_error_label.pack(anchor='w')
+
+        self.filleted_error = ctk.CTkEntry(self.information_frame, height=25, justify='right')
+        self.filleted_error.pack(fill='x', pady=(0, 5), padx=5)
+        self.filleted_error.insert(0, 'Plot Temporal Data')
+        self.filleted_error.configure(state='disabled')
+
+        self.timing_label = ctk.CTkLabel(self.information_frame, text='Last Load, Stage Times', width=225, font=(None, 18))
+        self.timing_label.pack(anchor='w')
+
+        self.timing_breakdown = ctk.CTkTextbox(self.information_frame, height=160, wrap='none', font=('Courier', 11))
+        self.timing_breakdown.pack(fill='x', pady=(0, 5), padx=5)
+        self.timing_breakdown.insert('1.0', 'No loads yet' if TIMELINE.enabled else 'Timing disabled')
+        self.timing_breakdown.configure(state='disabled')
+
+        self.export_timing_button = ctk.CTkButton(self.information_frame, text='Export Timing Trace', command=self.export_timing)
+        self.export_timing_button.pack(fill='x', pady=(0, 5), padx=5)
+        if not TIMELINE.enabled:
+            self.export_timing_button.configure(state='disabled')
+
+        self.memory_label = ctk.CTkLabel(self.information_frame, text='Memory, data / derived / figs (MB)', width=225, font=(None, 18))
+        self.memory_label.pack(anchor='w')
+
+        self.memory_usage = ctk.CTkTextbox(self.information_frame, height=120, wrap='none', font=('Courier', 11))
+        self.memory_usage.pack(fill='x', pady=(0, 5), padx=5)
+        self.memory_usage.insert('1.0', 'No experiments loaded')
+        self.memory_usage.configure(state='disabled')
+
 # ============================ File Browser Functions ==========================
     def browse_directory(self):
         selected_dir = filedialog.askdirectory()
@@ -249,59 +370,64 @@ class IRISApp(ctk.CTk):
             self.populate_available_experiments(selected_dir)
 
     def populate_available_experiments(self, path):
-        for widget in self.available_experiments_listbox.winfo_children():
-            widget.destroy()
-
-        for folder in sorted(os.listdir(path)):
-            full_path = os.path.join(path, folder)
-            if os.path.isdir(full_path):
-                btn = ctk.CTkButton(self.available_experiments_listbox, text=folder, command=lambda name=folder: self.add_to_selected_experiments(name))
-                btn.pack(fill='x', pady=1)
-
-    def add_to_selected_experiments(self, folder_name):
-        if len(self.current_tabs) >= 10:
-            return
-        
-        for widget in self.selected_experiments_listbox.winfo_children():
-            if getattr(widget, 'folder_name', None) == folder_name:
-                return
-            
-        for widget in self.available_experiments_listbox.winfo_children():
-            if isinstance(widget, ctk.CTkButton) and widget.cget("text") == folder_name:
-                widget.destroy()
+        from catalog import Catalog
+        self.workspace.set_root(path)
+        try:
+            self.catalog = Catalog(path, cache=self.workspace.cache)
+        except (sqlite3.Error, OSError):
+            self.catalog = None  # e.g. a read-only root; fall back to a plain folder listing
+
+        # Whatever the catalog already knows is listed at once; the refresh re-lists when done
+        self.populate_available_list()
+        if self.catalog is not None:
+            catalog = self.catalog
+            future = self.load_pool.submit(catalog.refresh)
+            future.add_done_callback(lambda f: self.catalog_results.put((catalog, f)))
+
+    def available_sort_key(self, folder_name):
+        # Catalog position first; folders the catalog doesn't know yet go last by name
+        return self.available_order.get(folder_name, len(self.available_order)), folder_name.lower()
+
+    def populate_available_list(self):
+        folders = None
+        if self.catalog is not None:
+            order_by, descending = CATALOG_SORTS[self.catalog_sort_menu.get()]
+            complete = True if self.complete_only_checkbox.get() == 1 else None
+            try:
+                folders = [row['name'] for row in self.catalog.query(complete=complete, order_by=order_by, descending=descending)]
+            except sqlite3.Error:
+                folders = None
+        if folders is None:
+            folders = self.workspace.available_experiments()
+
+        self.available_order = {folder: index for index, folder in enumerate(folders)}
+        self.available_experiments_listbox.set_items([folder for folder in folders if folder not in self.workspace])
+
+    def add_to_selected_experiments(self, folder_names):
+        for folder_name in folder_names:
+            if len(self.workspace) >= config.MAX_SELECTED_EXPERIMENTS:
                 break
-        
-        if folder_name not in self.current_tabs:
-            self.experiments_tabs.add(folder_name)
-            self.current_tabs.add(folder_name)
-
-        base_dir = self.dir_entry.get()
-        experiment_path = os.path.normpath(os.path.join(base_dir, folder_name))
-
-        self.import_heatmap(experiment_path)
-        self.import_sensors(experiment_path)
-        self.import_flir_chamfered(experiment_path)
-        self.import_flir_filleted(experiment_path)
-        self.import_simulation_data(experiment_path)
-        self.plate_edge_detection(folder_name)
-        self.find_thermocouples(folder_name)
-        self.plot_combined_linear_profile()
-
-        name_button_frame = ctk.CTkFrame(self.selected_experiments_listbox)
-        name_button_frame.folder_name = folder_name
-        name_button_frame.pack(fill='x', pady=1)
+            if folder_name in self.workspace:
+                continue
 
-        filename_label = ctk.CTkLabel(name_button_frame, text=folder_name)
-        filename_label.pack(side='left', fill='x', expand=True)
+            self.available_experiments_listbox.remove([folder_name])
+            if folder_name not in self.current_tabs:
+                self.experiments_tabs.add(folder_name)
+                self.current_tabs.add(folder_name)
 
-        remove_btn = ctk.CTkButton(name_button_frame, text='X', width=30, command=lambda f=name_button_frame: self.remove_selected_experiments_item(f))
-        remove_btn.pack(side='right')
+            experiment = self.workspace.add(folder_name)
+            experiment.scan_sources()
+            self.queue_experiment_load(folder_name, VIEW_SOURCES['heat_map'])
+            self.selected_experiments_listbox.insert(folder_name)
 
     def reset_workspace(self):
-        for widget in self.available_experiments_listbox.winfo_children():
-            widget.destroy()
-        for widget in self.selected_experiments_listbox.winfo_children():
-            widget.destroy()
+        self.available_experiments_listbox.set_items([])
+        self.selected_experiments_listbox.set_items([])
+        self.available_order = {}
+
+        self.live_followers.clear()
+        for tab in list(self.plot_views):
+            self.close_tab_views(tab)
 
         tabs_to_remove = [tab for tab in self.current_tabs if tab != 'Combined Plot']
         for tab in tabs_to_remove:
@@ -310,342 +436,325 @@ class IRISApp(ctk.CTk):
         self.current_tabs.clear()
         self.current_tabs.add('Combined Plot')
 
-        self.heat_map_data.clear()
-        self.heat_map_data_filenames.clear()
-        self.sensors_data.clear()
-        self.sensors_data_filenames.clear()
-        self.flir_chamfered_data.clear()
-        self.flir_chamfered_data_filenames.clear()
-        self.flir_filleted_data.clear()
-        self.flir_filleted_data_filenames.clear()
-        self.simulation_data.clear()
-        self.simulation_data_filesnames.clear()
-        self.left_edges.clear()
-        self.right_edges.clear()
-        self.top_edges.clear()
-        self.bottom_edges.clear()
-        self.midline.clear()
-        self.c_tc_location.clear()
-        self.f_tc_location.clear()
+        self.workspace.clear()
+        self.catalog = None
+        self.load_queue.clear()
+        self.load_states.clear()
+        self.aligning.clear()
+        self.requested_views.clear()
+        self.active_load = None
 
         self.dir_entry.delete(0, 'end')
 
         self.on_tab_change()
 
-        combined_tab_frame = self.experiments_tabs.tab('Combined Plot')
-        for widget in combined_tab_frame.winfo_children():
-            widget.destroy()
-
-        if 'Combined Plot' in self.current_plot_canvas:
-            del self.current_plot_canvas['Combined Plot']
-
-    def remove_selected_experiments_item(self, frame):
-        folder_name = getattr(frame, 'folder_name', None)
-        if folder_name and folder_name in self.current_tabs:
-            self.experiments_tabs.delete(folder_name)
-            self.current_tabs.remove(folder_name)
-            self.on_tab_change()
-
-        frame.destroy()
-
-        self.heat_map_data.pop(folder_name, None)
-        self.heat_map_data_filenames.pop(folder_name, None)
-        self.sensors_data.pop(folder_name, None)
-        self.sensors_data_filenames.pop(folder_name, None)
-        self.flir_chamfered_data.pop(folder_name, None)
-        self.flir_chamfered_data_filenames.pop(folder_name, None)
-        self.flir_filleted_data.pop(folder_name, None)
-        self.flir_filleted_data_filenames.pop(folder_name, None)
-        self.simulation_data.pop(folder_name, None)
-        self.simulation_data_filesnames.pop(folder_name, None)
-        self.left_edges.pop(folder_name, None)
-        self.right_edges.pop(folder_name, None)
-        self.top_edges.pop(folder_name, None)
-        self.bottom_edges.pop(folder_name, None)
-        self.midline.pop(folder_name, None)
-        self.c_tc_location.pop(folder_name, None)
-        self.f_tc_location.pop(folder_name, None)
-
-        self.plot_combined_linear_profile()
-        
-        # Collect existing folder names from available experiments buttons
-        available_folders = []
-        for widget in self.available_experiments_listbox.winfo_children():
-            if isinstance(widget, ctk.CTkButton):
-                available_folders.append(widget.cget("text"))
-                widget.destroy()  # Clear all buttons to rebuild sorted list
-
-        # Add the folder back
-        available_folders.append(folder_name)
-        available_folders = sorted(available_folders, key=str.lower)  # case-insensitive sort
-
-        # Recreate buttons in sorted order
-        for folder in available_folders:
-            btn = ctk.CTkButton(self.available_experiments_listbox,
-                                text=folder,
-                                command=lambda name=folder: self.add_to_selected_experiments(name))
-            btn.pack(fill='x', pady=1)
-
-
-# ============================ Data Import Functions ==========================
-    def import_heatmap(self, folder_path):
-        heat_map_file_name = config.REQUIRED_FILES['Heat Map']
-        experiment = os.path.basename(folder_path)
-        for file in heat_map_file_name:
-            file_path = os.path.join(folder_path, file)
-            if os.path.isfile(file_path):
-                try:
-                    self.heat_map_data[experiment] = pd.read_csv(file_path, header=None)
-                    self.heat_map_data_filenames[experiment] = file
-                    break
-                except Exception:
-                    continue
+    def remove_selected_experiments(self, folder_names):
+        for folder_name in folder_names:
+            self.live_followers.pop(folder_name, None)
+            self.close_tab_views(folder_name)
+            if folder_name in self.current_tabs:
+                self.experiments_tabs.delete(folder_name)
+                self.current_tabs.remove(folder_name)
+
+            self.selected_experiments_listbox.remove([folder_name])
+            self.workspace.remove(folder_name)
+            self.load_states.pop(folder_name, None)
+            self.requested_views.pop(folder_name, None)
+            if self.active_load and self.active_load['experiment'].name == folder_name:
+                self.active_load = None
+                self.start_next_load()
+
+            self.remove_combined_profile(folder_name)
+
+            # Back into its place in the available list, unless the current filter excludes it
+            if folder_name in self.available_order or self.catalog is None:
+                self.available_experiments_listbox.insert(folder_name)
+        self.on_tab_change()
+
+    def clear_cache(self):
+        self.workspace.clear_cache()
+
+    def export_report(self):
+        # Selected experiments, or every catalogued one when nothing is selected. The export
+        # re-reads them in worker processes (from the parsed cache) and renders with Agg.
+        root = self.workspace.root
+        if not root or self.export_report_button.cget('state') == 'disabled':
+            return
+        folder_names = self.selected_experiments_listbox.items or list(self.available_order) or self.workspace.available_experiments()
+        if not folder_names:
+            return
+        output_dir = filedialog.askdirectory(title='Export Report To')
+        if not output_dir:
+            return
 
+        from export import export_reports
+        self.export_report_button.configure(text='Exporting...', state='disabled')
+        future = self.load_pool.submit(export_reports, root, folder_names, output_dir, use_cache=self.workspace.use_cache,
+                                       progress=lambda done, total: self.export_results.put(('progress', (done, total))))
+        future.add_done_callback(lambda f: self.export_results.put(('done', f)))
+
+    def update_export_status(self, kind, value):
+        if kind == 'progress':
+            done, total = value
+            self.export_report_button.configure(text=f"Exporting {done}/{total}")
+            return
+        if value.exception() is not None:
+            text = 'Export Failed'
+        else:
+            _, results, failures = value.result()
+            text = f"Exported {len(results)}" + (f", {len(failures)} failed" if failures else '')
+        self.export_report_button.configure(text=text, state='normal')
+        self.after(config.EXPORT_STATUS_MS, lambda: self.export_report_button.configure(text='Export Report'))
+
+# ============================ Background Loading ==========================
+    def queue_experiment_load(self, folder_name, sources, urgent=False):
+        # Queues whichever of sources are on disk and not yet read or queued. Urgent requests
+        # (a view the user just asked for) go ahead of experiments still waiting for heat maps.
+        experiment = self.workspace.get(folder_name)
+        states = self.load_states.setdefault(folder_name, {})
+        sources = [source for source in sources if experiment.needs_source(source) and source not in states]
+        if not sources:
+            if not states:
+                self.load_states.pop(folder_name, None)
+            return
+        for source in sources:
+            states[source] = 'Queued'
+        if urgent:
+            self.load_queue.appendleft((folder_name, sources))
         else:
-            self.heat_map_data[experiment] = 'Heatmap Data File Not Found'
-            self.heat_map_data_filenames[experiment] = 'No File Found in Directory'
-
-    def import_sensors(self, folder_path):
-        sensors_file_name = config.REQUIRED_FILES['External Sensors, Arduino']
-        experiment = os.path.basename(folder_path)
-        for file in sensors_file_name:
-            file_path = os.path.join(folder_path, file)
-            if os.path.isfile(file_path):
+            self.load_queue.append((folder_name, sources))
+        self.start_next_load()
+        self.update_file_status()
+
+    def is_loading(self, folder_name, sources):
+        return any(source in self.load_states.get(folder_name, {}) for source in sources)
+
+    def request_view_sources(self, experiment, view_name):
+        # True when the view can be drawn now; otherwise its sources are queued and the view
+        # is shown when they arrive
+        sources = VIEW_SOURCES[view_name]
+        self.queue_experiment_load(experiment.name, sources, urgent=True)
+        if self.is_loading(experiment.name, sources):
+            self.requested_views[experiment.name] = view_name
+            return False
+        return True
+
+    def start_next_load(self):
+        while self.active_load is None and self.load_queue:
+            folder_name, sources = self.load_queue.popleft()
+            experiment = self.workspace.get(folder_name)
+            if experiment is None:
+                continue
+            sources = [source for source in sources if source not in experiment.loaded]
+            if not sources:
+                continue
+
+            group = TIMELINE.new_group(f"Load {experiment.name}")
+            self.active_load = {'experiment': experiment, 'pending': set(sources), 'group': group}
+            if group is not None:
+                self.last_load_group = group
+            for source in sources:
+                self.load_states.setdefault(experiment.name, {})[source] = 'Loading'
+                future = self.load_pool.submit(self.read_source_timed, experiment, source, group)
+                future.add_done_callback(lambda f, e=experiment, s=source: self.load_results.put((e, s, f)))
+
+    def read_source_timed(self, experiment, source, group):
+        # Runs on a worker; parser and cache spans inside read_source nest under this one
+        with span(f"read {source}", 'import', group=group):
+            return experiment.read_source(source)
+
+    def poll_load_results(self):
+        # Worker threads never touch Tk; their results are applied here on the main loop
+        try:
+            while True:
                 try:
-                    self.sensors_data[experiment] = pd.read_csv(file_path, sep=',', skiprows=2)
-                    self.sensors_data[experiment] = self.sensors_data[experiment].iloc[:-1, :]
-                    split_cols = self.sensors_data[experiment][self.sensors_data[experiment].columns[0]].str.replace('->', '', regex=False).str.split(' ', n=1, expand=True)
-                    self.sensors_data[experiment]['Absolute_Time'] = split_cols[0]
-                    self.sensors_data[experiment]['Elapsed_Time'] = split_cols[1]
-                    self.sensors_data[experiment] = self.sensors_data[experiment].drop(columns=self.sensors_data[experiment].columns[0])
-                    cols = ['Absolute_Time', 'Elapsed_Time'] + [col for col in self.sensors_data[experiment].columns if col not in ['Absolute_Time', 'Elapsed_Time']]
-                    self.sensors_data[experiment] = self.sensors_data[experiment][cols]
-                    self.sensors_data[experiment]['Absolute_Time'] = self.sensors_data[experiment]['Absolute_Time'].str.replace(r'(\d{2}:\d{2}:\d{2}):', r'\1.', regex=True)
-                    self.sensors_data[experiment]['Absolute_Time'] = pd.to_datetime(self.sensors_data[experiment]['Absolute_Time'],format='%H:%M:%S.%f').apply(lambda t: pd.Timestamp(year=1, month=1, day=1, hour=t.hour, minute=t.minute, second=t.second, microsecond=t.microsecond))
-                    self.sensors_data_filenames[experiment] = file
+                    experiment, source, future = self.load_results.get_nowait()
+                except queue.Empty:
                     break
-                except Exception:
-                    continue
-        else:
-            self.sensors_data[experiment] = 'Arduino Sensor Data File Not Found'
-            self.sensors_data_filenames[experiment] = 'No File Found in Directory'
-
-    def import_flir_chamfered(self, folder_path):
-        chamfered_flir_file_names = config.REQUIRED_FILES['Chamfered Side, Flir']
-        experiment = os.path.basename(folder_path)
-        for file in chamfered_flir_file_names:
-            file_path = os.path.join(folder_path, file)
-            if os.path.isfile(file_path):
+                self.finish_source_load(experiment, source, future)
+            while True:
                 try:
-                    df = pd.read_csv(file_path, sep='\t')
-                    df['time'] = pd.to_datetime(df['time'], format='%Y-%m-%d %H:%M:%S.%f') - pd.Timedelta(hours=5)
-                    df['time'] = df['time'].apply(
-                        lambda t: pd.Timestamp(year=1, month=1, day=1, hour=t.hour, minute=t.minute, second=t.second, microsecond=t.microsecond)
-                    )
-                    self.flir_chamfered_data[experiment] = df
-                    self.flir_chamfered_data_filenames[experiment] = file
+                    catalog, future = self.catalog_results.get_nowait()
+                except queue.Empty:
                     break
-                except Exception:
-                    continue
-        else:
-            self.flir_chamfered_data[experiment] = 'Chamfered Flir Data File Not Found'
-            self.flir_chamfered_data_filenames[experiment] = 'No File Found in Directory'
-
-    def import_flir_filleted(self, folder_path):
-        filleted_flir_file_names = config.REQUIRED_FILES['Filleted Side, Flir']
-        experiment = os.path.basename(folder_path)
-        for file in filleted_flir_file_names:
-            file_path = os.path.join(folder_path, file)
-            if os.path.isfile(file_path):
+                if catalog is self.catalog and future.exception() is None:
+                    self.populate_available_list()
+            while True:
                 try:
-                    df = pd.read_csv(file_path, sep='\t')
-                    df['time'] = pd.to_datetime(df['time'], format='%Y-%m-%d %H:%M:%S.%f') - pd.Timedelta(hours=5)
-                    df['time'] = df['time'].apply(
-                        lambda t: pd.Timestamp(year=1, month=1, day=1, hour=t.hour, minute=t.minute, second=t.second, microsecond=t.microsecond)
-                    )
-                    self.flir_filleted_data[experiment] = df
-                    self.flir_filleted_data_filenames[experiment] = file
+                    experiment, future = self.alignment_results.get_nowait()
+                except queue.Empty:
                     break
-                except Exception:
-                    continue
-        else:
-            self.flir_filleted_data[experiment] = 'Filleted Flir Data File Not Found'
-            self.flir_filleted_data_filenames[experiment] = 'No File Found in Directory'
-
-    def import_simulation_data(self, folder_path):
-        simulation_file_names = config.REQUIRED_FILES['Simulation Data']
-        experiment = os.path.basename(folder_path)
-        for file in simulation_file_names:
-            file_path = os.path.join(folder_path, file)
-            if os.path.isfile(file_path):
+                self.aligning.discard(experiment.name)
+                if future.exception() is not None:
+                    experiment.alignment_stats = {}  # Shown as no matching data rather than retried on every refresh
+                if self.workspace.get(experiment.name) is experiment and self.experiments_tabs.get() == experiment.name:
+                    self.update_file_status()
+            while True:
                 try:
-                    with open(file_path, 'r') as temp_file:
-                        df = temp_file.read()          
-                                
-                    lines = df.strip().split('\n')
-                    lines = lines[1:-1]
-                    locations = []
-                    temperatures = []
-
-                    for line in lines:
-                        parts = line.strip().split('\t')
-                        if len(parts) == 2:
-                            loc = float(parts[0])
-                            temp = float(parts[1])
-                            locations.append(loc)
-                            temperatures.append(temp)
-
-                    df = pd.DataFrame({'Location': locations,
-                                        'Temperature': temperatures})
-                    
-
-                    min_pos = df['Location'].min()
-                    max_pos = df['Location'].max()
-                    df['Location'] = ((df['Location'] - min_pos) / (max_pos - min_pos)) * config.FIN_HEIGHT
-
-                    df['Temperature'] = df['Temperature']-273.15
-                    
-                    self.simulation_data[experiment] = df
-                    self.simulation_data_filesnames[experiment] = file
+                    kind, value = self.export_results.get_nowait()
+                except queue.Empty:
                     break
-                except Exception:
-                    continue
-        else:
-            self.simulation_data[experiment] = 'Simulation Data File Not Found'
-            self.simulation_data_filesnames[experiment] = 'No File Found in Directory'
-
-    def plate_edge_detection(self, folder_name):
-        if folder_name not in self.heat_map_data or isinstance(self.heat_map_data[folder_name], str):
-            return
-
-        rows, cols = self.heat_map_data[folder_name].shape
-        left_edge_locations = []
-        right_edge_locations = []
-        top_edge_locations = []
-        bottom_edge_locations = []
-
-        for y in range(rows):
-            row = self.heat_map_data[folder_name].iloc[y, :].values
-            gradients = np.gradient(row)
-
-            left_index = np.argmax(gradients)
-            right_index = np.argmin(gradients)
-
-            left_edge_locations.append(left_index)
-            right_edge_locations.append(right_index)
-
-        self.left_edges[folder_name] = statistics.mode(left_edge_locations)
-        self.right_edges[folder_name] = statistics.mode(right_edge_locations)
-
-        for x in range(self.left_edges[folder_name],self.right_edges[folder_name]):
-            column = self.heat_map_data[folder_name].iloc[:,x].values
-            top_window = column[:config.EDGE_SENSITIVITY]
-            bottom_window = column[-config.EDGE_SENSITIVITY:]
-
-            top_gradients = np.gradient(top_window)
-            top_index = np.argmax(top_gradients)
-
-            bottom_gradients = np.gradient(bottom_window)
-            bottom_index = len(column) - config.EDGE_SENSITIVITY + np.argmin(bottom_gradients)
-
-            top_edge_locations.append(top_index)
-            bottom_edge_locations.append(bottom_index)
-
-        self.top_edges[folder_name] = statistics.mode(top_edge_locations)
-        self.bottom_edges[folder_name] = statistics.mode(bottom_edge_locations)
-
-        self.midline[folder_name] = (self.right_edges[folder_name] + self.left_edges[folder_name]) / 2
-
-    def find_thermocouples(self, folder_name):
-        if folder_name not in self.heat_map_data or isinstance(self.heat_map_data[folder_name], str):
-            return
-        
-        chamfered_x_pixels = math.trunc(((config.FIN_WIDTH-config.TC_C_HLOC)/config.FIN_WIDTH)*(self.right_edges[folder_name]-self.left_edges[folder_name]+1))+self.left_edges[folder_name]
-        chamfered_y_pixels = math.trunc((config.TC_C_VLOC/config.FIN_HEIGHT)*(self.bottom_edges[folder_name]-self.top_edges[folder_name]+1))+self.top_edges[folder_name]
-        self.c_tc_location[folder_name] = (chamfered_x_pixels, chamfered_y_pixels)
-
-        filleted_x_pixels = math.trunc(((config.FIN_WIDTH-config.TC_F_HLOC)/config.FIN_WIDTH)*(self.right_edges[folder_name]-self.left_edges[folder_name]+1))+self.left_edges[folder_name]
-        filleted_y_pixels = math.trunc(((config.FIN_HEIGHT-config.TC_F_VLOC)/config.FIN_HEIGHT)*(self.bottom_edges[folder_name]-self.top_edges[folder_name]+1))+self.top_edges[folder_name]
-        self.f_tc_location[folder_name] = (filleted_x_pixels, filleted_y_pixels)
-
+                self.update_export_status(kind, value)
+        finally:
+            self.load_poll_id = self.after(config.LOAD_POLL_MS, self.poll_load_results)
+
+    def finish_source_load(self, experiment, source, future):
+        if self.active_load is None or self.active_load['experiment'] is not experiment:
+            return  # Experiment was removed or the workspace was reset while loading
+
+        # Analysis and any views drawn for this source count towards the load's breakdown
+        with span(f"apply {source}", 'load', group=self.active_load['group']):
+            try:
+                data, file = future.result()
+            except Exception:
+                data, file = None, None
+            experiment.set_source(source, data, file)
+            states = self.load_states.get(experiment.name, {})
+            states.pop(source, None)
+            if not states:
+                self.load_states.pop(experiment.name, None)
+            self.active_load['pending'].discard(source)
+
+            if not self.active_load['pending']:
+                self.active_load = None
+                self.start_next_load()
+
+            is_current_tab = self.experiments_tabs.get() == experiment.name
+            requested_view = self.requested_views.get(experiment.name)
+            if requested_view and not self.is_loading(experiment.name, VIEW_SOURCES[requested_view]):
+                del self.requested_views[experiment.name]
+                if is_current_tab and requested_view == 'temporal':
+                    self.plot_temporal_data()
+            if source == SIMULATION:
+                # A profile drawn before the simulation arrived lacks its overlay; rebuild it
+                was_showing = self.active_views.get(experiment.name) == 'linear_profile'
+                self.close_view(experiment.name, 'linear_profile')
+                if was_showing and is_current_tab:
+                    self.plot_linear_profile()
+            if source in (HEAT_MAP, HEAT_MAP_SEQUENCE) and experiment.has_heat_map():
+                # Either can supply the reference frame, and a sequence adds the frame slider
+                was_showing = self.active_views.get(experiment.name) == 'linear_profile'
+                experiment.analyze()
+                self.close_view(experiment.name, 'heat_map')
+                self.close_view(experiment.name, 'linear_profile')
+                self.add_combined_profile(experiment)
+                if is_current_tab:
+                    self.plot_linear_profile() if was_showing else self.plot_heat_map()
+
+            if source in (SIMULATION, HEAT_MAP, HEAT_MAP_SEQUENCE) and self.rank_by_simulation_checkbox.get() == 1:
+                self.update_combined_ranking()
+
+            if is_current_tab:
+                self.update_file_status()
+        self.update_timing_breakdown()
+        self.enforce_memory_budget()
+
+# ============================ Memory Budget ==========================
+    def figure_bytes(self):
+        import plots
+        return {tab_name: sum(plots.figure_nbytes(view['fig']) for view in views.values())
+                for tab_name, views in self.plot_views.items()}
+
+    def enforce_memory_budget(self):
+        # Hidden experiments lose their raw data and figures, least recently viewed first.
+        # Their heat maps are re-read when the tab is opened again (see on_tab_change).
+        figures = self.figure_bytes()
+        if config.MEMORY_BUDGET_MB:
+            keep = {self.experiments_tabs.get()} | set(self.load_states) | self.aligning
+            if self.active_load is not None:
+                keep.add(self.active_load['experiment'].name)
+            evicted = self.workspace.enforce_budget(config.MEMORY_BUDGET_MB * 1024 * 1024, keep, figures)
+            for folder_name in evicted:
+                self.close_tab_views(folder_name)
+                figures.pop(folder_name, None)
+        self.update_memory_usage(figures)
+
+    def update_memory_usage(self, figures):
+        megabyte = 1024 * 1024
+        rows = [(name, used['data'], used['derived'], figures.get(name, 0)) for name, used in self.workspace.memory_usage().items()]
+        rows.sort(key=lambda row: -sum(row[1:]))
+        total = sum(sum(row[1:]) for row in rows) + figures.get('Combined Plot', 0)
+        budget = f" / {config.MEMORY_BUDGET_MB}" if config.MEMORY_BUDGET_MB else ''
+        lines = [f"{'Total':<14}{total / megabyte:>9.0f}{budget} MB"]
+        if 'Combined Plot' in figures:
+            lines.append(f"{'Combined Plot':<14}{'':>10}{'':>5}{figures['Combined Plot'] / megabyte:5.0f}")
+        for name, data, derived, figure in rows:
+            lines.append(f"{name[:14]:<14}{data / megabyte:5.0f}{derived / megabyte:5.0f}{figure / megabyte:5.0f}")
+
+        self.memory_usage.configure(state='normal')
+        self.memory_usage.delete('1.0', 'end')
+        self.memory_usage.insert('1.0', '\n'.join(lines))
+        self.memory_usage.configure(state='disabled')
 
 # ============================ UI Update Functions ==========================
     def on_tab_change(self):
         tab_name = self.experiments_tabs.get()
-        heatmap_box_color = ''
-        sensors_box_color = ''
-        chamfered_box_color = ''
-        filleted_box_color = ''
+        if tab_name in self.live_followers:
+            self.follow_live_checkbox.select()
+        else:
+            self.follow_live_checkbox.deselect()
+        if tab_name in self.workspace:
+            # Re-reads the heat map if the memory budget evicted it; a no-op otherwise
+            self.workspace.touch(tab_name)
+            self.queue_experiment_load(tab_name, VIEW_SOURCES['heat_map'], urgent=True)
+        self.update_file_status()
+        self.plot_heat_map()
+        self.enforce_memory_budget()
 
-        # Heatmap file
+    def file_status(self, tab_name, source, missing_text):
         if tab_name == 'Combined Plot':
-            heatmap_status = 'N/A'
-            heatmap_box_color = 'grey'
-            chamfered_text = 'No Heatmap Selected'
-            filleted_text = 'No Heatmap Selected'
-        elif tab_name in self.heat_map_data_filenames and self.heat_map_data_filenames[tab_name] != 'No File Found in Directory':
-            heatmap_status = self.heat_map_data_filenames[tab_name]
-            heatmap_box_color = 'green'
-            chamfered_coords = self.c_tc_location[tab_name]
-            filleted_coords = self.f_tc_location[tab_name]
+            return 'N/A', 'grey'
+
+        load_state = self.load_states.get(tab_name, {}).get(source)
+        if load_state in ('Queued', 'Loading'):
+            return f"{load_state}...", 'orange'
+
+        experiment = self.workspace.get(tab_name)
+        if experiment is None:
+            return missing_text, 'red'
+        follower = self.live_followers.get(tab_name)
+        if follower is not None and source in follower.errors:
+            return f"Live lines skipped: {follower.errors[source]}", 'red'
+        if experiment.filenames.get(source):
+            return experiment.filenames[source], 'green'
+        found_file = experiment.found_files.get(source)
+        if found_file and source in experiment.loaded:
+            return f"{found_file} (Unreadable)", 'red'
+        if found_file:
+            return found_file, 'green'  # Present on disk; read when a view needs it
+        return missing_text, 'red'
+
+    def update_file_status(self):
+        tab_name = self.experiments_tabs.get()
+        experiment = self.workspace.get(tab_name)
+
+        heatmap_status, heatmap_box_color = self.file_status(tab_name, HEAT_MAP, 'Heatmap Not Found')
+        sequence_status, sequence_box_color = self.file_status(tab_name, HEAT_MAP_SEQUENCE, 'Frame Sequence Not Found')
+        sensors_status, sensors_box_color = self.file_status(tab_name, SENSORS, 'Sensor Data Not Found')
+        chamfered_status, chamfered_box_color = self.file_status(tab_name, CHAMFERED_FLIR, 'Chamfered FLIR Data Not Found')
+        filleted_status, filleted_box_color = self.file_status(tab_name, FILLETED_FLIR, 'Filleted FLIR Data Not Found')
+        simulation_file_status, simulation_file_box_color = self.file_status(tab_name, SIMULATION, 'Simulation Results Not Found')
+
+        if experiment is not None and experiment.c_tc_location is not None:
+            chamfered_coords = experiment.c_tc_location
+            filleted_coords = experiment.f_tc_location
             chamfered_text = f"({chamfered_coords[0]}, {chamfered_coords[1]})"
             filleted_text = f"({filleted_coords[0]}, {filleted_coords[1]})"
         else:
-            heatmap_status = 'Heatmap Not Found'
-            heatmap_box_color = 'red'
             chamfered_text = 'No Heatmap Selected'
             filleted_text = 'No Heatmap Selected'
 
-        # Sensors file
-        if tab_name == 'Combined Plot':
-            sensors_status = 'N/A'
-            sensors_box_color = 'grey'
-        elif tab_name in self.sensors_data_filenames and self.sensors_data_filenames[tab_name] != 'No File Found in Directory':
-            sensors_status = self.sensors_data_filenames[tab_name]
-            sensors_box_color = 'green'
-        else:
-            sensors_status = 'Sensor Data Not Found'
-            sensors_box_color = 'red'
-
-        # Chamfered FLIR data
-        if tab_name == 'Combined Plot':
-            chamfered_status = 'N/A'
-            chamfered_box_color = 'grey'
-        elif tab_name in self.flir_chamfered_data_filenames and self.flir_chamfered_data_filenames[tab_name] != 'No File Found in Directory':
-            chamfered_status = self.flir_chamfered_data_filenames[tab_name]
-            chamfered_box_color = 'green'
-        else:
-            chamfered_status = 'Chamfered FLIR Data Not Found'
-            chamfered_box_color = 'red'
-
-        # Filleted FLIR data
-        if tab_name == 'Combined Plot':
-            filleted_status = 'N/A'
-            filleted_box_color = 'grey'
-        elif tab_name in self.flir_filleted_data_filenames and self.flir_filleted_data_filenames[tab_name] != 'No File Found in Directory':
-            filleted_status = self.flir_filleted_data_filenames[tab_name]
-            filleted_box_color = 'green'
-        else:
-            filleted_status = 'Filleted FLIR Data Not Found'
-            filleted_box_color = 'red'
-
-        # Simulation data
-        if tab_name == 'Combined Plot':
-            simulation_file_status = 'N/A'
-            simulation_file_box_color = 'grey'
-        elif tab_name in self.simulation_data_filesnames and self.simulation_data_filesnames[tab_name] != 'No File Found in Directory':
-            simulation_file_status = self.simulation_data_filesnames[tab_name]
-            simulation_file_box_color = 'green'
-        else:
-            simulation_file_status = 'Simulation Results Not Found'
-            simulation_file_box_color = 'red'
-
         # Update entries
         self.heatmap_file_label.configure(state='normal')
         self.heatmap_file_label.delete(0, 'end')
         self.heatmap_file_label.insert(0, heatmap_status)
         self.heatmap_file_label.configure(state='disabled', fg_color=heatmap_box_color)
 
+        self.sequence_file_label.configure(state='normal')
+        self.sequence_file_label.delete(0, 'end')
+        self.sequence_file_label.insert(0, sequence_status)
+        self.sequence_file_label.configure(state='disabled', fg_color=sequence_box_color)
+
         self.sensors_file_label.configure(state='normal')
         self.sensors_file_label.delete(0, 'end')
         self.sensors_file_label.insert(0, sensors_status)
@@ -676,358 +785,342 @@ class IRISApp(ctk.CTk):
         self.filleted_tc_location.insert(0, filleted_text)
         self.filleted_tc_location.configure(state='disabled')
 
-        self.plot_heat_map()
+        # Sensor and FLIR logs are read with the temporal view; aligning them can take seconds,
+        # so it runs on load_pool and this shows the result once it is there
+        error_stats = experiment.alignment_stats if experiment is not None else None
+        aligning = error_stats is None and self.queue_alignment(experiment)
+        for side, entry in (('chamfered', self.chamfered_error), ('filleted', self.filleted_error)):
+            if aligning:
+                error_text = 'Aligning...'
+            elif error_stats is None:
+                error_text = 'Plot Temporal Data'
+            elif side in error_stats:
+                error_text = f"{error_stats[side]['mean_error_c']:+.2f} / {error_stats[side]['rmse_c']:.2f}"
+            else:
+                error_text = 'No Matching FLIR Data'
+            entry.configure(state='normal')
+            entry.delete(0, 'end')
+            entry.insert(0, error_text)
+            entry.configure(state='disabled')
+
+    def queue_alignment(self, experiment):
+        # True while the experiment's alignment is running; started here if it can be
+        if experiment is None or experiment.name in self.aligning:
+            return experiment is not None
+        if not experiment.has_alignment_data() or self.is_loading(experiment.name, VIEW_SOURCES['temporal']):
+            return False
+        self.aligning.add(experiment.name)
+        future = self.load_pool.submit(self.align_timed, experiment, self.last_load_group)
+        future.add_done_callback(lambda f: self.alignment_results.put((experiment, f)))
+        return True
+
+    def align_timed(self, experiment, group):
+        with span('align sensors / FLIR', 'analysis', group=group):
+            return experiment.alignment_error_stats()
+
+    def update_timing_breakdown(self):
+        if self.last_load_group is None:
+            return
+        wall_s, stages = TIMELINE.breakdown(self.last_load_group)
+        lines = [TIMELINE.groups.get(self.last_load_group, ''), f"{'wall time':<21}{wall_s * 1e3:8.1f} ms"]
+        for depth, name, count, total_s in stages:
+            label = '  ' * depth + name
+            lines.append(f"{label[:21]:<21}{total_s * 1e3:8.1f} ms" + (f" x{count}" if count > 1 else ''))
+
+        self.timing_breakdown.configure(state='normal')
+        self.timing_breakdown.delete('1.0', 'end')
+        self.timing_breakdown.insert('1.0', '\n'.join(lines))
+        self.timing_breakdown.configure(state='disabled')
+
+    def export_timing(self):
+        file_path = filedialog.asksaveasfilename(title='Export Timing Trace', defaultextension='.json', initialfile='iris_trace.json',
+                                                 filetypes=[('Chrome trace (JSON)', '*.json')])
+        if file_path:
+            TIMELINE.export(file_path)
+
+# ============================ Plot View Management ==========================
+    # Each tab keeps one persistent figure per view; switching views repacks the existing
+    # canvas and the checkboxes only toggle artist visibility.
+    def get_view(self, tab_name, view_name, builder):
+        from matplotlib.figure import Figure
+        from canvas import TimedCanvas
+        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+        views = self.plot_views.setdefault(tab_name, {})
+        if view_name not in views:
+            fig = Figure(figsize=config.FIGURE_SIZE)
+            with span(f"draw {view_name}", 'plot'):
+                artists = builder(fig)
+            master_frame = self.experiments_tabs.tab(tab_name)
+            canvas = TimedCanvas(fig, master=master_frame)
+            canvas.timing_group = TIMELINE.current_group()
+            canvas.on_first_draw = self.update_timing_breakdown
+            toolbar = NavigationToolbar2Tk(canvas, master_frame, pack_toolbar=False)
+            toolbar.update()
+            views[view_name] = {'fig': fig, 'canvas': canvas, 'toolbar': toolbar, 'artists': artists}
+        return views[view_name]
+
+    def show_view(self, tab_name, view_name):
+        views = self.plot_views[tab_name]
+        active_view = self.active_views.get(tab_name)
+        if active_view != view_name:
+            if active_view in views:
+                views[active_view]['canvas'].get_tk_widget().pack_forget()
+                views[active_view]['toolbar'].pack_forget()
+                if 'controls' in views[active_view]:
+                    views[active_view]['controls'].pack_forget()
+            views[view_name]['canvas'].get_tk_widget().pack(fill='both', expand=True)
+            views[view_name]['toolbar'].pack()
+            if 'controls' in views[view_name]:
+                views[view_name]['controls'].pack(fill='x', padx=5, pady=5)
+            self.active_views[tab_name] = view_name
+        views[view_name]['canvas'].draw_idle()
+        return views[view_name]
+
+    def close_view(self, tab_name, view_name):
+        view = self.plot_views.get(tab_name, {}).pop(view_name, None)
+        if view is None:
+            return
+        if self.active_views.get(tab_name) == view_name:
+            del self.active_views[tab_name]
+        if 'cursor' in view:
+            view['cursor'].disconnect()
+        view['canvas'].get_tk_widget().destroy()
+        view['toolbar'].destroy()
+        if 'controls' in view:
+            view['controls'].destroy()
+        view['fig'].clear()  # Break artist/data references so the arrays can be freed
+
+    def close_tab_views(self, tab_name):
+        for view_name in list(self.plot_views.get(tab_name, {})):
+            self.close_view(tab_name, view_name)
+        self.plot_views.pop(tab_name, None)
+        self.active_views.pop(tab_name, None)
+        self.hover_heights.pop(tab_name, None)
 
 # ============================ Plot Functions ==========================
-    def plot_heat_map(self):
+    def get_plottable_experiment(self):
         tab_name = self.experiments_tabs.get()
+        experiment = self.workspace.get(tab_name)
+        if experiment is None or not experiment.has_heat_map():
+            return None
+        return experiment
 
-        if tab_name not in self.heat_map_data or isinstance(self.heat_map_data[tab_name], str):
+    def plot_heat_map(self):
+        import plots
+        experiment = self.get_plottable_experiment()
+        if experiment is None:
             return
 
-        if tab_name in self.current_plot_canvas:
-            self.current_plot_canvas[tab_name]['canvas'].get_tk_widget().destroy()
-            self.current_plot_canvas[tab_name]['toolbar'].destroy()
-
-        data = self.heat_map_data[tab_name]
-
-        fig, ax = plt.subplots(figsize=config.FIGURE_SIZE)
-        cax = ax.imshow(data, cmap='jet', origin='lower', aspect='auto')
-        fig.colorbar(cax, ax=ax, label='Temperature (°C)')
-
-        ax.set_title(f"Heat Map: {tab_name}")
-        ax.set_xlabel('X (pixels)')
-        ax.set_ylabel('Y (pixels)')
-        ax.invert_yaxis()
-
-        ax.text(0.99, 0.99, 'Chamfered Side', transform=ax.transAxes,
-            fontsize=10, color='white', verticalalignment='top', horizontalalignment='right')
-
-        ax.text(0.99, 0.01, 'Filleted Side', transform=ax.transAxes,
-            fontsize=10, color='white', verticalalignment='bottom', horizontalalignment='right')
-
-        if self.fin_box_checkbox.get() == 1:
-            plot_color = 'black'
-            line_thickness = 1
-            line_style = '--'  # Dashed lines
-
-            # Top edge
-            ax.plot(
-                [self.left_edges[tab_name], self.right_edges[tab_name]],
-                [self.top_edges[tab_name], self.top_edges[tab_name]],
-                color=plot_color, linewidth=line_thickness, linestyle=line_style
-            )
-
-            # Bottom edge
-            ax.plot(
-                [self.left_edges[tab_name], self.right_edges[tab_name]],
-                [self.bottom_edges[tab_name], self.bottom_edges[tab_name]],
-                color=plot_color, linewidth=line_thickness, linestyle=line_style
-            )
-
-            # Left edge
-            ax.plot(
-                [self.left_edges[tab_name], self.left_edges[tab_name]],
-                [self.top_edges[tab_name], self.bottom_edges[tab_name]],
-                color=plot_color, linewidth=line_thickness, linestyle=line_style
-            )
-
-            # Right edge
-            ax.plot(
-                [self.right_edges[tab_name], self.right_edges[tab_name]],
-                [self.top_edges[tab_name], self.bottom_edges[tab_name]],
-                color=plot_color, linewidth=line_thickness, linestyle=line_style
-            )
-
-        if self.midline_checkbox.get() == 1:
-            plot_color = 'white'
-            line_thickness = 1
-            line_style = '--'  # Dashed line
-
-            ax.plot(
-                [self.midline[tab_name], self.midline[tab_name]],
-                [self.top_edges[tab_name]-5, self.bottom_edges[tab_name]+5],
-                color=plot_color, linewidth=line_thickness, linestyle=line_style
-            )
-
-        if self.thermocouples_checkbox.get() == 1:
-            box_size = 8
-            half_box = box_size // 2
-            
-            # Chamfered TC
-            if tab_name in self.c_tc_location:
-                chamfered_x, chamfered_y = self.c_tc_location[tab_name]
-                rect_c = plt.Rectangle(
-                    (chamfered_x - half_box, chamfered_y - half_box),
-                    box_size, box_size,
-                    linewidth=2,
-                    edgecolor='darkgreen',
-                    facecolor='none'
-                )
-                ax.add_patch(rect_c)
-
-            # Filleted TC
-            if tab_name in self.f_tc_location:
-                filleted_x, filleted_y = self.f_tc_location[tab_name]
-                rect_f = plt.Rectangle(
-                    (filleted_x - half_box, filleted_y - half_box),
-                    box_size, box_size,
-                    linewidth=2,
-                    edgecolor='darkblue',
-                    facecolor='none'
-                )
-                ax.add_patch(rect_f)
-
-        master_frame = self.experiments_tabs.tab(tab_name)
-
-        canvas = FigureCanvasTkAgg(fig, master=master_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
-
-        toolbar = NavigationToolbar2Tk(canvas, master_frame)
-        toolbar.update()
-        toolbar.pack()
-
-        self.current_plot_canvas[tab_name] = {'canvas': canvas, 'toolbar': toolbar}
+        tab_name = experiment.name
+        is_new = 'heat_map' not in self.plot_views.get(tab_name, {})
+        view = self.get_view(tab_name, 'heat_map', lambda fig: plots.draw_heat_map(fig, experiment))
+        if is_new:
+            view['cursor'] = plots.HeatMapCursor(view['canvas'], view['artists'], experiment,
+                                                 on_hover=lambda y_mm: self.update_profile_marker(tab_name, y_mm))
+            if experiment.frame_count() > 1:
+                self.build_frame_slider(view, experiment)
+        plots.set_overlay_visibility(view['artists'], {
+            'fin_box': self.fin_box_checkbox.get() == 1,
+            'midline': self.midline_checkbox.get() == 1,
+            'thermocouples': self.thermocouples_checkbox.get() == 1,
+        })
+        self.show_view(experiment.name, 'heat_map')
+
+    def build_frame_slider(self, view, experiment):
+        frame_count = experiment.frame_count()
+        # Found once: a sequence exported at another resolution has its own fin edges
+        edges = experiment.sequence_edges()
+        view['sequence_geometry'] = (edges, experiment.sequence_thermocouples(edges))
+        controls = ctk.CTkFrame(self.experiments_tabs.tab(experiment.name))
+        frame_label = ctk.CTkLabel(controls, width=120)
+        frame_label.pack(side='left', padx=5)
+        slider = ctk.CTkSlider(controls, from_=0, to=frame_count - 1, number_of_steps=frame_count - 1,
+                               command=lambda value: self.show_heat_map_frame(view, experiment, value))
+        slider.pack(side='left', fill='x', expand=True, padx=5)
+
+        reference_index = config.REFERENCE_FRAME % frame_count
+        slider.set(reference_index)
+        view['controls'], view['frame_label'] = controls, frame_label
+        frame_label.configure(text=f"Frame {reference_index + 1} / {frame_count}")
+
+    def show_heat_map_frame(self, view, experiment, value):
+        import plots
+        index = int(round(value))
+        if index == view.get('frame_index'):
+            return
+        view['frame_index'] = index
+        plots.set_heat_map_frame(view['artists'], experiment.heat_map_frames[index], *view['sequence_geometry'])
+        view['frame_label'].configure(text=f"Frame {index + 1} / {experiment.frame_count()}")
+        view['canvas'].draw_idle()
 
     def plot_linear_profile(self):
-        tab_name = self.experiments_tabs.get()
-        if tab_name not in self.heat_map_data or isinstance(self.heat_map_data[tab_name], str):
+        import plots
+        experiment = self.get_plottable_experiment()
+        if experiment is None:
             return
 
-        if tab_name in self.current_plot_canvas:
-            self.current_plot_canvas[tab_name]['canvas'].get_tk_widget().destroy()
-            self.current_plot_canvas[tab_name]['toolbar'].destroy()
-
-        data = self.heat_map_data[tab_name]
-
-        mid_x = int((self.right_edges[tab_name] + self.left_edges[tab_name]) / 2)
-
-        temperature_profile = data.iloc[self.top_edges[tab_name]:self.bottom_edges[tab_name], mid_x].values
-
-        num_points = len(temperature_profile)
-        y_positions_mm = np.linspace(0, config.FIN_HEIGHT, num_points)
-
-        fig, ax = plt.subplots(figsize=config.FIGURE_SIZE)
-        ax.plot(y_positions_mm, temperature_profile, color='red', linewidth=2, label='Experimental Temperature Profile')
-
-        if (self.simulation_checkbox.get() == 1
-            and isinstance(self.simulation_data[tab_name], pd.DataFrame)
-            and not self.simulation_data[tab_name].empty
-        ):
-            ax.plot(self.simulation_data[tab_name]['Location'], self.simulation_data[tab_name]['Temperature'], color='blue', linewidth=2, label='Simulated Temperature Profile')
-
-        ax.set_title(f"Linear Temperature Profile at Midline: {tab_name}")
-        ax.set_xlabel('Fin Height (mm)')
-        ax.set_xlim(0, config.FIN_HEIGHT)
-        y_min = temperature_profile.min() - 5
-        y_max = temperature_profile.max() + 5
-        ax.set_ylim(y_min, y_max)
-        ax.set_ylabel('Temperature (°C)')
-        ax.grid(True)
-
-        ax.text(0.01, 0.99, 'Chamfered Side', transform=ax.transAxes,
-            fontsize=10, color='black', verticalalignment='top', horizontalalignment='left')
-
-        ax.text(0.99, 0.99, 'Filleted Side', transform=ax.transAxes,
-            fontsize=10, color='black', verticalalignment='top', horizontalalignment='right')
-
-        ax.legend(loc='lower right')
-
-        master_frame = self.experiments_tabs.tab(tab_name)
-
-        canvas = FigureCanvasTkAgg(fig, master=master_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
-
-        toolbar = NavigationToolbar2Tk(canvas, master_frame)
-        toolbar.update()
-        toolbar.pack()
-
-        self.current_plot_canvas[tab_name] = {'canvas': canvas, 'toolbar': toolbar}
-
+        # Drawn right away; the simulation overlay is added when its file has been read
+        self.queue_experiment_load(experiment.name, VIEW_SOURCES['linear_profile'], urgent=True)
+        view = self.get_view(experiment.name, 'linear_profile', lambda fig: plots.draw_linear_profile(fig, experiment))
+        plots.set_overlay_visibility(view['artists'], {'simulation': self.simulation_checkbox.get() == 1})
+        if experiment.name in self.hover_heights:
+            plots.set_hover_marker(view['artists'], self.hover_heights[experiment.name])
+        self.show_view(experiment.name, 'linear_profile')
+
+    def update_profile_marker(self, tab_name, y_mm):
+        import plots
+        self.hover_heights[tab_name] = y_mm
+        view = self.plot_views.get(tab_name, {}).get('linear_profile')
+        if view is not None:
+            plots.set_hover_marker(view['artists'], y_mm)
+
+    # The combined figure is built once; experiments add or remove only their own profile
     def plot_combined_linear_profile(self):
+        import plots
         combined_tab_name = 'Combined Plot'
 
-        # Clean up old plots in the Combined tab
-        if combined_tab_name in self.current_plot_canvas:
-            self.current_plot_canvas[combined_tab_name]['canvas'].get_tk_widget().destroy()
-            self.current_plot_canvas[combined_tab_name]['toolbar'].destroy()
-
-        fig, ax = plt.subplots(figsize=config.FIGURE_SIZE)
-
-        colors = ['red', 'blue', 'green', 'purple', 'orange', 'cyan', 'magenta', 'yellow', 'black', 'brown']
-        color_index = 0
-
-        for experiment in self.current_tabs:
-            if experiment == 'Combined Plot':
-                continue
-            if experiment not in self.heat_map_data or isinstance(self.heat_map_data[experiment], str):
-                continue
-
-            data = self.heat_map_data[experiment]
-
-            # Plot midline profile for each experiment
-            mid_x = int((self.right_edges[experiment] + self.left_edges[experiment]) / 2)
-            temperature_profile = data.iloc[self.top_edges[experiment]:self.bottom_edges[experiment], mid_x].values
-            num_points = len(temperature_profile)
-            y_positions_mm = np.linspace(0, config.FIN_HEIGHT, num_points)
-
-            ax.plot(y_positions_mm, temperature_profile, label=experiment, color=colors[color_index % len(colors)])
-            color_index += 1
-
-        ax.set_title('Combined Linear Temperature Profiles')
-        ax.set_xlabel('Fin Height (mm)')
-        ax.set_xlim(0, config.FIN_HEIGHT)
-        ax.set_ylabel('Temperature (°C)')
-        ax.grid(True)
-        handles, labels = ax.get_legend_handles_labels()
-        if labels:
-                ax.legend(loc='upper right')
-
-        ax.text(0.01, 0.01, 'Chamfered Side', transform=ax.transAxes,
-                fontsize=10, color='black', verticalalignment='bottom', horizontalalignment='left')
-        ax.text(0.99, 0.01, 'Filleted Side', transform=ax.transAxes,
-                fontsize=10, color='black', verticalalignment='bottom', horizontalalignment='right')
-
-        master_frame = self.experiments_tabs.tab(combined_tab_name)
-
-        canvas = FigureCanvasTkAgg(fig, master=master_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
-
-        toolbar = NavigationToolbar2Tk(canvas, master_frame)
-        toolbar.update()
-        toolbar.pack()
-
-        self.current_plot_canvas[combined_tab_name] = {'canvas': canvas, 'toolbar': toolbar}
-
+        experiments = [experiment for experiment in self.workspace if experiment.name in self.current_tabs and experiment.has_profile()]
+        show_bands = self.combined_bands_checkbox.get() == 1
+        self.get_view(combined_tab_name, 'combined', lambda fig: plots.draw_combined_profiles(fig, experiments, show_bands))
+        return self.show_view(combined_tab_name, 'combined')
+
+    def add_combined_profile(self, experiment):
+        import plots
+        view = self.plot_combined_linear_profile()
+        plots.add_combined_profile(view['artists'], experiment)
+
+    def update_combined_ranking(self):
+        # Ranking needs every experiment's simulation, which is otherwise only read for the
+        # profile view; they are queued here and the ranking refreshes as each arrives
+        import plots
+        scores = {}
+        if self.rank_by_simulation_checkbox.get() == 1:
+            for experiment in self.workspace:
+                comparison = experiment.simulation_comparison()
+                if comparison is not None:
+                    scores[experiment.name] = comparison['rmse_c']  # Kept even after the raw data is evicted
+                else:
+                    self.queue_experiment_load(experiment.name, VIEW_SOURCES['linear_profile'])
+        view = self.plot_combined_linear_profile()
+        plots.set_combined_scores(view['artists'], scores)
+
+    def update_combined_bands(self):
+        # Every profile is resampled onto a common grid and summarized; outliers stay as lines
+        import plots
+        view = self.plot_combined_linear_profile()
+        plots.set_combined_bands(view['artists'], self.combined_bands_checkbox.get() == 1)
+
+    def remove_combined_profile(self, folder_name):
+        import plots
+        view = self.plot_combined_linear_profile()
+        plots.remove_combined_profile(view['artists'], folder_name)
 
     def plot_temporal_data(self):
+        import plots
         tab_name = self.experiments_tabs.get()
-
-        if tab_name not in self.heat_map_data or isinstance(self.heat_map_data[tab_name], str):
-            return
-
-        if tab_name in self.current_plot_canvas:
-            self.current_plot_canvas[tab_name]['canvas'].get_tk_widget().destroy()
-            self.current_plot_canvas[tab_name]['toolbar'].destroy()
-
-        plot_tc = self.plot_thermocouple_temps.get() == 1
-        plot_flir = self.plot_flir_temps.get() == 1
-        plot_inlet = self.plot_inlet_temp.get() == 1
-        plot_flow = self.plot_flow_rate.get() == 1
-
-        # Exit if nothing is selected
-        if not any([plot_tc, plot_flir, plot_inlet, plot_flow]):
-            print("Nothing selected to plot.")
+        if tab_name in self.live_followers:
+            experiment = self.live_followers[tab_name]  # Plots the tailed logs in place of the loaded files
+        else:
+            experiment = self.get_plottable_experiment()
+            if experiment is None:
+                return
+            if not self.request_view_sources(experiment, 'temporal'):
+                return  # Plotted once the sensor and FLIR files have been read
+
+        full_resolution = self.full_resolution_checkbox.get() == 1
+        is_new = 'temporal' not in self.plot_views.get(tab_name, {})
+        view = self.get_view(tab_name, 'temporal', lambda fig: plots.draw_temporal(fig, experiment, full_resolution))
+        if is_new:
+            # Zooming re-decimates the visible window from the full-resolution data, and so does
+            # resizing: the envelope was built for the figure's default size, not the widget's
+            view['artists']['ax'].callbacks.connect('xlim_changed', lambda ax: self.schedule_redecimation(tab_name))
+            view['canvas'].mpl_connect('resize_event', lambda event: self.schedule_redecimation(tab_name))
+            view['full_resolution'] = full_resolution
+            view['live_sources'] = self.live_sources(experiment)
+
+        plots.set_overlay_visibility(view['artists'], {
+            'tc': self.plot_thermocouple_temps.get() == 1,
+            'flir': self.plot_flir_temps.get() == 1,
+            'inlet': self.plot_inlet_temp.get() == 1,
+            'flow': self.plot_flow_rate.get() == 1,
+        })
+        plots.autoscale_temporal(view['artists'])
+        if view['full_resolution'] != full_resolution:
+            self.redecimate_visible_range(tab_name)
+        self.show_view(tab_name, 'temporal')
+
+    def schedule_redecimation(self, tab_name):
+        # Panning fires xlim_changed on every mouse move; only the last one in the window is redrawn
+        if self.redecimate_after_id is not None:
+            self.after_cancel(self.redecimate_after_id)
+        self.redecimate_after_id = self.after(config.REDECIMATE_DELAY_MS, lambda: self.redecimate_visible_range(tab_name))
+
+    def redecimate_visible_range(self, tab_name):
+        import plots
+        import numpy as np
+        import matplotlib.dates as mdates
+        self.redecimate_after_id = None
+        view = self.plot_views.get(tab_name, {}).get('temporal')
+        if view is None or tab_name in self.live_followers:
+            return  # Live views are redrawn from the newest data on every tick
+
+        view['full_resolution'] = self.full_resolution_checkbox.get() == 1
+        start, end = (np.datetime64(limit.replace(tzinfo=None), 'ns') for limit in mdates.num2date(view['artists']['ax'].get_xlim()))
+        plots.redecimate(view['artists'], start, end, view['full_resolution'])
+        view['canvas'].draw_idle()
+
+# ============================ Live Follow ==========================
+    def toggle_live_follow(self):
+        from live import LiveFollower
+        tab_name = self.experiments_tabs.get()
+        experiment = self.workspace.get(tab_name)
+        if experiment is None:
+            self.follow_live_checkbox.deselect()
             return
 
-        fig, ax1 = plt.subplots(figsize=config.FIGURE_SIZE)
-        ax2 = None
-        if (plot_tc or plot_flir or plot_inlet) and plot_flow:
-            ax2 = ax1.twinx()
-
-        time_series_list = []
-
-        # ========== Plotting ==========
-        if plot_tc:
-            ax1.plot(self.sensors_data[tab_name]['Absolute_Time'], self.sensors_data[tab_name]['ChamferTemp_C'], color='green', linestyle='-', label='TC Reading, Chamfered Edge (Inst)')
-            ax1.plot(self.sensors_data[tab_name]['Absolute_Time'], self.sensors_data[tab_name]['FilletTemp_C'], color='red', linestyle='-', label='TC Reading, Filleted Edge (Inst)')
-
-            chamfer_avg = self.sensors_data[tab_name]['ChamferTemp_C'].rolling(window=60, min_periods=1).mean()
-            fillet_avg = self.sensors_data[tab_name]['FilletTemp_C'].rolling(window=60, min_periods=1).mean()
-
-            ax1.plot(self.sensors_data[tab_name]['Absolute_Time'], chamfer_avg, color='green', linestyle='--', label='TC Reading, Chamfered Edge (Avg)')
-            ax1.plot(self.sensors_data[tab_name]['Absolute_Time'], fillet_avg, color='red', linestyle='--', label='TC Reading, Filleted Edge (Avg)')
-
-            time_series_list.append(self.sensors_data[tab_name]['Absolute_Time'])
-
-        if plot_flir:
-            ax1.plot(self.flir_chamfered_data[tab_name]['time'], self.flir_chamfered_data[tab_name]['Chamfered_Side_TC'], color='cyan', linestyle='-', label='FLIR Reading, Chamfered Edge (Inst)')
-            ax1.plot(self.flir_filleted_data[tab_name]['time'], self.flir_filleted_data[tab_name]['Filleted_Side_TC'], color='orange', linestyle='-', label='FLIR Reading, Filleted Edge (Inst)')
-
-            flir_chamfer_avg = self.flir_chamfered_data[tab_name]['Chamfered_Side_TC'].rolling(window=3000, min_periods=1).mean()
-            flir_fillet_avg = self.flir_filleted_data[tab_name]['Filleted_Side_TC'].rolling(window=3000, min_periods=1).mean()
-
-            ax1.plot(self.flir_chamfered_data[tab_name]['time'], flir_chamfer_avg, color='cyan', linestyle='--', label='FLIR Reading, Chamfered Edge (Avg)')
-            ax1.plot(self.flir_filleted_data[tab_name]['time'], flir_fillet_avg, color='orange', linestyle='--', label='FLIR Reading, Filleted Edge (Avg)')
-
-            time_series_list.append(self.flir_chamfered_data[tab_name]['time'])
-            time_series_list.append(self.flir_filleted_data[tab_name]['time'])
-
-        if plot_inlet:
-            ax1.plot(self.sensors_data[tab_name]['Absolute_Time'], self.sensors_data[tab_name]['FluidTemp_C'], color='purple', linestyle='-', label='Fluid Inlet Temp (Inst)')
-
-            fluid_temp_avg = self.sensors_data[tab_name]['FluidTemp_C'].rolling(window=60, min_periods=1).mean()
-
-            ax1.plot(self.sensors_data[tab_name]['Absolute_Time'], fluid_temp_avg, color='purple', linestyle='--', label='Fluid Inlet Temp (Avg)')
-
-            time_series_list.append(self.sensors_data[tab_name]['Absolute_Time'])
-
-        if plot_flow:
-            target_ax = ax2 if (plot_tc or plot_flir or plot_inlet) else ax1  # Use ax1 if no temperatures are selected
-
-            target_ax.plot(self.sensors_data[tab_name]['Absolute_Time'], self.sensors_data[tab_name]['FlowRate_L_per_min'], color='blue', linestyle='-', label='Flow Rate (Inst)')
-
-            flow_rate_avg = self.sensors_data[tab_name]['FlowRate_L_per_min'].rolling(window=60, min_periods=1).mean()
-
-            target_ax.plot(self.sensors_data[tab_name]['Absolute_Time'], flow_rate_avg, color='blue', linestyle='--', label='Flow Rate (Avg)')
-
-            time_series_list.append(self.sensors_data[tab_name]['Absolute_Time'])
-
-        # ========== Axis Formatting ==========
-        if time_series_list:
-            min_time = min(series.min() for series in time_series_list)
-            max_time = max(series.max() for series in time_series_list)
-            ax1.set_xlim(min_time, max_time)
-
-        ax1.set_xlabel('Time (Minutes)')
-        ax1.xaxis.set_major_locator(mdates.MinuteLocator(interval=1))
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-        ax1.grid(True)
-        for label in ax1.get_xticklabels():
-            label.set_rotation(45)
-
-        if plot_tc or plot_flir or plot_inlet:
-            ax1.set_ylabel('Temperature (°C)')
-
-        if ax2:
-            ax2.set_ylabel('Flow Rate (LPM)', color='blue')
-            ax2.tick_params(axis='y', colors='blue')
-            ax2.spines['right'].set_color('blue')
-
-        ax1.set_title(f"Temperature and Flow Rate vs Time for Experiment: {tab_name}")
-
-        # ========== Legend and Explanatory Box ==========
-        custom_lines = [
-            Line2D([0], [0], color='green', lw=2, label='Chamfered Edge (TC)'),
-            Line2D([0], [0], color='red', lw=2, label='Filleted Edge (TC)'),
-            Line2D([0], [0], color='cyan', lw=2, label='Chamfered Edge (FLIR)'),
-            Line2D([0], [0], color='orange', lw=2, label='Filleted Edge (FLIR)'),
-            Line2D([0], [0], color='purple', lw=2, label='Fluid Inlet Temp'),
-            Line2D([0], [0], color='blue', lw=2, label='Flow Rate'),
-        ]
-
-        ax1.legend(handles=custom_lines, loc='lower right')
-
-        ax1.text(0.638, 0.08,
-                'Line Styles:\n-  Instantaneous\n-- Averaged',
-                transform=ax1.transAxes,
-                fontsize=10,
-                verticalalignment='top',
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-
-        plt.tight_layout()
+        if self.follow_live_checkbox.get() == 1:
+            follower = LiveFollower(experiment)
+            if not follower.followed:
+                self.follow_live_checkbox.deselect()
+                return  # No sensor or FLIR log to follow
+            follower.poll()
+            self.live_followers[tab_name] = follower
+            if self.live_after_id is None:
+                self.live_after_id = self.after(config.LIVE_UPDATE_MS, self.update_live_views)
+        else:
+            self.live_followers.pop(tab_name, None)
+        self.update_file_status()  # Shows or clears skipped live lines
 
-        # ========== Embedding in GUI ==========
-        master_frame = self.experiments_tabs.tab(tab_name)
-        canvas = FigureCanvasTkAgg(fig, master=master_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+        # The temporal view is rebuilt from whichever data the tab now plots
+        self.close_view(tab_name, 'temporal')
+        self.plot_temporal_data()
 
-        toolbar = NavigationToolbar2Tk(canvas, master_frame)
-        toolbar.update()
-        toolbar.pack()
+    def live_sources(self, experiment):
+        return {attribute for attribute in ('sensors_data', 'flir_chamfered_data', 'flir_filleted_data')
+                if getattr(experiment, attribute) is not None}
 
-        self.current_plot_canvas[tab_name] = {'canvas': canvas, 'toolbar': toolbar}
+    def update_live_views(self):
+        # Only the lines' data and the axis limits change; the figure itself is kept
+        import plots
+        try:
+            current_tab = self.experiments_tabs.get()
+            for tab_name, follower in list(self.live_followers.items()):
+                errors = dict(follower.errors)
+                updated = follower.poll()
+                if tab_name == current_tab and follower.errors != errors:
+                    self.update_file_status()
+                if not updated:
+                    continue
+                view = self.plot_views.get(tab_name, {}).get('temporal')
+                if view is not None and view['live_sources'] == self.live_sources(follower):
+                    plots.update_temporal(view['artists'], follower, view['full_resolution'])
+                    view['canvas'].draw_idle()
+                    continue
+                # A log started after the view was built and needs its own lines
+                self.close_view(tab_name, 'temporal')
+                if tab_name == current_tab:
+                    self.plot_temporal_data()
+        finally:
+            self.live_after_id = None
+            if self.live_followers:
+                self.live_after_id = self.after(config.LIVE_UPDATE_MS, self.update_live_views)
@@ -0,0 +1,150 @@
+# ========================== Imports & Config ==========================
+import os
+import numpy as np
+import pandas as pd
+import config
+from engine import (SENSORS, CHAMFERED_FLIR, FILLETED_FLIR, SENSOR_HEADER_LINES, FLIR_HEADER_LINES,
+                    SENSOR_SCHEMA, flir_schema, parse_sensor_bytes, parse_flir_bytes)
+
+# ========================== File Tailing ==========================
+class FileTail:
+    # Remembers how far a growing text file has been read and hands back only the complete
+    # lines appended since the last call. Header lines are kept aside for the parser.
+    def __init__(self, path, header_lines=1):
+        self.path = path
+        self.header_lines = header_lines
+        self.reset()
+        self.restarted = False  # Set when the file shrank and reading started over
+
+    def reset(self):
+        self.offset = 0
+        self.header = None
+        self.partial = b''
+
+    def read_new_lines(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return b''
+        if size < self.offset:
+            self.reset()  # File was truncated or replaced; start over
+            self.restarted = True
+        if size == self.offset:
+            return b''
+
+        with open(self.path, 'rb') as tail_file:
+            tail_file.seek(self.offset)
+            data = self.partial + tail_file.read(size - self.offset)
+        self.offset = size
+
+        complete = data.rfind(b'\n') + 1
+        data, self.partial = data[:complete], data[complete:]
+
+        if self.header is None:
+            lines = data.split(b'\n', self.header_lines)
+            if len(lines) <= self.header_lines:
+                self.partial = data + self.partial  # Header not fully written yet
+                return b''
+            self.header = b'\n'.join(lines[:self.header_lines]) + b'\n'
+            data = lines[self.header_lines]
+        return data
+
+# ========================== Ring Buffers ==========================
+class RingBuffer:
+    def __init__(self, capacity, dtype):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.capacity = capacity
+        self.clear()
+
+    def clear(self):
+        self.start = 0
+        self.size = 0
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self.data.dtype)[-self.capacity:]
+        count = len(values)
+        end = (self.start + self.size) % self.capacity
+        first = min(count, self.capacity - end)
+        self.data[end:end + first] = values[:first]
+        self.data[:count - first] = values[first:]
+
+        overflow = max(self.size + count - self.capacity, 0)
+        self.start = (self.start + overflow) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+    def values(self):
+        end = self.start + self.size
+        if end <= self.capacity:
+            return self.data[self.start:end].copy()
+        return np.concatenate((self.data[self.start:], self.data[:end - self.capacity]))
+
+class RingTable:
+    # Fixed-capacity columns that always hold the most recent rows of a growing log
+    def __init__(self, capacity, columns):
+        self.columns = {column: RingBuffer(capacity, dtype) for column, dtype in columns.items()}
+
+    def clear(self):
+        for buffer in self.columns.values():
+            buffer.clear()
+
+    def extend(self, frame):
+        # Every column is converted before any is written, so a frame that doesn't fit the
+        # table raises without leaving the columns at different lengths
+        values = {column: np.asarray(frame[column].to_numpy(), dtype=buffer.data.dtype) for column, buffer in self.columns.items()}
+        for column, buffer in self.columns.items():
+            buffer.extend(values[column])
+
+    def frame(self):
+        return pd.DataFrame({column: buffer.values() for column, buffer in self.columns.items()})
+
+# ========================== Live Follower ==========================
+def parse_sensor_lines(header, data):
+    # The Arduino banner lines are not part of the CSV header
+    return parse_sensor_bytes(header.split(b'\n')[SENSOR_HEADER_LINES - 1], data)
+
+def parse_flir_lines(header, data):
+    return parse_flir_bytes(header, data)
+
+LIVE_SOURCES = {
+    # source: (attribute, header lines, parser, capacity setting, columns kept)
+    SENSORS: ('sensors_data', SENSOR_HEADER_LINES, parse_sensor_lines, 'LIVE_SENSOR_ROWS', SENSOR_SCHEMA),
+    CHAMFERED_FLIR: ('flir_chamfered_data', FLIR_HEADER_LINES, parse_flir_lines, 'LIVE_FLIR_ROWS', flir_schema('Chamfered_Side_TC')),
+    FILLETED_FLIR: ('flir_filleted_data', FLIR_HEADER_LINES, parse_flir_lines, 'LIVE_FLIR_ROWS', flir_schema('Filleted_Side_TC')),
+}
+
+class LiveFollower:
+    # Tails an experiment's sensor and FLIR logs into ring buffers. Exposes the same
+    # sensors_data / flir_*_data attributes as an Experiment so plots.draw_temporal can use it.
+    def __init__(self, experiment):
+        self.name = experiment.name
+        self.sensors_data = None
+        self.flir_chamfered_data = None
+        self.flir_filleted_data = None
+        self.followed = {}
+        self.errors = {}  # source -> why its latest lines were skipped, until lines parse again
+        for source, (attribute, header_lines, parser, capacity, columns) in LIVE_SOURCES.items():
+            file_path = experiment.source_path(source)
+            if file_path is not None:
+                table = RingTable(getattr(config, capacity), columns)
+                self.followed[source] = (attribute, FileTail(file_path, header_lines), parser, table)
+
+    def poll(self):
+        updated = False
+        for source, (attribute, tail, parser, table) in self.followed.items():
+            data = tail.read_new_lines()
+            if tail.restarted:
+                tail.restarted = False
+                table.clear()
+            if not data:
+                continue
+            try:
+                table.extend(parser(tail.header, data))
+            except Exception as error:
+                # Skip a malformed burst, or lines whose columns don't match the table; the
+                # next complete lines are parsed normally
+                self.errors[source] = str(error) or type(error).__name__
+                continue
+            self.errors.pop(source, None)
+            setattr(self, attribute, table.frame())
+            updated = True
+        return updated
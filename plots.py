@@ -0,0 +1,504 @@
+# ========================== Imports & Config ==========================
+import config
+import numpy as np
+import matplotlib.dates as mdates
+from matplotlib import colormaps
+from matplotlib.lines import Line2D
+from matplotlib.image import AxesImage
+from matplotlib.collections import LineCollection
+from matplotlib.patches import Rectangle
+from decimate import minmax_envelope
+from engine import profile_grid, resample_profiles, profile_statistics
+
+# Every draw_* function fills a bare matplotlib Figure and returns its artists, with the
+# optional ones grouped under 'overlays' so callers can toggle them with set_visible.
+# Nothing here touches Tk or pyplot, so the same code renders off-screen with Agg.
+
+# ========================== Heat Map ==========================
+TC_BOX_SIZE = 8
+
+def draw_heat_map(fig, experiment):
+    ax = fig.add_subplot()
+    # Sequence frames are swapped in with set_heat_map_frame and keep the reference frame's color scale
+    image = ax.imshow(experiment.reference_frame(), cmap='jet', origin='lower', aspect='auto')
+    fig.colorbar(image, ax=ax, label='Temperature (°C)')
+
+    ax.set_title(f"Heat Map: {experiment.name}")
+    ax.set_xlabel('X (pixels)')
+    ax.set_ylabel('Y (pixels)')
+    ax.invert_yaxis()
+
+    ax.text(0.99, 0.99, 'Chamfered Side', transform=ax.transAxes,
+        fontsize=10, color='white', verticalalignment='top', horizontalalignment='right')
+
+    ax.text(0.99, 0.01, 'Filleted Side', transform=ax.transAxes,
+        fontsize=10, color='white', verticalalignment='bottom', horizontalalignment='right')
+
+    left, right = experiment.left_edge, experiment.right_edge
+    top, bottom = experiment.top_edge, experiment.bottom_edge
+
+    box_style = dict(color='black', linewidth=1, linestyle='--')
+    fin_box = [
+        *ax.plot([left, right], [top, top], **box_style),           # Top edge
+        *ax.plot([left, right], [bottom, bottom], **box_style),     # Bottom edge
+        *ax.plot([left, left], [top, bottom], **box_style),         # Left edge
+        *ax.plot([right, right], [top, bottom], **box_style),       # Right edge
+    ]
+
+    midline = ax.plot([experiment.midline, experiment.midline], [top - 5, bottom + 5],
+                      color='white', linewidth=1, linestyle='--')
+
+    half_box = TC_BOX_SIZE // 2
+    thermocouples = []
+    for location, color in ((experiment.c_tc_location, 'darkgreen'), (experiment.f_tc_location, 'darkblue')):
+        if location is None:
+            continue
+        x, y = location
+        thermocouples.append(ax.add_patch(Rectangle((x - half_box, y - half_box), TC_BOX_SIZE, TC_BOX_SIZE,
+                                                    linewidth=2, edgecolor=color, facecolor='none')))
+
+    return {'ax': ax, 'image': image, 'edges': (left, right, top, bottom),
+            'overlays': {'fin_box': fin_box, 'midline': midline, 'thermocouples': thermocouples}}
+
+def place_heat_map_overlays(artists, edges, thermocouples):
+    # Moves the overlays drawn by draw_heat_map onto another frame's edges; the cursor's mm
+    # readout follows artists['edges'] too
+    left, right, top, bottom = edges
+    overlays = artists['overlays']
+    for line, (xs, ys) in zip(overlays['fin_box'], (([left, right], [top, top]),           # Top edge
+                                                    ([left, right], [bottom, bottom]),     # Bottom edge
+                                                    ([left, left], [top, bottom]),         # Left edge
+                                                    ([right, right], [top, bottom]))):     # Right edge
+        line.set_data(xs, ys)
+    midline = (right + left) / 2
+    overlays['midline'][0].set_data([midline, midline], [top - 5, bottom + 5])
+
+    half_box = TC_BOX_SIZE // 2
+    for box, (x, y) in zip(overlays['thermocouples'], thermocouples):
+        box.set_xy((x - half_box, y - half_box))
+    artists['edges'] = edges
+
+class HeatMapCursor:
+    # Crosshair and readout drawn with blitting: the rendered heat map is cached on every full
+    # draw and only the animated cursor artists are redrawn on top of it as the mouse moves.
+    def __init__(self, canvas, artists, experiment, on_hover=None):
+        self.canvas = canvas
+        self.artists = artists
+        self.ax = artists['ax']
+        self.image = artists['image']
+        self.experiment = experiment
+        self.on_hover = on_hover
+        self.background = None
+
+        cursor_style = dict(color='white', linewidth=0.8, linestyle=':', animated=True, visible=False)
+        self.horizontal = self.ax.axhline(0, **cursor_style)
+        self.vertical = self.ax.axvline(0, **cursor_style)
+        self.readout = self.ax.text(0.01, 0.01, '', transform=self.ax.transAxes, fontsize=9, family='monospace',
+                                    verticalalignment='bottom', horizontalalignment='left', animated=True, visible=False,
+                                    bbox=dict(boxstyle='round', facecolor='black', alpha=0.6), color='white')
+        self.cursor_artists = (self.horizontal, self.vertical, self.readout)
+
+        self.connections = [
+            canvas.mpl_connect('draw_event', self.on_draw),
+            canvas.mpl_connect('motion_notify_event', self.on_move),
+            canvas.mpl_connect('axes_leave_event', self.on_leave),
+        ]
+
+    def on_draw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+
+    def on_move(self, event):
+        heat_map = self.image.get_array()  # Whichever frame is currently shown
+        if event.inaxes is not self.ax or event.xdata is None:
+            return self.on_leave(event)
+
+        x, y = int(round(event.xdata)), int(round(event.ydata))
+        rows, cols = heat_map.shape
+        if not (0 <= x < cols and 0 <= y < rows):
+            return self.on_leave(event)
+
+        x_mm, y_mm = self.experiment.pixel_to_mm(x, y, self.artists['edges'])
+        self.horizontal.set_ydata([y, y])
+        self.vertical.set_xdata([x, x])
+        self.readout.set_text(f"{float(heat_map[y, x]):7.2f} °C\npx ({x}, {y})\nmm ({x_mm:.2f}, {y_mm:.2f})")
+        for artist in self.cursor_artists:
+            artist.set_visible(True)
+        self.blit()
+
+        if self.on_hover is not None:
+            self.on_hover(y_mm)
+
+    def on_leave(self, event):
+        if self.readout.get_visible():
+            for artist in self.cursor_artists:
+                artist.set_visible(False)
+            self.blit()
+
+    def blit(self):
+        if self.background is None:
+            return
+        self.canvas.restore_region(self.background)
+        for artist in self.cursor_artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def disconnect(self):
+        for connection in self.connections:
+            self.canvas.mpl_disconnect(connection)
+
+def set_heat_map_frame(artists, frame, edges=None, thermocouples=None):
+    # A frame at another resolution than the one shown resizes the image and, when given,
+    # moves the overlays onto that frame's edges and thermocouples
+    image = artists['image']
+    resized = np.shape(frame) != np.shape(image.get_array())
+    image.set_data(frame)
+    if resized:
+        rows, cols = np.shape(frame)
+        image.set_extent((-0.5, cols - 0.5, -0.5, rows - 0.5))
+        artists['ax'].set_xlim(-0.5, cols - 0.5)
+        artists['ax'].set_ylim(rows - 0.5, -0.5)  # Row 0 at the top, as after invert_yaxis
+    if resized and edges is not None:
+        place_heat_map_overlays(artists, edges, thermocouples)
+
+# ========================== Linear Profile ==========================
+def draw_linear_profile(fig, experiment):
+    ax = fig.add_subplot()
+    y_positions_mm, temperature_profile = experiment.midline_profile()
+    profile = ax.plot(y_positions_mm, temperature_profile, color='red', linewidth=2, label='Experimental Temperature Profile')
+
+    simulation = []
+    if experiment.has_simulation():
+        simulation = ax.plot(experiment.simulation_data['Location'], experiment.simulation_data['Temperature'], color='blue', linewidth=2, label='Simulated Temperature Profile')
+        comparison = experiment.simulation_comparison()
+        if comparison is not None:
+            simulation.append(ax.text(0.01, 0.01, f"RMSE {comparison['rmse_c']:.2f} °C\nMax |Δ| {comparison['max_abs_deviation_c']:.2f} °C",
+                                      transform=ax.transAxes, fontsize=10, verticalalignment='bottom', horizontalalignment='left',
+                                      bbox=dict(boxstyle='round', facecolor='white', alpha=0.8)))
+
+    ax.set_title(f"Linear Temperature Profile at Midline: {experiment.name}")
+    ax.set_xlabel('Fin Height (mm)')
+    ax.set_xlim(0, config.FIN_HEIGHT)
+    ax.set_ylim(temperature_profile.min() - 5, temperature_profile.max() + 5)
+    ax.set_ylabel('Temperature (°C)')
+    ax.grid(True)
+
+    ax.text(0.01, 0.99, 'Chamfered Side', transform=ax.transAxes,
+        fontsize=10, color='black', verticalalignment='top', horizontalalignment='left')
+
+    ax.text(0.99, 0.99, 'Filleted Side', transform=ax.transAxes,
+        fontsize=10, color='black', verticalalignment='top', horizontalalignment='right')
+
+    ax.legend(loc='lower right')
+
+    # Follows the height hovered on the heat map
+    hover_marker = ax.axvline(0, color='black', linewidth=1, linestyle=':', visible=False)
+
+    return {'ax': ax, 'profile': profile[0], 'hover_marker': hover_marker, 'overlays': {'simulation': simulation}}
+
+def set_hover_marker(artists, y_mm):
+    artists['hover_marker'].set_xdata([y_mm, y_mm])
+    artists['hover_marker'].set_visible(True)
+
+# ========================== Combined Profiles ==========================
+COMBINED_COLORS = ['red', 'blue', 'green', 'purple', 'orange', 'cyan', 'magenta', 'yellow', 'black', 'brown']
+
+def combined_color(index):
+    # The original ten colors first, then evenly spread hues so large selections stay distinguishable
+    if index < len(COMBINED_COLORS):
+        return COMBINED_COLORS[index]
+    golden_hue = ((index - len(COMBINED_COLORS)) * 0.618033988749895) % 1.0
+    return colormaps['hsv'](golden_hue)
+
+def draw_combined_profiles(fig, experiments=(), show_bands=False):
+    ax = fig.add_subplot()
+    ax.set_title('Combined Linear Temperature Profiles')
+    ax.set_xlabel('Fin Height (mm)')
+    ax.set_xlim(0, config.FIN_HEIGHT)
+    ax.set_ylabel('Temperature (°C)')
+    ax.grid(True)
+
+    ax.text(0.01, 0.01, 'Chamfered Side', transform=ax.transAxes,
+            fontsize=10, color='black', verticalalignment='bottom', horizontalalignment='left')
+    ax.text(0.99, 0.01, 'Filleted Side', transform=ax.transAxes,
+            fontsize=10, color='black', verticalalignment='bottom', horizontalalignment='right')
+
+    # profiles: name -> (x, y, color); drawn as one Line2D each, or one LineCollection past the
+    # threshold, or summarized as percentile bands with only the outliers drawn individually
+    artists = {'ax': ax, 'profiles': {}, 'lines': {}, 'collection': None, 'next_color': 0,
+               'scores': {},        # name -> RMSE against simulation, when ranking
+               'show_bands': show_bands, 'bands': [], 'statistics': None}
+    for experiment in experiments:
+        _store_combined_profile(artists, experiment)
+    _sync_combined_profiles(artists)
+    return artists
+
+def _store_combined_profile(artists, experiment):
+    y_positions_mm, temperature_profile = experiment.midline_profile()
+    if experiment.name in artists['profiles']:
+        color = artists['profiles'][experiment.name][2]  # Re-analyzed experiments keep their color
+        if experiment.name in artists['lines']:
+            artists['lines'].pop(experiment.name).remove()
+    else:
+        color = combined_color(artists['next_color'])
+        artists['next_color'] += 1
+    artists['profiles'][experiment.name] = (y_positions_mm, temperature_profile, color)
+
+def add_combined_profile(artists, experiment):
+    _store_combined_profile(artists, experiment)
+    _sync_combined_profiles(artists)
+
+def remove_combined_profile(artists, name):
+    artists['scores'].pop(name, None)
+    if artists['profiles'].pop(name, None) is None:
+        return
+    _sync_combined_profiles(artists)
+
+def set_combined_scores(artists, scores):
+    # Ranks the legend (and drawing order) by agreement with simulation; an empty dict turns it off
+    artists['scores'] = dict(scores)
+    _sync_combined_profiles(artists)
+
+def set_combined_bands(artists, show):
+    artists['show_bands'] = bool(show)
+    _sync_combined_profiles(artists)
+
+def _ranked_names(artists):
+    # Best agreement first, unscored profiles after in the order they were added
+    scores = artists['scores']
+    names = list(artists['profiles'])
+    if not scores:
+        return names
+    return sorted(names, key=lambda name: (scores.get(name) is None, scores.get(name) or 0.0))
+
+def _combined_label(artists, name):
+    score = artists['scores'].get(name)
+    return name if score is None else f"{name} (RMSE {score:.2f} °C)"
+
+def _draw_profile_bands(artists, ranked):
+    # Every profile resampled onto one grid; the bands, mean and ±1 SD are redrawn from scratch
+    ax, profiles = artists['ax'], artists['profiles']
+    grid = profile_grid()
+    stacked = resample_profiles([profiles[name][:2] for name in ranked], grid)
+    stats = profile_statistics(stacked)
+    artists['statistics'] = dict(stats, names=ranked, grid=grid)
+
+    handles = []
+    for alpha, (low, high) in zip(np.linspace(0.15, 0.35, len(config.PROFILE_BANDS)), config.PROFILE_BANDS):
+        handles.append(ax.fill_between(grid, stats['percentiles'][low], stats['percentiles'][high], color='tab:blue',
+                                       alpha=alpha, linewidth=0, label=f"P{low}–P{high}"))
+    mean, = ax.plot(grid, stats['mean'], color='black', label=f"Mean of {len(ranked)} experiments")
+    spread = ax.plot(grid, stats['mean'] - stats['std'], grid, stats['mean'] + stats['std'],
+                     color='black', linestyle='--', linewidth=0.8)
+    spread[0].set_label('Mean ± 1 SD')
+    handles += [mean, spread[0]]
+    artists['bands'] = handles + spread[1:]
+
+    for name, outlier in zip(ranked, stats['outliers']):
+        if outlier:
+            x, y, color = profiles[name]
+            line, = ax.plot(x, y, color=color, label=f"{_combined_label(artists, name)} (outlier)")
+            artists['bands'].append(line)
+            handles.append(line)
+    return handles
+
+def _sync_combined_profiles(artists):
+    # Only the changed line is added or removed while individual lines are shown; the
+    # collection just swaps its segment list
+    ax = artists['ax']
+    profiles = artists['profiles']
+    show_bands = artists['show_bands'] and len(profiles) > 0
+    use_collection = not show_bands and len(profiles) > config.COMBINED_COLLECTION_THRESHOLD
+
+    for artist in artists['bands']:
+        artist.remove()
+    artists['bands'], artists['statistics'] = [], None
+    for name in [name for name in artists['lines'] if show_bands or use_collection or name not in profiles]:
+        artists['lines'].pop(name).remove()
+    if not use_collection and artists['collection'] is not None:
+        artists['collection'].remove()
+        artists['collection'] = None
+    ranked = _ranked_names(artists)
+    if show_bands:
+        band_handles = _draw_profile_bands(artists, ranked)
+    elif use_collection:
+        drawing_order = ranked[::-1]  # Best fit drawn last, on top
+        segments = [np.column_stack(profiles[name][:2]) for name in drawing_order]
+        colors = [profiles[name][2] for name in drawing_order]
+        if artists['collection'] is None:
+            artists['collection'] = ax.add_collection(LineCollection(segments, colors=colors, linewidths=1), autolim=False)
+        else:
+            artists['collection'].set_segments(segments)
+            artists['collection'].set_color(colors)
+    else:
+        for name, (x, y, color) in profiles.items():
+            if name not in artists['lines']:
+                artists['lines'][name], = ax.plot(x, y, color=color)
+        for rank, name in enumerate(ranked):
+            artists['lines'][name].set_label(_combined_label(artists, name))
+            artists['lines'][name].set_zorder(2 + (len(ranked) - rank) / len(ranked))
+
+    # Temperature limits come from the cached profile ranges rather than relim over every artist
+    finite_ranges = [(np.nanmin(y), np.nanmax(y)) for _, y, _ in profiles.values() if len(y)]
+    if finite_ranges:
+        low, high = min(low for low, _ in finite_ranges), max(high for _, high in finite_ranges)
+        margin = max((high - low) * 0.05, 0.5)
+        ax.set_ylim(low - margin, high + margin)
+
+    legend = ax.get_legend()
+    if legend is not None:
+        legend.remove()
+    if show_bands:
+        ax.legend(handles=band_handles, loc='upper right')
+    elif artists['lines']:
+        ax.legend(handles=[artists['lines'][name] for name in ranked], loc='upper right')
+    elif use_collection:
+        handles = [Line2D([0], [0], color='grey', label=f"{len(profiles)} experiments")]
+        if artists['scores']:
+            handles += [Line2D([0], [0], color=profiles[name][2], label=_combined_label(artists, name))
+                        for name in ranked[:5] if name in artists['scores']]
+        ax.legend(handles=handles, loc='upper right')
+
+# ========================== Temporal Data ==========================
+SENSOR_WINDOW = 60      # Rolling average window for the ~1 Hz Arduino sensors
+FLIR_WINDOW = 3000      # Rolling average window for the FLIR logs
+
+def _series_values(experiment, entry):
+    data = getattr(experiment, entry['attribute'])
+    values = data[entry['column']]
+    if entry['average']:
+        values = values.rolling(window=entry['window'], min_periods=1).mean()
+    return np.asarray(data[entry['time']]), np.asarray(values)
+
+def _plot_series(ax, n_bins, full_resolution, series, experiment, entry, **kwargs):
+    # entry names where the series comes from so it can be rebuilt when the data grows
+    x, y = _series_values(experiment, entry)
+    plot_x, plot_y = (x, y) if full_resolution else minmax_envelope(x, y, n_bins)
+    entry['line'], = ax.plot(plot_x, plot_y, **kwargs)
+    entry['x'], entry['y'] = x, y
+    series.append(entry)
+    return entry['line']
+
+def _plot_with_average(ax, n_bins, full_resolution, series, experiment, attribute, time, column, window, color, label):
+    source = dict(attribute=attribute, time=time, column=column, window=window)
+    return [
+        _plot_series(ax, n_bins, full_resolution, series, experiment, dict(source, average=False), color=color, linestyle='-', label=f"{label} (Inst)"),
+        _plot_series(ax, n_bins, full_resolution, series, experiment, dict(source, average=True), color=color, linestyle='--', label=f"{label} (Avg)"),
+    ]
+
+def draw_temporal(fig, experiment, full_resolution=False):
+    ax1 = fig.add_subplot()
+    ax2 = ax1.twinx()
+    # One min/max pair per horizontal pixel at the figure's current size; on screen the view
+    # re-decimates (redecimate) once the canvas has its real width and on every resize
+    n_bins = int(ax1.bbox.width)
+    series = []  # Series entries keep the full x/y so the view can be re-decimated when zoomed
+    overlays = {'tc': [], 'flir': [], 'inlet': [], 'flow': []}
+
+    if experiment.sensors_data is not None:
+        sensor_series = (ax1, n_bins, full_resolution, series, experiment, 'sensors_data', 'Absolute_Time')
+        overlays['tc'] += _plot_with_average(*sensor_series, 'ChamferTemp_C', SENSOR_WINDOW, 'green', 'TC Reading, Chamfered Edge')
+        overlays['tc'] += _plot_with_average(*sensor_series, 'FilletTemp_C', SENSOR_WINDOW, 'red', 'TC Reading, Filleted Edge')
+        overlays['inlet'] += _plot_with_average(*sensor_series, 'FluidTemp_C', SENSOR_WINDOW, 'purple', 'Fluid Inlet Temp')
+        overlays['flow'] += _plot_with_average(ax2, *sensor_series[1:], 'FlowRate_L_per_min', SENSOR_WINDOW, 'blue', 'Flow Rate')
+
+    for attribute, column, color, label in (('flir_chamfered_data', 'Chamfered_Side_TC', 'cyan', 'FLIR Reading, Chamfered Edge'),
+                                            ('flir_filleted_data', 'Filleted_Side_TC', 'orange', 'FLIR Reading, Filleted Edge')):
+        if getattr(experiment, attribute) is not None:
+            overlays['flir'] += _plot_with_average(ax1, n_bins, full_resolution, series, experiment, attribute, 'time', column, FLIR_WINDOW, color, label)
+
+    # ========== Axis Formatting ==========
+    _fit_time_axis(ax1, series)
+
+    ax1.set_xlabel('Time (Minutes)')
+    ax1.xaxis.set_major_locator(mdates.MinuteLocator(interval=1))
+    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+    ax1.grid(True)
+    for label in ax1.get_xticklabels():
+        label.set_rotation(45)
+
+    ax1.set_ylabel('Temperature (°C)')
+    ax2.set_ylabel('Flow Rate (LPM)', color='blue')
+    ax2.tick_params(axis='y', colors='blue')
+    ax2.spines['right'].set_color('blue')
+
+    ax1.set_title(f"Temperature and Flow Rate vs Time for Experiment: {experiment.name}")
+
+    # ========== Legend and Explanatory Box ==========
+    custom_lines = [
+        Line2D([0], [0], color='green', lw=2, label='Chamfered Edge (TC)'),
+        Line2D([0], [0], color='red', lw=2, label='Filleted Edge (TC)'),
+        Line2D([0], [0], color='cyan', lw=2, label='Chamfered Edge (FLIR)'),
+        Line2D([0], [0], color='orange', lw=2, label='Filleted Edge (FLIR)'),
+        Line2D([0], [0], color='purple', lw=2, label='Fluid Inlet Temp'),
+        Line2D([0], [0], color='blue', lw=2, label='Flow Rate'),
+    ]
+
+    ax1.legend(handles=custom_lines, loc='lower right')
+
+    ax1.text(0.638, 0.08,
+            'Line Styles:\n-  Instantaneous\n-- Averaged',
+            transform=ax1.transAxes,
+            fontsize=10,
+            verticalalignment='top',
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+
+    fig.tight_layout()
+
+    return {'ax': ax1, 'ax2': ax2, 'series': series, 'overlays': overlays}
+
+def _fit_time_axis(ax, series):
+    spans = [(entry['x'][0], entry['x'][-1]) for entry in series if len(entry['x'])]
+    if spans:
+        ax.set_xlim(min(start for start, _ in spans), max(end for _, end in spans))
+
+def autoscale_temporal(artists):
+    # Refit the temperature and flow axes to whichever series are still visible
+    for ax in (artists['ax'], artists['ax2']):
+        ax.relim(visible_only=True)
+        ax.autoscale_view(scalex=False)
+
+def redecimate(artists, start, end, full_resolution=False):
+    ax = artists['ax']
+    n_bins = int(ax.bbox.width)
+    for entry in artists['series']:
+        x, y = entry['x'], entry['y']
+        if full_resolution:
+            entry['line'].set_data(x, y)
+            continue
+        first, last = np.searchsorted(x, [start, end])
+        first, last = max(first - 1, 0), min(last + 1, len(x))  # Keep the segments crossing the edges
+        entry['line'].set_data(*minmax_envelope(x[first:last], y[first:last], n_bins))
+
+def update_temporal(artists, experiment, full_resolution=False):
+    # Re-read every series from the experiment (e.g. a live follower whose buffers have grown),
+    # refit the time axis to the newest data and rescale the visible series
+    n_bins = int(artists['ax'].bbox.width)
+    for entry in artists['series']:
+        if getattr(experiment, entry['attribute']) is None:
+            continue
+        x, y = entry['x'], entry['y'] = _series_values(experiment, entry)
+        entry['line'].set_data(*((x, y) if full_resolution else minmax_envelope(x, y, n_bins)))
+    _fit_time_axis(artists['ax'], artists['series'])
+    autoscale_temporal(artists)
+
+# ========================== Memory ==========================
+def figure_nbytes(fig):
+    # Rough resident size: the RGBA render buffer (held again by the Tk photo image) plus the
+    # arrays behind images, lines and collections. Images keep their own masked copy of the data.
+    total = int(fig.bbox.width * fig.bbox.height) * 4 * 2
+    for artist in fig.findobj():
+        if isinstance(artist, AxesImage):
+            image = artist.get_array()
+            if image is not None:
+                total += np.ma.getdata(image).nbytes + np.asarray(np.ma.getmask(image)).nbytes
+        elif isinstance(artist, Line2D):
+            total += artist.get_xydata().nbytes
+        elif isinstance(artist, LineCollection):
+            total += sum(np.asarray(segment).nbytes for segment in artist.get_segments())
+    return total
+
+# ========================== Overlay Visibility ==========================
+def set_overlay_visibility(artists, visibility):
+    for overlay, visible in visibility.items():
+        for artist in artists['overlays'].get(overlay, []):
+            artist.set_visible(visible)
@@ -0,0 +1,8 @@
+# Names of every experiment source, matching the keys of config.REQUIRED_FILES. Kept apart
+# from engine.py so the GUI can refer to them without importing numpy and pandas.
+HEAT_MAP = 'Heat Map'
+HEAT_MAP_SEQUENCE = 'Heat Map Sequence'
+CHAMFERED_FLIR = 'Chamfered Side, Flir'
+FILLETED_FLIR = 'Filleted Side, Flir'
+SENSORS = 'External Sensors, Arduino'
+SIMULATION = 'Simulation Data'
@@ -0,0 +1,123 @@
+# ========================== Imports & Config ==========================
+import os
+import time
+import argparse
+import numpy as np
+
+# ========================== Heat Map Generators ==========================
+def heat_map_frame(rows=480, cols=640, seed=0, ambient=25.0, fin_temp=70.0, noise=0.3):
+    # Hot fin rectangle on an ambient background, hotter at the top like a heated base
+    rng = np.random.default_rng(seed)
+    frame = ambient + rng.normal(0, noise, (rows, cols))
+
+    # Keep the fin ends inside the EDGE_SENSITIVITY window like the real camera framing
+    top = min(int(rows * 0.08), 40)
+    bottom = rows - top
+    left, right = int(cols * 0.40), int(cols * 0.52)
+    fin_gradient = np.linspace(fin_temp - ambient, (fin_temp - ambient) * 0.5, bottom - top)
+    frame[top:bottom, left:right] += fin_gradient[:, None]
+    return frame
+
+def write_heat_map(file_path, frame):
+    np.savetxt(file_path, frame, delimiter=',', fmt='%.3f')
+
+def heat_map_sequence(frames=20, rows=480, cols=640, seed=0, ambient=25.0, fin_temp=70.0, noise=0.3):
+    # The fin warms from ambient up to fin_temp over the sequence
+    for index, temperature in enumerate(np.linspace(ambient + 5, fin_temp, frames)):
+        yield heat_map_frame(rows, cols, seed + index, ambient, temperature, noise)
+
+def write_heat_map_sequence(folder, frames):
+    os.makedirs(folder, exist_ok=True)
+    for index, frame in enumerate(frames, start=1):
+        write_heat_map(os.path.join(folder, f"frame_{index}.csv"), frame)
+
+# ========================== Log Generators ==========================
+SENSOR_HEADER = 'IRIS Arduino logger\nSensors started\nTime,ChamferTemp_C,FilletTemp_C,FluidTemp_C,FlowRate_L_per_min\n'
+FLIR_START = np.datetime64('2025-03-04T17:00:00', 'us')  # FLIR clock is UTC, five hours ahead of the Arduino
+
+def sensor_lines(start_second, count, seed=0):
+    # One "HH:MM:SS:mmm -> elapsed_ms,..." line per second from 12:00:00
+    rng = np.random.default_rng(seed + start_second)
+    lines = []
+    for second in range(start_second, start_second + count):
+        hours, remainder = divmod(12 * 3600 + second, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        chamfer, fillet, fluid = 60 + rng.normal(0, 0.5), 54 + rng.normal(0, 0.5), 70 + rng.normal(0, 0.2)
+        flow = 1.5 + rng.normal(0, 0.05)
+        lines.append(f"{hours:02d}:{minutes:02d}:{seconds:02d}:000 -> {second * 1000},{chamfer:.2f},{fillet:.2f},{fluid:.2f},{flow:.3f}\n")
+    return ''.join(lines)
+
+def flir_lines(start_row, count, rate_hz=30, seed=0, mean=57.0):
+    rng = np.random.default_rng(seed + start_row)
+    rows = np.arange(start_row, start_row + count)
+    times = FLIR_START + (rows * 1e6 / rate_hz).astype('timedelta64[us]')
+    values = mean + rng.normal(0, 0.6, count)
+    return ''.join(f"{str(time).replace('T', ' ')}\t{value:.3f}\n" for time, value in zip(times, values))
+
+# ========================== Experiment Writers ==========================
+FLIR_LOGS = {
+    # file: (column, seed, mean)
+    'Chamfered_Side_TC_Flir.txt': ('Chamfered_Side_TC', 1, 57.0),
+    'Filleted_Side_TC_Flir.txt': ('Filleted_Side_TC', 2, 52.0),
+}
+WRITE_CHUNK = 100000  # Lines formatted per write, so long logs never sit in memory as one string
+
+def write_sensor_log(file_path, seconds, seed=0):
+    with open(file_path, 'w') as log_file:
+        log_file.write(SENSOR_HEADER)
+        for start in range(0, seconds, WRITE_CHUNK):
+            log_file.write(sensor_lines(start, min(WRITE_CHUNK, seconds - start), seed))
+
+def write_flir_log(file_path, column, rows, rate_hz=30, seed=0, mean=57.0):
+    with open(file_path, 'w') as log_file:
+        log_file.write(f"time\t{column}\n")
+        for start in range(0, rows, WRITE_CHUNK):
+            log_file.write(flir_lines(start, min(WRITE_CHUNK, rows - start), rate_hz, seed, mean))
+
+def write_simulation(file_path, points=2000, base_temp=70.0, tip_temp=35.0, seed=0):
+    # IRIS-ANSYS export: a header, "position [m]<TAB>temperature [K]" rows, then a trailing line
+    rng = np.random.default_rng(seed)
+    positions = np.linspace(0.0, 0.1, points)
+    temperatures = tip_temp + (base_temp - tip_temp) * np.exp(-positions / 0.05) + 273.15 + rng.normal(0, 0.05, points)
+    with open(file_path, 'w') as simulation_file:
+        simulation_file.write('Position [m]\tTemperature [K]\n')
+        simulation_file.write(''.join(f"{position:.6e}\t{temperature:.4f}\n" for position, temperature in zip(positions, temperatures)))
+        simulation_file.write('End of export\n')
+
+def write_experiment(folder, rows=480, cols=640, frames=0, sensor_seconds=3600, flir_rows=108000, simulation_points=2000, seed=0):
+    # A complete experiment folder with every file in config.REQUIRED_FILES
+    os.makedirs(folder, exist_ok=True)
+    write_heat_map(os.path.join(folder, 'Heat_Map_Final_Frame.csv'), heat_map_frame(rows, cols, seed))
+    if frames:
+        write_heat_map_sequence(os.path.join(folder, 'Heat_Map_Frames'), heat_map_sequence(frames, rows, cols, seed))
+    write_sensor_log(os.path.join(folder, 'sensors.txt'), sensor_seconds, seed)
+    for name, (column, log_seed, mean) in FLIR_LOGS.items():
+        write_flir_log(os.path.join(folder, name), column, flir_rows, seed=seed + log_seed, mean=mean)
+    write_simulation(os.path.join(folder, 'IRIS-ANSYS'), simulation_points, seed=seed)
+    return folder
+
+def simulate_live(folder, seconds, rate_hz=30, speedup=1.0):
+    # Appends one second of Arduino and FLIR lines at a time, like a running experiment
+    os.makedirs(folder, exist_ok=True)
+    logs = {'sensors.txt': SENSOR_HEADER}
+    logs.update({name: f"time\t{column}\n" for name, (column, _, _) in FLIR_LOGS.items()})
+    for name, header in logs.items():
+        with open(os.path.join(folder, name), 'w') as log_file:
+            log_file.write(header)
+
+    for second in range(seconds):
+        appended = {'sensors.txt': sensor_lines(second, 1)}
+        appended.update({name: flir_lines(second * rate_hz, rate_hz, rate_hz, seed, mean)
+                         for name, (_, seed, mean) in FLIR_LOGS.items()})
+        for name, lines in appended.items():
+            with open(os.path.join(folder, name), 'a') as log_file:
+                log_file.write(lines)
+        time.sleep(1.0 / speedup)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Write a synthetic experiment whose logs grow in real time, for trying Follow Live.')
+    parser.add_argument('folder', help='Experiment folder to create and append to')
+    parser.add_argument('--seconds', type=int, default=600, help='Seconds of data to write')
+    parser.add_argument('--speedup', type=float, default=1.0, help='Write faster than real time')
+    args = parser.parse_args()
+    simulate_live(args.folder, args.seconds, speedup=args.speedup)
@@ -0,0 +1,71 @@
+import numpy as np
+import engine
+import synthetic
+
+def sequence_experiment(tmp_path, final_shape, sequence_shape, frames=3):
+    experiment = engine.Experiment(str(tmp_path))
+    experiment.heat_map_data = synthetic.heat_map_frame(*final_shape).astype(np.float32)
+    experiment.heat_map_frames = np.stack(list(synthetic.heat_map_sequence(frames, *sequence_shape))).astype(np.float32)
+    experiment.analyze()
+    return experiment
+
+def test_frame_series_uses_final_frame_thermocouples(tmp_path):
+    experiment = sequence_experiment(tmp_path, (480, 640), (480, 640))
+    (cx, cy), (fx, fy) = experiment.c_tc_location, experiment.f_tc_location
+    series = experiment.thermocouple_frame_series()
+    np.testing.assert_array_equal(series['Chamfered_TC'], experiment.heat_map_frames[:, cy, cx])
+    np.testing.assert_array_equal(series['Filleted_TC'], experiment.heat_map_frames[:, fy, fx])
+
+def test_frame_series_with_different_sequence_resolution(tmp_path):
+    # Sequence exported at half the final frame's resolution: the final frame's pixels would be
+    # out of range, so the thermocouples are found again on the sequence
+    experiment = sequence_experiment(tmp_path, (480, 640), (240, 320))
+    expected = engine.find_thermocouples(*engine.plate_edge_detection(experiment.heat_map_frames[-1]))
+    assert experiment.sequence_thermocouples() == expected
+
+    series = experiment.thermocouple_frame_series()
+    (cx, cy), (fx, fy) = expected
+    assert len(series) == 3
+    np.testing.assert_array_equal(series['Chamfered_TC'], experiment.heat_map_frames[:, cy, cx])
+    np.testing.assert_array_equal(series['Filleted_TC'], experiment.heat_map_frames[:, fy, fx])
+    assert 'heat_map_sequence' in experiment.summary()
+
+def test_simulation_skips_text_lines(tmp_path):
+    # Text on a line with one or three fields used to fail the whole file instead of that line
+    simulation_file = tmp_path / 'simulation.txt'
+    simulation_file.write_text('Location [m]\tTemperature [K]\n'
+                               'Results\n'
+                               '0.0\t373.15\n'
+                               '0.5\t348.15\n'
+                               'Minimum\tnone\textra\n'
+                               '1.0\t323.15\n'
+                               'Exported by ANSYS\n')
+    simulation = engine.read_simulation(str(simulation_file))
+    np.testing.assert_allclose(simulation['Location'], [0.0, 0.5 * engine.config.FIN_HEIGHT, engine.config.FIN_HEIGHT])
+    np.testing.assert_allclose(simulation['Temperature'], [100.0, 75.0, 50.0])
+
+def test_simulation_comparison_after_eviction(tmp_path):
+    # Only the simulation is re-read after an eviction; the cached midline profile is scored
+    experiment = sequence_experiment(tmp_path, (480, 640), (480, 640))
+    y_positions_mm, _ = experiment.midline_profile()
+    simulation = engine.pd.DataFrame({'Location': y_positions_mm, 'Temperature': np.full(len(y_positions_mm), 50.0)})
+    experiment.simulation_data = simulation
+    expected = experiment.simulation_comparison()
+
+    experiment.evict_raw_data()
+    experiment.simulation_metrics = None
+    experiment.simulation_data = simulation
+    assert not experiment.has_heat_map()
+    assert experiment.simulation_comparison() == expected
+
+def test_alignment_without_every_sensor_column():
+    # An older logger without FlowRate, and one without the filleted thermocouple
+    times = engine.TIME_OF_DAY_EPOCH + engine.pd.to_timedelta(np.arange(5), unit='s')
+    sensors = engine.pd.DataFrame({'Absolute_Time': times, 'ChamferTemp_C': np.full(5, 60.0), 'FilletTemp_C': np.full(5, 55.0)})
+    flir = engine.pd.DataFrame({'time': times, 'Chamfered_Side_TC': np.full(5, 59.0)})
+    aligned = engine.align_sensors_flir(sensors, flir_chamfered=flir)
+    assert 'FlowRate_L_per_min' not in aligned
+    assert engine.alignment_error_stats(aligned)['chamfered']['mean_error_c'] == 1.0
+
+    stats = engine.alignment_error_stats(engine.align_sensors_flir(sensors.drop(columns='FilletTemp_C'), flir_chamfered=flir))
+    assert list(stats) == ['chamfered']
@@ -0,0 +1,145 @@
+# ========================== Imports & Config ==========================
+import os
+import json
+import itertools
+import threading
+import time
+from collections import deque
+import config
+
+# ========================== Spans ==========================
+class Span:
+    # Context manager timing one stage. Spans opened inside another on the same thread are
+    # nested under it and inherit its group, so worker threads can tag whole reads. Each span
+    # records the names of all its ancestors, so same-named spans under different parents stay apart.
+    __slots__ = ('timeline', 'name', 'category', 'group', 'args', 'path', 'depth', 'start')
+
+    def __init__(self, timeline, name, category, group, args):
+        self.timeline = timeline
+        self.name = name
+        self.category = category
+        self.group = group
+        self.args = args
+
+    def __enter__(self):
+        stack = self.timeline.stack()
+        if self.group is None and stack:
+            self.group = stack[-1].group
+        self.path = (stack[-1].path if stack else ()) + (self.name,)
+        self.depth = len(stack)
+        stack.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        self.timeline.stack().pop()
+        self.timeline.spans.append((self.name, self.category, self.group, threading.get_ident(),
+                                    self.path[:-1], self.depth, self.start, end - self.start, self.args))
+        return False
+
+class NullSpan:
+    # Shared stand-in while timing is off, so a disabled span costs one call and a flag check
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+NULL_SPAN = NullSpan()
+
+# ========================== Timeline ==========================
+class Timeline:
+    def __init__(self, enabled=None, max_spans=None):
+        self.enabled = config.TIMING_ENABLED if enabled is None else enabled
+        self.spans = deque(maxlen=max_spans or config.TIMING_MAX_SPANS)  # Appends are thread-safe
+        self.groups = {}  # group id -> label
+        self.group_ids = itertools.count(1)
+        self.local = threading.local()
+        self.origin = time.perf_counter_ns()
+
+    def stack(self):
+        try:
+            return self.local.stack
+        except AttributeError:
+            self.local.stack = []
+            return self.local.stack
+
+    def span(self, name, category='', group=None, args=None):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, category, group, args)
+
+    def new_group(self, label):
+        # Ties spans from several threads together, e.g. everything one experiment load did
+        if not self.enabled:
+            return None
+        group = next(self.group_ids)
+        self.groups[group] = label
+        return group
+
+    def current_group(self):
+        stack = self.stack() if self.enabled else ()
+        return stack[-1].group if stack else None
+
+    def clear(self):
+        self.spans.clear()
+        self.groups.clear()
+
+    # ========== Summaries ==========
+    def breakdown(self, group):
+        # (wall seconds, [(depth, name, count, total seconds)]) as a tree in order of first start.
+        # Nodes are keyed by their full ancestor path, so repeated spans at the same place, such
+        # as per-chunk parses, are summed while "cache load" under different readers is not.
+        spans = sorted((span for span in list(self.spans) if span[2] == group), key=lambda span: span[6])
+        if not spans:
+            return 0.0, []
+        stages = {}     # path -> [count, total ns]
+        children = {}   # parent path -> child paths in order of first start
+        for name, _, _, _, parent, _, _, duration, _ in spans:
+            path = parent + (name,)
+            if path not in stages:
+                stages[path] = [0, 0]
+                children.setdefault(parent, []).append(path)
+            stages[path][0] += 1
+            stages[path][1] += duration
+
+        # Spans whose parent belongs to another group (or none was recorded) are shown at the top
+        roots = [path for parent, paths in children.items() if parent not in stages for path in paths]
+        rows = []
+        def walk(paths, depth):
+            for path in paths:
+                count, total = stages[path]
+                rows.append((depth, path[-1], count, total / 1e9))
+                walk(children.get(path, ()), depth + 1)  # Paths only grow, so this ends
+        order = {path: index for index, path in enumerate(stages)}
+        walk(sorted(roots, key=order.get), 0)
+        wall = max(span[6] + span[7] for span in spans) - spans[0][6]
+        return wall / 1e9, rows
+
+    # ========== Export ==========
+    def chrome_trace(self):
+        # Complete ("X") events in microseconds; opens in chrome://tracing and Perfetto
+        pid = os.getpid()
+        events = []
+        for name, category, group, thread, _, _, start, duration, args in list(self.spans):
+            event_args = dict(args or {})
+            if group is not None:
+                event_args['group'] = self.groups.get(group, group)
+            events.append({'name': name, 'cat': category or 'iris', 'ph': 'X', 'pid': pid, 'tid': thread,
+                           'ts': (start - self.origin) / 1e3, 'dur': duration / 1e3, 'args': event_args})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms',
+                'otherData': {'groups': {str(group): label for group, label in self.groups.items()}}}
+
+    def export(self, file_path):
+        with open(file_path, 'w') as trace_file:
+            json.dump(self.chrome_trace(), trace_file)
+        return file_path
+
+# ========================== Module Timeline ==========================
+TIMELINE = Timeline()
+
+def span(name, category='', group=None, args=None):
+    if not TIMELINE.enabled:
+        return NULL_SPAN
+    return Span(TIMELINE, name, category, group, args)
@@ -0,0 +1,175 @@
+# ========================== Imports & Config ==========================
+import bisect
+import customtkinter as ctk
+
+# ========================== Virtual List ==========================
+class VirtualList(ctk.CTkFrame):
+    # Sorted, filterable, multi-select list of names that only ever creates widgets for the rows
+    # on screen; scrolling relabels those rows. Click selects, Ctrl+click toggles, Shift+click
+    # extends, double-click activates.
+    def __init__(self, master, rows=6, key=str.lower, on_activate=None, action_text=None, on_action=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.key = key
+        self.on_activate = on_activate  # Called with a list of names
+        self.on_action = on_action      # Called with one name from its row's action button
+
+        self.items = []     # Every name, sorted by key
+        self.keys = []      # key(name) for each entry of items, for bisect
+        self.visible = []   # Names passing the filter, in the same order
+        self.filter_text = ''
+        self.selected = set()
+        self.anchor = None  # Last clicked name, for Shift+click ranges
+        self.offset = 0
+
+        button_theme = ctk.ThemeManager.theme['CTkButton']
+        self.normal_color = button_theme['fg_color']
+        self.selected_color = button_theme['hover_color']
+
+        self.filter_entry = ctk.CTkEntry(self, placeholder_text='Type to filter')
+        self.filter_entry.pack(fill='x', padx=5, pady=(5, 2))
+        self.filter_entry.bind('<KeyRelease>', lambda event: self.set_filter(self.filter_entry.get()))
+
+        body = ctk.CTkFrame(self, fg_color='transparent')
+        body.pack(fill='both', expand=True)
+        self.scrollbar = ctk.CTkScrollbar(body, command=self.on_scrollbar)
+        self.scrollbar.pack(side='right', fill='y')
+        rows_frame = ctk.CTkFrame(body, fg_color='transparent')
+        rows_frame.pack(side='left', fill='both', expand=True)
+        rows_frame.grid_columnconfigure(0, weight=1)
+
+        self.rows = []
+        for index in range(rows):
+            button = ctk.CTkButton(rows_frame, text='', anchor='w', height=24)
+            button.grid(row=index, column=0, sticky='ew', padx=(5, 0), pady=1)
+            button.bind('<Button-1>', lambda event, row=index: self.on_click(row, event), add=True)
+            button.bind('<Double-Button-1>', lambda event, row=index: self.on_double_click(row), add=True)
+            action = None
+            if action_text is not None:
+                action = ctk.CTkButton(rows_frame, text=action_text, width=30, height=24,
+                                       command=lambda row=index: self.on_row_action(row))
+                action.grid(row=index, column=1, padx=5, pady=1)
+            self.rows.append((button, action))
+
+        for widget in [rows_frame] + [button for button, _ in self.rows]:
+            widget.bind('<MouseWheel>', self.on_wheel, add=True)
+            widget.bind('<Button-4>', self.on_wheel, add=True)
+            widget.bind('<Button-5>', self.on_wheel, add=True)
+        self.render()
+
+    # ========== Contents ==========
+    def set_items(self, items):
+        self.items = sorted(items, key=self.key)
+        self.keys = [self.key(item) for item in self.items]
+        self.selected &= set(self.items)
+        self.apply_filter()
+
+    def insert(self, item):
+        item_key = self.key(item)
+        index = bisect.bisect_right(self.keys, item_key)
+        self.items.insert(index, item)
+        self.keys.insert(index, item_key)
+        self.apply_filter()
+
+    def remove(self, items):
+        for item in items:
+            item_key = self.key(item)
+            index = bisect.bisect_left(self.keys, item_key)
+            while index < len(self.items) and self.keys[index] == item_key:
+                if self.items[index] == item:
+                    del self.items[index]
+                    del self.keys[index]
+                    break
+                index += 1
+            self.selected.discard(item)
+        self.apply_filter()
+
+    def __contains__(self, item):
+        return item in self.items
+
+    def get_selected(self):
+        return [item for item in self.items if item in self.selected]
+
+    # ========== Filtering ==========
+    def set_filter(self, text):
+        text = text.strip().lower()
+        if text == self.filter_text:
+            return
+        self.filter_text = text
+        self.offset = 0
+        self.apply_filter()
+
+    def apply_filter(self):
+        if self.filter_text:
+            self.visible = [item for item in self.items if self.filter_text in item.lower()]
+        else:
+            self.visible = self.items
+        self.render()
+
+    # ========== Rendering ==========
+    def render(self):
+        page = len(self.rows)
+        self.offset = max(0, min(self.offset, len(self.visible) - page))
+        for row, (button, action) in enumerate(self.rows):
+            index = self.offset + row
+            if index < len(self.visible):
+                item = self.visible[index]
+                button.configure(text=item, fg_color=self.selected_color if item in self.selected else self.normal_color)
+                button.grid()
+                if action is not None:
+                    action.grid()
+            else:
+                button.grid_remove()
+                if action is not None:
+                    action.grid_remove()
+
+        if self.visible:
+            self.scrollbar.set(self.offset / len(self.visible), min((self.offset + page) / len(self.visible), 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, offset):
+        self.offset = int(offset)
+        self.render()
+
+    def on_scrollbar(self, command, *args):
+        if command == 'moveto':
+            self.scroll_to(round(float(args[0]) * len(self.visible)))
+        elif command == 'scroll':
+            amount, unit = int(args[0]), args[1]
+            self.scroll_to(self.offset + amount * (len(self.rows) if unit == 'pages' else 1))
+
+    def on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.offset - 1)
+        else:
+            self.scroll_to(self.offset + 1)
+
+    # ========== Selection ==========
+    def row_item(self, row):
+        index = self.offset + row
+        return self.visible[index] if index < len(self.visible) else None
+
+    def on_click(self, row, event):
+        item = self.row_item(row)
+        if item is None:
+            return
+        if event.state & 0x0001 and self.anchor in self.visible:  # Shift
+            start, end = sorted((self.visible.index(self.anchor), self.visible.index(item)))
+            self.selected.update(self.visible[start:end + 1])
+        elif event.state & 0x0004:  # Control
+            self.selected.symmetric_difference_update({item})
+            self.anchor = item
+        else:
+            self.selected = {item}
+            self.anchor = item
+        self.render()
+
+    def on_double_click(self, row):
+        item = self.row_item(row)
+        if item is not None and self.on_activate is not None:
+            self.on_activate([item])
+
+    def on_row_action(self, row):
+        item = self.row_item(row)
+        if item is not None and self.on_action is not None:
+            self.on_action(item)